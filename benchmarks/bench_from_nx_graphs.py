@@ -0,0 +1,134 @@
+"""Compares GraphList.from_nx_graphs against the previous per-element conversion loop.
+
+Usage:
+    python benchmarks/bench_from_nx_graphs.py --num-graphs 10000
+"""
+import argparse
+import logging
+import time
+import networkx as nx
+import numpy as np
+from graphlist import GraphList
+
+
+def legacy_from_nx_graphs(
+    graphs,
+    node_attribute_names=[],
+    edge_attribute_names=[],
+    graph_attribute_names=[],
+):
+    """The conversion loop GraphList.from_nx_graphs used before the columnar rewrite."""
+    num_nodes = np.array([g.number_of_nodes() for g in graphs])
+    num_edges = np.array([g.number_of_edges() for g in graphs])
+    node_starts = np.roll(np.cumsum(num_nodes), 1)
+    node_starts[0] = 0
+    edge_starts = np.roll(np.cumsum(num_edges), 1)
+    edge_starts[0] = 0
+
+    node_attributes = dict()
+    edge_attributes = dict()
+    graph_attributes = dict()
+    edge_indices = np.zeros(shape=(num_edges.sum(), 2), dtype=int)
+
+    for node_attr in node_attribute_names:
+        if node_starts[-1] == 0:
+            logging.warn("No nodes in all graphs.")
+            break
+        peek = np.array(next(
+            iter(graphs[np.argwhere(num_nodes > 0)[0, 0]].nodes(data=node_attr)))[1])
+        shape = (num_nodes.sum(),) + peek.shape
+        node_attributes[node_attr] = np.zeros(shape=shape, dtype=peek.dtype)
+
+    for edge_attr in edge_attribute_names:
+        if edge_starts[-1] == 0:
+            logging.warn("No edges in all graphs.")
+            break
+        peek = np.array(next(
+            iter(graphs[np.argwhere(num_edges > 0)[0, 0]].edges(data=edge_attr)))[2])
+        shape = (num_edges.sum(),) + peek.shape
+        edge_attributes[edge_attr] = np.zeros(shape=shape, dtype=peek.dtype)
+
+    for graph_attr in graph_attribute_names:
+        peek = np.array(getattr(graphs[0], graph_attr))
+        shape = (num_nodes.shape[0],) + peek.shape
+        graph_attributes[graph_attr] = np.zeros(shape=shape, dtype=peek.dtype)
+
+    i_n = 0
+    i_e = 0
+    i_g = 0
+    for g in graphs:
+        node_numbers = {n: i for i, n in enumerate(g.nodes)}
+        for node in g.nodes(data=True):
+            for node_attr in node_attribute_names:
+                node_attributes[node_attr][i_n] = np.array(node[1][node_attr])
+            i_n += 1
+        for edge in g.edges(data=True):
+            for edge_attr in edge_attribute_names:
+                edge_attributes[edge_attr][i_e] = np.array(edge[2][edge_attr])
+            edge_indices[i_e] = np.array(
+                [node_numbers[edge[0]], node_numbers[edge[1]]], dtype=int
+            )
+            i_e += 1
+        for graph_attr in graph_attribute_names:
+            graph_attributes[graph_attr][i_g] = np.array(getattr(g, graph_attr))
+        i_g += 1
+
+    return GraphList(num_nodes, num_edges, edge_indices, node_attributes, edge_attributes, graph_attributes)
+
+
+def random_molecule_like_graphs(num_graphs, max_nodes=30, seed=0):
+    """Generates small sparse networkx graphs with node, edge and graph attributes."""
+    rng = np.random.default_rng(seed)
+    graphs = []
+    for _ in range(num_graphs):
+        n = int(rng.integers(1, max_nodes))
+        graph = nx.MultiDiGraph()
+        for i in range(n):
+            graph.add_node(i, position=rng.random(3), element=int(rng.integers(10)))
+        for i in range(1, n):
+            j = int(rng.integers(i))
+            graph.add_edge(i, j, length=float(rng.random()))
+            graph.add_edge(j, i, length=float(rng.random()))
+        setattr(graph, "energy", float(rng.random()))
+        graphs.append(graph)
+    return graphs
+
+
+def assert_identical(first, second):
+    assert np.array_equal(first.num_nodes, second.num_nodes)
+    assert np.array_equal(first.num_edges, second.num_edges)
+    assert np.array_equal(first.edge_indices, second.edge_indices)
+    for attributes in ["node_attributes", "edge_attributes", "graph_attributes"]:
+        for k, v in getattr(first, attributes).items():
+            w = getattr(second, attributes)[k]
+            assert v.dtype == w.dtype and np.array_equal(v, w), k
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-graphs", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    graphs = random_molecule_like_graphs(args.num_graphs)
+    kwargs = dict(
+        node_attribute_names=["position", "element"],
+        edge_attribute_names=["length"],
+        graph_attribute_names=["energy"],
+    )
+    assert_identical(GraphList.from_nx_graphs(graphs, **kwargs), legacy_from_nx_graphs(graphs, **kwargs))
+
+    timings = {}
+    for name, function in [("legacy", legacy_from_nx_graphs), ("columnar", GraphList.from_nx_graphs)]:
+        best = float("inf")
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            function(graphs, **kwargs)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        print(f"{name:>10}: {best:.3f}s ({args.num_graphs / best:,.0f} graphs/s)")
+    print(f"   speedup: {timings['legacy'] / timings['columnar']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
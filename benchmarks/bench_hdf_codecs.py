@@ -0,0 +1,77 @@
+"""Reports write throughput, read throughput and compression ratio of HDF storage options per dataset.
+
+Usage:
+    python benchmarks/bench_hdf_codecs.py --num-graphs 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+import h5py
+from graphlist import HDFGraphList
+from generators import random_graphlist
+
+CODECS = {
+    "none": {},
+    "gzip-1": {"compression": "gzip", "compression_opts": 1},
+    "gzip-4+shuffle": {"compression": "gzip", "compression_opts": 4, "shuffle": True},
+    "lzf": {"compression": "lzf"},
+    "lzf+shuffle": {"compression": "lzf", "shuffle": True},
+    "scaleoffset+gzip": {"scaleoffset": 0, "compression": "gzip", "compression_opts": 1},
+}
+
+
+def datasets(file):
+    names = ["num_nodes", "num_edges", "edge_indices"]
+    for group in ["node_attributes", "edge_attributes", "graph_attributes"]:
+        names += [f"{group}/{name}" for name in file[group].keys()]
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-graphs", type=int, default=100000)
+    args = parser.parse_args()
+
+    graphs = random_graphlist(args.num_graphs)
+    print(f"{'codec':>18} {'dataset':>28} {'ratio':>7} {'write MB/s':>11} {'read MB/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for codec, options in CODECS.items():
+            path = os.path.join(tmp_dir, f"{codec}.h5")
+            with h5py.File(path, "w") as f:
+                start = time.perf_counter()
+                if codec == "scaleoffset+gzip":
+                    # The scale-offset filter is lossless for integers only.
+                    storage_options = {name: options for name in ["num_nodes", "num_edges", "edge_indices"]}
+                    storage_options.update({
+                        "node_attributes/element": options,
+                        "edge_attributes/bond_type": options,
+                        "graph_attributes/label": options,
+                    })
+                else:
+                    storage_options = {"default": options}
+                HDFGraphList.from_graphlist(f, graphs, storage_options=storage_options)
+                write_time = time.perf_counter() - start
+            with h5py.File(path, "r") as f:
+                raw_total, stored_total, read_time = 0, 0, 0
+                for name in datasets(f):
+                    dataset = f[name]
+                    start = time.perf_counter()
+                    data = dataset[:]
+                    elapsed = time.perf_counter() - start
+                    stored = dataset.id.get_storage_size()
+                    raw_total += data.nbytes
+                    stored_total += stored
+                    read_time += elapsed
+                    print(
+                        f"{codec:>18} {name:>28} {data.nbytes / max(stored, 1):7.2f} {'':>11} "
+                        f"{data.nbytes / 2**20 / elapsed:10.0f}"
+                    )
+            print(
+                f"{codec:>18} {'total':>28} {raw_total / stored_total:7.2f} "
+                f"{raw_total / 2**20 / write_time:11.0f} {raw_total / 2**20 / read_time:10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
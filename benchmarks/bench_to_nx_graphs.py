@@ -0,0 +1,122 @@
+"""Compares GraphList.to_nx_graphs against the previous per-graph conversion loop.
+
+Usage:
+    python benchmarks/bench_to_nx_graphs.py --num-graphs 10000
+"""
+import argparse
+import time
+import networkx as nx
+import numpy as np
+from graphlist import GraphList
+from bench_from_nx_graphs import random_molecule_like_graphs
+
+
+def legacy_starts(counts):
+    """node_starts/edge_starts as the previous uncached property computed them on every access."""
+    starts = np.roll(np.cumsum(counts), 1)
+    starts[0] = 0
+    return starts
+
+
+def legacy_get_subslice(graphs, indices):
+    """The per-graph copy loop, with which the previous GraphList indexed every graph."""
+    num_graphs = len(indices)
+    num_nodes = graphs.num_nodes[indices]
+    num_edges = graphs.num_edges[indices]
+    node_starts = legacy_starts(num_nodes)
+    edge_starts = legacy_starts(num_edges)
+    edge_indices = np.zeros(shape=(num_edges.sum(), 2), dtype=int)
+    node_attributes = {
+        k: np.zeros((num_nodes.sum(),) + v.shape[1:], dtype=v.dtype) for k, v in graphs.node_attributes.items()
+    }
+    edge_attributes = {
+        k: np.zeros((num_edges.sum(),) + v.shape[1:], dtype=v.dtype) for k, v in graphs.edge_attributes.items()
+    }
+    graph_attributes = {
+        k: np.zeros((num_graphs,) + v.shape[1:], dtype=v.dtype) for k, v in graphs.graph_attributes.items()
+    }
+    for i in range(num_graphs):
+        for k, v in node_attributes.items():
+            start = legacy_starts(graphs.num_nodes)[indices[i]]
+            v[node_starts[i] : node_starts[i] + num_nodes[i]] = graphs.node_attributes[k][
+                start : legacy_starts(graphs.num_nodes)[indices[i]] + graphs.num_nodes[indices[i]]
+            ]
+        for k, v in edge_attributes.items():
+            start = legacy_starts(graphs.num_edges)[indices[i]]
+            v[edge_starts[i] : edge_starts[i] + num_edges[i]] = graphs.edge_attributes[k][
+                start : legacy_starts(graphs.num_edges)[indices[i]] + graphs.num_edges[indices[i]]
+            ]
+        for k, v in graph_attributes.items():
+            v[i] = graphs.graph_attributes[k][indices[i]]
+        start = legacy_starts(graphs.num_edges)[indices[i]]
+        edge_indices[edge_starts[i] : edge_starts[i] + num_edges[i]] = graphs.edge_indices[
+            start : legacy_starts(graphs.num_edges)[indices[i]] + graphs.num_edges[indices[i]]
+        ]
+    return GraphList(num_nodes, num_edges, edge_indices, node_attributes, edge_attributes, graph_attributes)
+
+
+def legacy_to_nx_graphs(graphs):
+    """The conversion loop GraphList.to_nx_graphs used before iterating over views, including the
+    copying per-graph indexing it iterated with.
+    """
+    nx_graphs = []
+    for graph_idx in range(len(graphs)):
+        g = legacy_get_subslice(graphs, [graph_idx])
+        nx_graph = nx.MultiDiGraph()
+        nodes = []
+        node_attributes = g.node_attributes.keys()
+        for i in range(g.num_nodes[0]):
+            attr = {node_attribute: g.node_attributes[node_attribute][i] for node_attribute in node_attributes}
+            nodes.append((i, attr))
+        nx_graph.add_nodes_from(nodes)
+        edges = []
+        edge_attributes = g.edge_attributes.keys()
+        for i in range(g.num_edges[0]):
+            attr = {edge_attribute: g.edge_attributes[edge_attribute][i] for edge_attribute in edge_attributes}
+            edges.append((g.edge_indices[i][0], g.edge_indices[i][1], attr))
+        nx_graph.add_edges_from(edges)
+        for graph_attribute, v in g.graph_attributes.items():
+            setattr(nx_graph, graph_attribute, v[0])
+        nx_graphs.append(nx_graph)
+    return nx_graphs
+
+
+def assert_identical(first, second):
+    assert len(first) == len(second)
+    for g, h in zip(first, second):
+        assert list(g.nodes) == list(h.nodes)
+        assert list(g.edges) == list(h.edges)
+        for (_, a), (_, b) in zip(g.nodes(data=True), h.nodes(data=True)):
+            assert all(np.array_equal(a[k], b[k]) for k in a)
+        for (_, _, a), (_, _, b) in zip(g.edges(data=True), h.edges(data=True)):
+            assert all(np.array_equal(a[k], b[k]) for k in a)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-graphs", type=int, default=10000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    graphs = GraphList.from_nx_graphs(
+        random_molecule_like_graphs(args.num_graphs),
+        node_attribute_names=["position", "element"],
+        edge_attribute_names=["length"],
+        graph_attribute_names=["energy"],
+    )
+    assert_identical(graphs.to_nx_graphs(), legacy_to_nx_graphs(graphs))
+
+    timings = {}
+    for name, function in [("legacy", legacy_to_nx_graphs), ("views", GraphList.to_nx_graphs)]:
+        best = float("inf")
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            function(graphs)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        print(f"{name:>10}: {best:.3f}s ({args.num_graphs / best:,.0f} graphs/s)")
+    print(f"   speedup: {timings['legacy'] / timings['views']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
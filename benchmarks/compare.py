@@ -0,0 +1,48 @@
+"""Compares two result files of suite.py and reports the change of throughput per benchmark.
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json --threshold 0.1
+Exits with status 1 if any benchmark got slower by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        report = json.load(f)
+    return {(r["benchmark"], r["num_graphs"]): r for r in report["results"]}, report.get("commit")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative slowdown reported as regression.")
+    args = parser.parse_args()
+
+    baseline, baseline_commit = load(args.baseline)
+    candidate, candidate_commit = load(args.candidate)
+    print(f"baseline: {baseline_commit}\ncandidate: {candidate_commit}")
+    print(f"{'benchmark':>20} {'graphs':>10} {'baseline/s':>14} {'candidate/s':>14} {'speedup':>8} {'peak RSS':>9}")
+    regressions = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[key], candidate[key]
+        speedup = after["items_per_second"] / before["items_per_second"]
+        rss = after["peak_rss_mb"] / before["peak_rss_mb"]
+        flag = ""
+        if speedup < 1 - args.threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key[0]:>20} {key[1]:>10} {before['items_per_second']:14,.0f} "
+            f"{after['items_per_second']:14,.0f} {speedup:7.2f}x {rss:8.2f}x{flag}"
+        )
+    for key in sorted(baseline.keys() ^ candidate.keys()):
+        print(f"{key[0]:>20} {key[1]:>10} only in {'baseline' if key in baseline else 'candidate'}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
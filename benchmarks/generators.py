@@ -0,0 +1,60 @@
+"""Vectorized generators of synthetic graph datasets for the benchmarks.
+
+The GraphList generator builds all arrays with numpy at once and scales to millions of graphs;
+networkx graphs are converted from it, so both describe the same dataset for a given seed.
+"""
+import numpy as np
+from graphlist import GraphList
+
+
+def random_graphlist(
+    num_graphs: int,
+    min_nodes: int = 5,
+    max_nodes: int = 40,
+    edges_per_node: int = 2,
+    num_features: int = 16,
+    seed: int = 0,
+) -> GraphList:
+    """Generates molecule-like graphs: float32 node features and small integer labels.
+    Args:
+        num_graphs (int): Number of graphs.
+        min_nodes (int, optional): Minimum number of nodes per graph. Defaults to 5.
+        max_nodes (int, optional): Maximum number of nodes per graph (exclusive). Defaults to 40.
+        edges_per_node (int, optional): Number of edges per node. Defaults to 2.
+        num_features (int, optional): Size of the node feature vectors. Defaults to 16.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+    Returns:
+        GraphList: The graphs.
+    """
+    rng = np.random.default_rng(seed)
+    num_nodes = rng.integers(min_nodes, max_nodes, num_graphs)
+    num_edges = edges_per_node * num_nodes
+    graph_of_edge = np.repeat(np.arange(num_graphs), num_edges)
+    edge_indices = (rng.random((num_edges.sum(), 2)) * num_nodes[graph_of_edge, None]).astype(np.int64)
+    total_nodes = num_nodes.sum()
+    return GraphList(
+        num_nodes,
+        num_edges,
+        edge_indices,
+        {
+            "features": np.round(rng.normal(size=(total_nodes, num_features)), 2).astype(np.float32),
+            "element": rng.integers(0, 10, total_nodes).astype(np.int64),
+        },
+        {"bond_type": rng.integers(0, 4, num_edges.sum()).astype(np.int64)},
+        {"label": rng.integers(0, 3, num_graphs).astype(np.int64)},
+    )
+
+
+def random_nx_graphs(num_graphs: int, seed: int = 0, **kwargs) -> list:
+    """Generates the graphs of `random_graphlist` as networkx MultiDiGraphs.
+    Returns:
+        List[MultiDiGraph]: The graphs.
+    """
+    return random_graphlist(num_graphs, seed=seed, **kwargs).to_nx_graphs()
+
+
+ATTRIBUTE_NAMES = dict(
+    node_attribute_names=["features", "element"],
+    edge_attribute_names=["bond_type"],
+    graph_attribute_names=["label"],
+)
@@ -0,0 +1,200 @@
+"""Runs the benchmark suite on synthetic datasets and writes the results to a JSON file.
+
+Every benchmark runs in a fresh process, so that the reported peak RSS belongs to that
+benchmark and its dataset only. Results of two runs are compared with compare.py.
+
+Usage:
+    python benchmarks/suite.py --sizes 1000 100000 10000000 --output results.json
+    python benchmarks/suite.py --benchmarks getitem_int hdf_read_shuffled --sizes 1000000
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+import h5py
+import numpy as np
+from graphlist import GraphList, HDFGraphList
+from generators import ATTRIBUTE_NAMES, random_graphlist, random_nx_graphs
+
+RESULTS_VERSION = 1
+# Number of graphs read per batch by the indexing and HDF read benchmarks.
+BATCH_GRAPHS = 256
+# Number of int, list and slice lookups, independent of the dataset size.
+NUM_LOOKUPS = 2000
+
+
+def bench_from_nx_graphs(num_graphs, rng, tmp_dir):
+    nx_graphs = random_nx_graphs(num_graphs)
+    start = time.perf_counter()
+    GraphList.from_nx_graphs(nx_graphs, **ATTRIBUTE_NAMES)
+    return time.perf_counter() - start, num_graphs
+
+
+def bench_to_nx_graphs(num_graphs, rng, tmp_dir):
+    graphs = random_graphlist(num_graphs)
+    start = time.perf_counter()
+    graphs.to_nx_graphs()
+    return time.perf_counter() - start, num_graphs
+
+
+def bench_getitem_int(num_graphs, rng, tmp_dir):
+    graphs = random_graphlist(num_graphs)
+    indices = rng.integers(0, num_graphs, NUM_LOOKUPS).tolist()
+    start = time.perf_counter()
+    for index in indices:
+        graphs[index]
+    return time.perf_counter() - start, NUM_LOOKUPS
+
+
+def bench_getitem_list(num_graphs, rng, tmp_dir):
+    graphs = random_graphlist(num_graphs)
+    batches = [rng.integers(0, num_graphs, BATCH_GRAPHS).tolist() for _ in range(NUM_LOOKUPS)]
+    start = time.perf_counter()
+    for batch in batches:
+        graphs[batch]
+    return time.perf_counter() - start, NUM_LOOKUPS * BATCH_GRAPHS
+
+
+def bench_getitem_slice(num_graphs, rng, tmp_dir):
+    graphs = random_graphlist(num_graphs)
+    starts = rng.integers(0, max(num_graphs - BATCH_GRAPHS, 1), NUM_LOOKUPS).tolist()
+    start = time.perf_counter()
+    for batch_start in starts:
+        graphs[batch_start : batch_start + BATCH_GRAPHS]
+    return time.perf_counter() - start, NUM_LOOKUPS * min(BATCH_GRAPHS, num_graphs)
+
+
+def _write_hdf(num_graphs, tmp_dir):
+    path = os.path.join(tmp_dir, "graphs.h5")
+    with h5py.File(path, "w") as f:
+        HDFGraphList.from_graphlist(f, random_graphlist(num_graphs))
+    return path
+
+
+def bench_hdf_write(num_graphs, rng, tmp_dir):
+    graphs = random_graphlist(num_graphs)
+    start = time.perf_counter()
+    with h5py.File(os.path.join(tmp_dir, "graphs.h5"), "w") as f:
+        HDFGraphList.from_graphlist(f, graphs)
+    return time.perf_counter() - start, num_graphs
+
+
+def bench_hdf_read_sequential(num_graphs, rng, tmp_dir):
+    path = _write_hdf(num_graphs, tmp_dir)
+    start = time.perf_counter()
+    with h5py.File(path, "r") as f:
+        graphs = HDFGraphList(f)
+        for batch_start in range(0, num_graphs, 16 * BATCH_GRAPHS):
+            graphs[batch_start : batch_start + 16 * BATCH_GRAPHS]
+    return time.perf_counter() - start, num_graphs
+
+
+def bench_hdf_read_shuffled(num_graphs, rng, tmp_dir):
+    path = _write_hdf(num_graphs, tmp_dir)
+    num_batches = max(min(num_graphs, 100 * BATCH_GRAPHS) // BATCH_GRAPHS, 1)
+    permutation = rng.permutation(num_graphs)
+    batches = [permutation[i * BATCH_GRAPHS : (i + 1) * BATCH_GRAPHS] for i in range(num_batches)]
+    start = time.perf_counter()
+    with h5py.File(path, "r") as f:
+        graphs = HDFGraphList(f)
+        for batch in batches:
+            graphs[batch]
+    return time.perf_counter() - start, sum(len(batch) for batch in batches)
+
+
+# Benchmarks and the largest dataset they run on, networkx graphs do not fit into memory beyond.
+BENCHMARKS = {
+    "from_nx_graphs": (bench_from_nx_graphs, 1000000),
+    "to_nx_graphs": (bench_to_nx_graphs, 1000000),
+    "getitem_int": (bench_getitem_int, None),
+    "getitem_list": (bench_getitem_list, None),
+    "getitem_slice": (bench_getitem_slice, None),
+    "hdf_write": (bench_hdf_write, None),
+    "hdf_read_sequential": (bench_hdf_read_sequential, None),
+    "hdf_read_shuffled": (bench_hdf_read_shuffled, None),
+}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def run_benchmark(name: str, num_graphs: int, repeats: int, seed: int) -> dict:
+    """Runs one benchmark repeats times and returns the best time. Called in a fresh process."""
+    function, _ = BENCHMARKS[name]
+    best, items = float("inf"), 0
+    for repeat in range(repeats):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            seconds, items = function(num_graphs, np.random.default_rng(seed + repeat), tmp_dir)
+        best = min(best, seconds)
+    return {
+        "benchmark": name,
+        "num_graphs": num_graphs,
+        "seconds": best,
+        "items": items,
+        "items_per_second": items / best if best > 0 else float("inf"),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for num_graphs in args.sizes:
+        for name in args.benchmarks:
+            max_graphs = BENCHMARKS[name][1]
+            if max_graphs is not None and num_graphs > max_graphs:
+                print(f"{name:>20} {num_graphs:>10}: skipped, limited to {max_graphs} graphs")
+                continue
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_benchmark, name, num_graphs, args.repeats, args.seed).result()
+            results.append(result)
+            print(
+                f"{name:>20} {num_graphs:>10}: {result['seconds']:9.4f}s "
+                f"{result['items_per_second']:14,.0f} items/s {result['peak_rss_mb']:9.1f} MiB peak RSS"
+            )
+
+    report = {
+        "version": RESULTS_VERSION,
+        "commit": _commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "h5py": h5py.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -71,6 +71,10 @@ graphs[2]
 graphs[:2]
 graphs[-2:]
 
+# Integer indices and contiguous slices return views which share memory with `graphs`.
+# Use copy() if you need a GraphList which owns its data:
+graphs[1:3].copy()
+
 # Get the data with
 graphs[-2:].graph_attributes['global_attr']
 # array([False,  True])
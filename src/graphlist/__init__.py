@@ -1,2 +1,28 @@
-from .graphlist import GraphList
-from .graphlist_hdf import HDFGraphList
+import importlib
+from .graphlist import GraphList, GraphBatch, CSRIndex, GraphView
+from .ingest import read_table, stream_graphlists
+from .graphlist_mmap import MMapGraphList
+from .loader import GraphLoader
+from .query import GraphSubset
+from . import instrumentation
+
+# Classes of modules with optional or slow imports (h5py, multiprocessing), imported on first access.
+_LAZY_IMPORTS = {
+    "HDFGraphList": "graphlist_hdf",
+    "HDFGraphListWriter": "hdf_writer",
+    "ShardedGraphList": "graphlist_sharded",
+    "SharedGraphList": "graphlist_shared",
+    "SharedMemoryHandle": "graphlist_shared",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -0,0 +1,94 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from . import instrumentation
+
+
+class BlockCache:
+    """A memory-bounded LRU cache of row blocks of HDF datasets.
+
+    Datasets are split into blocks of `block_rows` rows. Reads are served from cached blocks,
+    missing blocks are read from the dataset as a whole and cached. If the cached blocks
+    exceed `max_bytes`, the least recently used blocks are evicted.
+    The cache is thread-safe.
+    """
+
+    def __init__(self, max_bytes: int, block_rows: int = 4096):
+        """Initializes BlockCache.
+        Args:
+            max_bytes (int): Maximum number of bytes of all cached blocks.
+            block_rows (int, optional): Number of rows per block. Defaults to 4096.
+        """
+        self.max_bytes = max_bytes
+        self.block_rows = block_rows
+        self.blocks = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def _get_block(self, dataset, block: int) -> np.ndarray:
+        key = (dataset.name, block)
+        with self.lock:
+            data = self.blocks.get(key)
+            if data is not None:
+                self.blocks.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+        data = dataset[block * self.block_rows : (block + 1) * self.block_rows]
+        if instrumentation.ENABLED:
+            instrumentation.record_read(dataset, data)
+        if data.nbytes > self.max_bytes:
+            return data
+        with self.lock:
+            if key not in self.blocks:
+                self.blocks[key] = data
+                self.nbytes += data.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self.blocks.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+        return data
+
+    def read(self, dataset, start: int, stop: int) -> np.ndarray:
+        """Reads the rows [start, stop) of a dataset.
+        Args:
+            dataset (h5py.Dataset): The dataset to read from.
+            start (int): First row.
+            stop (int): Last row (exclusive).
+        Returns:
+            np.ndarray: The rows, which do not share memory with the cache.
+        """
+        if stop <= start:
+            return np.empty((0,) + dataset.shape[1:], dtype=dataset.dtype)
+        first_block, last_block = start // self.block_rows, (stop - 1) // self.block_rows
+        parts = []
+        for block in range(first_block, last_block + 1):
+            offset = block * self.block_rows
+            data = self._get_block(dataset, block)
+            parts.append(data[max(start - offset, 0) : stop - offset])
+        if len(parts) == 1:
+            return parts[0].copy()
+        return np.concatenate(parts)
+
+    def clear(self):
+        """Removes all blocks from the cache."""
+        with self.lock:
+            self.blocks.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict:
+        """Returns the cache counters.
+        Returns:
+            dict: Number of hits, misses, evictions, cached blocks and cached bytes.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "blocks": len(self.blocks),
+                "bytes": self.nbytes,
+            }
@@ -1,9 +1,330 @@
 import numpy as np
-from typing import List
-from functools import cached_property
-from networkx import MultiDiGraph
+from collections import deque
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+from functools import cached_property, partial
 from typing import Dict
 import logging
+from .instrumentation import instrumented
+from .loader import GraphLoader
+from .query import Columns, GraphSubset, SortedIndex, _column_mask, _index_lookup
+
+if TYPE_CHECKING:
+    # networkx is imported on first use, it is only needed to convert from and to networkx graphs.
+    from networkx import MultiDiGraph
+
+
+def _normalize_indices(indices, num_graphs: int) -> np.ndarray:
+    """Maps negative graph indices to positive ones and checks that all indices are in range."""
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+    indices = np.where(indices < 0, indices + num_graphs, indices)
+    if np.any((indices < 0) | (indices >= num_graphs)):
+        raise IndexError(f"Indices out of range for {num_graphs} graphs.")
+    return indices
+
+
+def _segment_rows(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Returns the concatenated row indices of the segments [start, start + count).
+
+    Args:
+        starts (np.ndarray): First row of each segment.
+        counts (np.ndarray): Number of rows of each segment.
+    Returns:
+        np.ndarray: Row indices of all segments in order. Shape: (counts.sum(),)
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(counts.sum(), dtype=np.int64)
+
+
+def _exclusive_cumsum(counts: np.ndarray) -> np.ndarray:
+    """Returns the int64 start offsets of consecutive segments with the given counts."""
+    starts = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], dtype=np.int64, out=starts[1:])
+    return starts
+
+
+def _ragged(values, name: str, trailing_shape: tuple = None):
+    """Concatenates a list with one array per graph. Returns the flat array and the number of
+    rows per graph, or the array itself and None if values are already flat.
+    """
+    if isinstance(values, (list, tuple)):
+        arrays = [np.asarray(v) for v in values]
+        counts = np.array([len(a) for a in arrays], dtype=np.int64)
+        reference = next((a for a in arrays if len(a) > 0), None)
+        if reference is None:
+            return np.zeros((0,) + (trailing_shape or ()), dtype=np.int64), counts
+        # Empty entries, e.g. [] for a graph without edges, take the trailing shape and dtype of the others.
+        empty = (0,) + reference.shape[1:]
+        arrays = [a if len(a) > 0 else a.reshape(empty).astype(reference.dtype) for a in arrays]
+        try:
+            return np.concatenate(arrays), counts
+        except ValueError as e:
+            raise ValueError(f"Cannot concatenate the arrays of {name}: {e}")
+    return np.asarray(values), None
+
+
+def _min_uint_dtype(values: np.ndarray) -> np.dtype:
+    """Returns the smallest unsigned integer dtype which can hold all (non-negative) values."""
+    max_value = int(values.max()) if values.size > 0 else 0
+    for dtype in [np.uint8, np.uint16, np.uint32]:
+        if max_value <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _fits(data: np.ndarray, dtype: np.dtype) -> bool:
+    """Returns whether all values of data can be represented by the integer dtype."""
+    data = np.asarray(data)
+    if data.size == 0:
+        return True
+    info = np.iinfo(dtype)
+    return int(data.min()) >= info.min and int(data.max()) <= info.max
+
+
+def _chunks(iterable: Iterable, chunk_size: int) -> Iterator[list]:
+    """Splits an iterable into lists of at most chunk_size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def _imap_ordered(function: Callable, iterable: Iterable, num_workers: int) -> Iterator:
+    """Applies function to all items in a process pool and yields the results in order.
+    At most 2 * num_workers items are in flight, so the iterable is consumed lazily.
+    """
+    # multiprocessing is only imported when a pool is needed, it adds to the import time of the package.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(num_workers) as executor:
+        pending = deque()
+        for item in iterable:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= 2 * num_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _add_missing_attributes(graphlists: list) -> list:
+    """Adds empty arrays for attributes which `from_nx_graphs` omits in chunks without nodes or edges,
+    so that the chunks can be concatenated. GraphLists with missing attributes are replaced by
+    shallow copies, the inputs are not modified.
+    """
+    graphlists = list(graphlists)
+    for attributes, count in [("node_attributes", "num_nodes"), ("edge_attributes", "num_edges")]:
+        reference = next((g for g in graphlists if np.sum(getattr(g, count)) > 0), None)
+        if reference is None:
+            continue
+        for i, graphlist in enumerate(graphlists):
+            if len(getattr(graphlist, attributes)) == 0 and len(getattr(reference, attributes)) > 0:
+                arrays = {
+                    "node_attributes": graphlist.node_attributes,
+                    "edge_attributes": graphlist.edge_attributes,
+                    "graph_attributes": graphlist.graph_attributes,
+                }
+                arrays[attributes] = {
+                    k: np.empty((0,) + v.shape[1:], dtype=v.dtype)
+                    for k, v in getattr(reference, attributes).items()
+                }
+                graphlists[i] = GraphList(graphlist.num_nodes, graphlist.num_edges, graphlist.edge_indices, **arrays)
+    return graphlists
+
+
+def _stack_column(values: list, peek: np.ndarray) -> np.ndarray:
+    """Materializes a list of attribute values as array of shape (len(values),) + peek.shape.
+    The values are converted to the dtype of the first value.
+    """
+    return np.array(values, dtype=peek.dtype).reshape((len(values),) + peek.shape)
+
+
+def _edge_list(graph: "MultiDiGraph") -> list:
+    """Returns the (src, dest, data) tuples of all edges in the order of graph.edges(data=True)."""
+    return list(graph.edges(data=True))
+
+
+def _nx_graph(num_nodes: int, sources: list, targets: list, node_data: list, edge_data: list) -> "MultiDiGraph":
+    """Builds a MultiDiGraph with nodes 0..num_nodes-1 and the given edges with the bulk
+    add_nodes_from and add_edges_from, which number the keys of parallel edges like add_edge.
+    """
+    from networkx import MultiDiGraph
+
+    graph = MultiDiGraph()
+    graph.add_nodes_from(zip(range(num_nodes), node_data))
+    graph.add_edges_from(zip(sources, targets, edge_data))
+    return graph
+
+
+def _label_array(labels: list) -> np.ndarray:
+    """Converts node labels to an array. Labels which numpy cannot stack into a regular array,
+    e.g. tuples of different lengths, become a 1-dimensional object array.
+    """
+    try:
+        return np.array(labels)
+    except ValueError:
+        array = np.empty(len(labels), dtype=object)
+        array[:] = labels
+        return array
+
+
+def _local_edge_indices(graphs, nodes, edges, num_nodes, num_edges, node_starts) -> np.ndarray:
+    """Maps the endpoints of all edges to the position of the node within its graph.
+
+    If all node labels are integers, the lookup is done for all graphs at once by
+    sorting (graph, node label) keys and searching the edge endpoints within them.
+    Otherwise the labels are mapped with a dictionary per graph.
+    Returns:
+        np.ndarray: Edge indices. Shape: (num_edges.sum(), 2)
+    """
+    edge_indices = np.zeros(shape=(len(edges), 2), dtype=int)
+    if len(edges) == 0:
+        return edge_indices
+
+    node_labels = _label_array([node[0] for node in nodes])
+    endpoint_labels = [_label_array([edge[i] for edge in edges]) for i in range(2)]
+    if all(labels.ndim == 1 and labels.dtype.kind in "iu" for labels in [node_labels] + endpoint_labels):
+        lowest = int(node_labels.min())
+        span = int(node_labels.max()) - lowest + 1
+        if span * len(graphs) < np.iinfo(np.int64).max:
+            node_graphs = np.repeat(np.arange(len(graphs)), num_nodes)
+            edge_graphs = np.repeat(np.arange(len(graphs)), num_edges)
+            node_keys = node_graphs * span + (node_labels.astype(np.int64) - lowest)
+            order = np.argsort(node_keys, kind="stable")
+            sorted_keys = node_keys[order]
+            for i in range(2):
+                endpoint_keys = edge_graphs * span + (endpoint_labels[i].astype(np.int64) - lowest)
+                positions = order[np.searchsorted(sorted_keys, endpoint_keys)]
+                edge_indices[:, i] = positions - node_starts[edge_graphs]
+            return edge_indices
+
+    i_e = 0
+    for g in graphs:
+        node_numbers = {n: i for i, n in enumerate(g.nodes)}
+        for src, dest in g.edges():
+            edge_indices[i_e, 0] = node_numbers[src]
+            edge_indices[i_e, 1] = node_numbers[dest]
+            i_e += 1
+    return edge_indices
+
+
+def _resolve_budget(budget: Optional[Union[int, str]], required: int, name: str) -> int:
+    """Resolves a padding budget, which is either None (the minimal size), an integer
+    or "pow2" (the next power of two of the minimal size).
+    """
+    if budget is None:
+        return required
+    if budget == "pow2":
+        return 1 << max(required - 1, 0).bit_length()
+    if budget < required:
+        raise ValueError(f"{name}={budget} is too small, at least {required} are needed.")
+    return int(budget)
+
+
+class GraphBatch(NamedTuple):
+    """A batch of graphs with globally numbered nodes, as consumed by graph neural networks.
+    The layout follows jraphs GraphsTuple: If the batch is padded, all padding nodes and edges
+    belong to the first padding graph and padding edges connect the first padding node to itself.
+    Masks are True for real (non-padding) entries.
+    """
+
+    num_nodes: np.ndarray
+    num_edges: np.ndarray
+    senders: np.ndarray
+    receivers: np.ndarray
+    node_graph_index: np.ndarray
+    edge_graph_index: np.ndarray
+    node_mask: np.ndarray
+    edge_mask: np.ndarray
+    graph_mask: np.ndarray
+    node_attributes: Dict[str, np.ndarray]
+    edge_attributes: Dict[str, np.ndarray]
+    graph_attributes: Dict[str, np.ndarray]
+
+
+class CSRIndex(NamedTuple):
+    """Compressed sparse row index over the edges of all graphs, with nodes numbered globally.
+    The edges of node n are edge_perm[indptr[n]:indptr[n + 1]], which index into edge_indices
+    and the edge attributes, and the nodes at their other end are indices[indptr[n]:indptr[n + 1]].
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    edge_perm: np.ndarray
+
+
+class GraphView:
+    """A single graph yielded by `GraphList.iter_graphs`.
+    The edge indices and node and edge attributes are views into the arrays of the iterated
+    GraphList (or of the block read from disk), graph attributes are the rows of the graph.
+    """
+
+    __slots__ = ("num_nodes", "num_edges", "edge_indices", "node_attributes", "edge_attributes", "graph_attributes")
+
+    def __init__(self, num_nodes, num_edges, edge_indices, node_attributes, edge_attributes, graph_attributes):
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.edge_indices = edge_indices
+        self.node_attributes = node_attributes
+        self.edge_attributes = edge_attributes
+        self.graph_attributes = graph_attributes
+
+    def __repr__(self):
+        return f"GraphView with {self.num_nodes} nodes and {self.num_edges} edges."
+
+
+def _attribute_dicts(attributes: Dict[str, np.ndarray], num_rows: int) -> list:
+    """Returns one dict per row mapping the attribute names to copies of the row values."""
+    if len(attributes) == 0:
+        return [{} for _ in range(num_rows)]
+    columns = [list(np.array(values)) for values in attributes.values()]
+    return [dict(zip(attributes.keys(), row)) for row in zip(*columns)]
+
+
+def _build_csr(num_nodes: int, rows: np.ndarray, columns: np.ndarray) -> CSRIndex:
+    """Builds a CSRIndex from global row and column node indices of all edges with one stable sort."""
+    edge_perm = np.argsort(rows, kind="stable")
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_nodes), out=indptr[1:])
+    return CSRIndex(indptr, columns[edge_perm], edge_perm)
+
+
+SEGMENT_OPS = {"sum": np.add, "mean": np.add, "max": np.maximum, "min": np.minimum}
+
+
+def _segment_reduce(values: np.ndarray, counts: np.ndarray, op: str, fill_value=0) -> np.ndarray:
+    """Reduces consecutive segments of rows with the given counts.
+    Args:
+        values (np.ndarray): Rows of all segments. Shape: (counts.sum(), ...)
+        counts (np.ndarray): Number of rows of each segment.
+        op (str): "sum", "mean", "max" or "min".
+        fill_value (optional): Result of "max", "min" and "mean" for empty segments. Defaults to 0.
+    Returns:
+        np.ndarray: Reduced segments. Shape: (len(counts), ...)
+    """
+    if op not in SEGMENT_OPS:
+        raise ValueError(f"Unknown segment operation {op}, use one of {sorted(SEGMENT_OPS)}.")
+    values = np.asarray(values)
+    counts = np.asarray(counts, dtype=np.int64)
+    if op == "sum":
+        # Sums accumulate in the dtype np.sum promotes to, so that narrow integers do not overflow.
+        dtype = np.sum(np.zeros(1, dtype=values.dtype)).dtype
+    else:
+        dtype = np.float64 if op == "mean" else values.dtype
+    out = np.full((len(counts),) + values.shape[1:], 0 if op == "sum" else fill_value, dtype=dtype)
+    non_empty = counts > 0
+    if not np.any(non_empty):
+        return out
+    # Empty segments are skipped, so that consecutive start offsets delimit exactly one segment each.
+    starts = _exclusive_cumsum(counts)[non_empty]
+    reduced = SEGMENT_OPS[op].reduceat(values, starts, axis=0, dtype=dtype)
+    if op == "mean":
+        reduced = reduced / counts[non_empty].reshape((-1,) + (1,) * (values.ndim - 1))
+    out[non_empty] = reduced
+    return out
 
 
 class GraphList:
@@ -49,26 +370,359 @@ class GraphList:
 
     @cached_property
     def node_starts(self):
-        node_starts = np.roll(np.cumsum(self.num_nodes), 1)
-        node_starts[0] = 0
-        return node_starts
+        # Offsets are always int64, even for compact count dtypes.
+        return _exclusive_cumsum(self.num_nodes)
 
     @cached_property
     def edge_starts(self):
-        edge_starts = np.roll(np.cumsum(self.num_edges), 1)
-        edge_starts[0] = 0
-        return edge_starts
+        return _exclusive_cumsum(self.num_edges)
+
+    def _counts(self, name: str):
+        """Returns num_nodes, num_edges, node_starts or edge_starts for reading the rows of
+        single graphs. File-backed subclasses return a dataset until the array is read.
+        """
+        return getattr(self, name)
+
+    def _global_edge_indices(self) -> np.ndarray:
+        """Returns the edge indices with nodes numbered across all graphs. Shape: (num_edges, 2)"""
+        offsets = np.repeat(self.node_starts, np.asarray(self.num_edges[:], dtype=np.int64))
+        return np.asarray(self._read_all(self.edge_indices), dtype=np.int64) + offsets[:, None]
+
+    @cached_property
+    def csr(self) -> CSRIndex:
+        """CSR index of the outgoing edges of every node (nodes numbered across all graphs)."""
+        edge_indices = self._global_edge_indices()
+        return _build_csr(int(np.sum(self.num_nodes[:])), edge_indices[:, 0], edge_indices[:, 1])
+
+    @cached_property
+    def csc(self) -> CSRIndex:
+        """CSR index of the incoming edges of every node (nodes numbered across all graphs)."""
+        edge_indices = self._global_edge_indices()
+        return _build_csr(int(np.sum(self.num_nodes[:])), edge_indices[:, 1], edge_indices[:, 0])
+
+    @property
+    def out_degree(self) -> np.ndarray:
+        """Number of outgoing edges of every node. Shape: (num_nodes,)"""
+        return np.diff(self.csr.indptr)
+
+    @property
+    def in_degree(self) -> np.ndarray:
+        """Number of incoming edges of every node. Shape: (num_nodes,)"""
+        return np.diff(self.csc.indptr)
+
+    def neighbors(self, graph_idx: int, node: int, incoming: bool = False) -> np.ndarray:
+        """Returns the neighbors of a node.
+        Args:
+            graph_idx (int): Index of the graph.
+            node (int): Index of the node within the graph.
+            incoming (bool, optional): Whether to return the sources of incoming edges instead of
+                the targets of outgoing edges. Defaults to False.
+        Returns:
+            np.ndarray: Indices of the neighbors within the graph (with repetitions for multi-edges).
+        """
+        index = self.csc if incoming else self.csr
+        offset = self.node_starts[graph_idx]
+        n = offset + node
+        return index.indices[index.indptr[n] : index.indptr[n + 1]] - offset
+
+    def sample_neighbors(
+        self, nodes: np.ndarray, num_samples: int, incoming: bool = False, seed: Optional[int] = None
+    ) -> np.ndarray:
+        """Samples neighbors of many nodes at once, uniformly with replacement.
+        Args:
+            nodes (np.ndarray): Node indices, numbered across all graphs (i.e. node_starts[graph] + node).
+            num_samples (int): Number of neighbors to sample per node.
+            incoming (bool, optional): Whether to sample sources of incoming edges. Defaults to False.
+            seed (int, optional): Seed of the random number generator. Defaults to None.
+        Returns:
+            np.ndarray: Sampled neighbors (numbered across all graphs), -1 for nodes without neighbors.
+                Shape: (len(nodes), num_samples)
+        """
+        index = self.csc if incoming else self.csr
+        nodes = np.asarray(nodes, dtype=np.int64)
+        if len(index.indices) == 0:
+            return np.full((len(nodes), num_samples), -1, dtype=np.int64)
+        starts = index.indptr[nodes]
+        degrees = index.indptr[nodes + 1] - starts
+        offsets = np.random.default_rng(seed).random((len(nodes), num_samples)) * degrees[:, None]
+        positions = np.minimum(starts[:, None] + offsets.astype(np.int64), len(index.indices) - 1)
+        return np.where(degrees[:, None] > 0, index.indices[positions], -1)
+
+    # Number of graphs reduced at once by the segment operations, None reduces all graphs at once.
+    reduce_chunk_graphs: Optional[int] = None
+    # Whether the arrays are stored in files, which results of the segment operations cannot be added to.
+    file_backed: bool = False
+
+    def _check_out_name(self, out_name: Optional[str]):
+        if out_name is not None and self.file_backed:
+            raise ValueError(
+                f"out_name is not supported by the file-backed {type(self).__name__}, store the returned array instead."
+            )
+
+    def _store_attribute(self, attributes: str, name: str, values: np.ndarray):
+        """Stores the result of a segment operation as node or graph attribute."""
+        getattr(self, attributes)[name] = values
+        names = getattr(self, attributes[:-1] + "_names")
+        if name not in names:
+            names.append(name)
+
+    def _reduce_chunks(self, reduce: Callable[["GraphList"], np.ndarray]) -> np.ndarray:
+        """Applies reduce to consecutive chunks of `reduce_chunk_graphs` graphs and concatenates the results."""
+        if self.reduce_chunk_graphs is None:
+            return reduce(self)
+        if len(self) == 0:
+            return reduce(self._get_subslice([]))
+        chunks = [
+            reduce(self[start : start + self.reduce_chunk_graphs])
+            for start in range(0, len(self), self.reduce_chunk_graphs)
+        ]
+        return np.concatenate(chunks)
+
+    def segment_reduce(
+        self, attribute: str, op: str = "sum", level: str = "node", fill_value=0, out_name: Optional[str] = None
+    ) -> np.ndarray:
+        """Reduces a node or edge attribute per graph.
+        Args:
+            attribute (str): Name of the node or edge attribute.
+            op (str, optional): "sum", "mean", "max" or "min". Defaults to "sum".
+            level (str, optional): "node" or "edge", the kind of attribute. Defaults to "node".
+            fill_value (optional): Result for graphs without nodes (edges), except for "sum". Defaults to 0.
+            out_name (str, optional): If given, the result is stored as graph attribute with this name.
+                Not supported by file-backed GraphLists. Defaults to None.
+        Returns:
+            np.ndarray: The reduced attribute. Shape: (num_graphs, ...)
+        """
+        if level not in ("node", "edge"):
+            raise ValueError(f"Unknown level {level}, use 'node' or 'edge'.")
+        self._check_out_name(out_name)
+
+        def reduce(graphs):
+            if level == "node":
+                return _segment_reduce(graphs.node_attributes[attribute][:], graphs.num_nodes[:], op, fill_value)
+            return _segment_reduce(graphs.edge_attributes[attribute][:], graphs.num_edges[:], op, fill_value)
+
+        result = self._reduce_chunks(reduce)
+        if out_name is not None:
+            self._store_attribute("graph_attributes", out_name, result)
+        return result
+
+    def segment_sum(self, attribute: str, level: str = "node", out_name: Optional[str] = None) -> np.ndarray:
+        """Sums a node or edge attribute per graph, see `segment_reduce`."""
+        return self.segment_reduce(attribute, "sum", level, out_name=out_name)
+
+    def segment_mean(self, attribute: str, level: str = "node", out_name: Optional[str] = None) -> np.ndarray:
+        """Averages a node or edge attribute per graph, see `segment_reduce`. Empty graphs get NaN."""
+        return self.segment_reduce(attribute, "mean", level, fill_value=np.nan, out_name=out_name)
+
+    def segment_max(self, attribute: str, level: str = "node", fill_value=0, out_name: Optional[str] = None) -> np.ndarray:
+        """Maximum of a node or edge attribute per graph, see `segment_reduce`."""
+        return self.segment_reduce(attribute, "max", level, fill_value, out_name)
+
+    def segment_min(self, attribute: str, level: str = "node", fill_value=0, out_name: Optional[str] = None) -> np.ndarray:
+        """Minimum of a node or edge attribute per graph, see `segment_reduce`."""
+        return self.segment_reduce(attribute, "min", level, fill_value, out_name)
+
+    def aggregate_edges(
+        self,
+        attribute: str,
+        op: str = "sum",
+        incoming: bool = True,
+        fill_value=0,
+        out_name: Optional[str] = None,
+    ) -> np.ndarray:
+        """Aggregates an edge attribute per node over its incoming (or outgoing) edges,
+        i.e. the aggregation step of message passing.
+        Args:
+            attribute (str): Name of the edge attribute.
+            op (str, optional): "sum", "mean", "max" or "min". Defaults to "sum".
+            incoming (bool, optional): Whether to aggregate over incoming edges, otherwise over
+                outgoing edges. Defaults to True.
+            fill_value (optional): Result for nodes without edges, except for "sum". Defaults to 0.
+            out_name (str, optional): If given, the result is stored as node attribute with this name.
+                Not supported by file-backed GraphLists. Defaults to None.
+        Returns:
+            np.ndarray: The aggregated attribute. Shape: (num_nodes, ...)
+        """
+        self._check_out_name(out_name)
+
+        def reduce(graphs):
+            index = graphs.csc if incoming else graphs.csr
+            values = np.asarray(graphs.edge_attributes[attribute][:])[index.edge_perm]
+            return _segment_reduce(values, np.diff(index.indptr), op, fill_value)
+
+        result = self._reduce_chunks(reduce)
+        if out_name is not None:
+            self._store_attribute("node_attributes", out_name, result)
+        return result
+
+    def _column(self, name: str) -> np.ndarray:
+        """Reads a graph level column: num_nodes, num_edges or a 1-dimensional graph attribute."""
+        if name in ("num_nodes", "num_edges"):
+            return np.asarray(getattr(self, name)[:])
+        if name not in self.graph_attribute_names:
+            raise KeyError(f"Unknown column {name}.")
+        column = self._read_all(self.graph_attributes[name])
+        if column.ndim != 1:
+            raise ValueError(f"Graph attribute {name} with shape {column.shape[1:]} is not a column.")
+        return column
+
+    @cached_property
+    def indexes(self) -> Dict[str, SortedIndex]:
+        """Secondary indexes of graph level columns, which are built with `build_index`."""
+        return {}
+
+    def build_index(self, name: str) -> SortedIndex:
+        """Builds a sorted index of a graph level column, which speeds up equality and range
+        conditions of `select` on this column.
+        Args:
+            name (str): num_nodes, num_edges or the name of a 1-dimensional graph attribute.
+        Returns:
+            SortedIndex: The index.
+        """
+        column = self._column(name)
+        order = np.argsort(column, kind="stable")
+        self.indexes[name] = SortedIndex(column[order], order)
+        return self.indexes[name]
+
+    def select(self, where: Optional[Callable[[Columns], np.ndarray]] = None, lazy: bool = False, **conditions):
+        """Selects the graphs which satisfy all conditions.
+        Conditions on columns with an index (see `build_index`) are answered from the index,
+        all other columns are read once.
+        Example:
+            graphs.select(num_nodes=(None, 50), label=3)
+            graphs.select(lambda c: (c.num_nodes < 50) & (c["label"] == 3))
+        Args:
+            where (Callable, optional): Vectorized predicate, which is called with the `Columns` of
+                the graphs and returns a boolean mask. Defaults to None.
+            lazy (bool, optional): Whether to return a lazy GraphSubset instead of the indices.
+                Defaults to False.
+            **conditions: Conditions on num_nodes, num_edges or 1-dimensional graph attributes.
+                Either a value (equality) or a (low, high) tuple for the range low <= value < high,
+                where None means unbounded.
+        Returns:
+            np.ndarray | GraphSubset: Sorted indices of the selected graphs, or the lazy subset.
+        """
+        columns = Columns(self)
+        mask = np.ones(len(self), dtype=bool)
+        for name, condition in conditions.items():
+            if name in self.indexes:
+                selected = np.zeros(len(self), dtype=bool)
+                selected[_index_lookup(self.indexes[name], condition, self._read_range)] = True
+                mask &= selected
+            else:
+                mask &= _column_mask(columns[name], condition)
+        if where is not None:
+            mask &= np.asarray(where(columns), dtype=bool)
+        indices = np.flatnonzero(mask)
+        return GraphSubset(self, indices) if lazy else indices
 
     @staticmethod
+    def from_arrays(
+        edge_indices,
+        num_nodes=None,
+        num_edges=None,
+        node_attributes: Optional[dict] = None,
+        edge_attributes: Optional[dict] = None,
+        graph_attributes: Optional[dict] = None,
+        global_indices: bool = False,
+    ):
+        """Builds a GraphList from arrays, without creating networkx graphs.
+        Edge indices and node and edge attributes are either ragged, lists with one array per graph,
+        or flat, concatenated over all graphs, in which case num_nodes and num_edges give the
+        number of rows per graph.
+        Args:
+            edge_indices (np.ndarray | list): Source and target node of every edge. Shape: (num_edges.sum(), 2)
+            num_nodes (np.ndarray, optional): Number of nodes per graph. Defaults to None, which takes
+                the lengths of ragged node attributes or, without node attributes, the largest local
+                node index of each graph plus one.
+            num_edges (np.ndarray, optional): Number of edges per graph. Defaults to None, which takes
+                the lengths of ragged edge indices.
+            node_attributes (dict, optional): Node attributes by name. Defaults to None.
+            edge_attributes (dict, optional): Edge attributes by name. Defaults to None.
+            graph_attributes (dict, optional): Graph attributes by name, one row per graph. Defaults to None.
+            global_indices (bool, optional): Whether edge indices number the nodes of all graphs
+                consecutively (rows of the node attributes) instead of the nodes within each graph.
+                They are converted to indices within the graphs. Defaults to False.
+        Raises:
+            ValueError: If the arrays have inconsistent lengths or edges point to nodes outside their graph.
+        Returns:
+            GraphList: The graphs.
+        """
+
+        def check_counts(counts, expected, name):
+            if expected is not None and counts is not None and not np.array_equal(counts, expected):
+                raise ValueError(f"The number of rows per graph of {name} does not match the other inputs.")
+            return expected if expected is not None else counts
+
+        if num_edges is not None:
+            num_edges = np.asarray(num_edges, dtype=np.int64)
+        edge_indices, counts = _ragged(edge_indices, "edge_indices", (2,))
+        num_edges = check_counts(counts, num_edges, "edge_indices")
+        if num_nodes is not None:
+            num_nodes = np.asarray(num_nodes, dtype=np.int64)
+        flat_attributes = []
+        for attributes, level in [(node_attributes, "node"), (edge_attributes, "edge")]:
+            flat = {}
+            for name, values in (attributes or {}).items():
+                flat[name], counts = _ragged(values, name)
+                if level == "node":
+                    num_nodes = check_counts(counts, num_nodes, name)
+                else:
+                    num_edges = check_counts(counts, num_edges, name)
+            flat_attributes.append(flat)
+        node_attributes, edge_attributes = flat_attributes
+        graph_attributes = {name: np.asarray(values) for name, values in (graph_attributes or {}).items()}
+
+        if edge_indices.ndim != 2 or edge_indices.shape[1] != 2 or not np.issubdtype(edge_indices.dtype, np.integer):
+            raise ValueError(
+                f"edge_indices must be integers of shape (num_edges, 2), got {edge_indices.dtype} {edge_indices.shape}."
+            )
+        if num_edges is None:
+            raise ValueError("num_edges is required if edge_indices are flat.")
+        if num_nodes is None:
+            if global_indices:
+                raise ValueError("num_nodes is required for global edge indices.")
+            num_nodes = np.zeros(len(num_edges), dtype=np.int64)
+            graph_of_edge = np.repeat(np.arange(len(num_edges)), num_edges)
+            np.maximum.at(num_nodes, graph_of_edge, edge_indices.max(axis=1, initial=-1) + 1)
+        if len(num_nodes) != len(num_edges):
+            raise ValueError(f"Got num_nodes of {len(num_nodes)} graphs and num_edges of {len(num_edges)} graphs.")
+        if np.any(num_nodes < 0) or np.any(num_edges < 0):
+            raise ValueError("num_nodes and num_edges must not be negative.")
+        for arrays, rows, level in [
+            ({"edge_indices": edge_indices, **edge_attributes}, num_edges.sum(), "edges"),
+            (node_attributes, num_nodes.sum(), "nodes"),
+            (graph_attributes, len(num_nodes), "graphs"),
+        ]:
+            for name, array in arrays.items():
+                if len(array) != rows:
+                    raise ValueError(f"{name} has {len(array)} rows, but there are {rows} {level}.")
+
+        edge_indices = edge_indices.astype(np.int64)
+        graph_of_edge = np.repeat(np.arange(len(num_edges)), num_edges)
+        if global_indices:
+            edge_indices = edge_indices - _exclusive_cumsum(num_nodes)[graph_of_edge, None]
+        outside = (edge_indices < 0) | (edge_indices >= num_nodes[graph_of_edge, None])
+        if np.any(outside):
+            edge = int(np.flatnonzero(outside.any(axis=1))[0])
+            raise ValueError(f"Edge {edge} of graph {graph_of_edge[edge]} points to a node outside of its graph.")
+        return GraphList(num_nodes, num_edges, edge_indices, node_attributes, edge_attributes, graph_attributes)
+
+    @staticmethod
+    @instrumented
     def from_nx_graphs(
-        graphs: List[MultiDiGraph],
+        graphs: Iterable["MultiDiGraph"],
         node_attribute_names=[],
         edge_attribute_names=[],
         graph_attribute_names=[],
+        num_workers=0,
+        chunk_size=1000,
+        compact=False,
     ):
         """Converts a list of networkx graphs to a GraphTuple dataset.
         Args:
-            graphs (List[MultiDiGraph]): The networkx graphs to convert to a GraphTuple dataset.
+            graphs (Iterable[MultiDiGraph]): The networkx graphs to convert to a GraphTuple dataset.
+                Without workers this must be a list.
             node_attribute_names (list, optional): Keys of the node attributes.
                 The nodes of the networkx graph must have this key as node property.
                 Defaults to [].
@@ -78,69 +732,69 @@ class GraphList:
             graph_attribute_names (list, optional): Keys of the graph attributes.
                 The networkx graph must have this key as attribute name.
                 Defaults to [].
+            num_workers (int, optional): Number of worker processes. If positive, chunks of
+                `chunk_size` graphs are converted in a process pool and merged in order.
+                Defaults to 0.
+            chunk_size (int, optional): Number of graphs converted per worker task. Defaults to 1000.
+            compact (bool, optional): Whether to store counts and edge indices with the smallest
+                integer dtype which can hold them (see `compact`). Defaults to False.
         Returns:
             GraphTuple: The converted networkx graphs as GraphTuple.
         """
-        num_nodes = np.array([g.number_of_nodes() for g in graphs])
-        num_edges = np.array([g.number_of_edges() for g in graphs])
+        if num_workers > 0:
+            convert = partial(
+                GraphList.from_nx_graphs,
+                node_attribute_names=node_attribute_names,
+                edge_attribute_names=edge_attribute_names,
+                graph_attribute_names=graph_attribute_names,
+            )
+            shards = list(_imap_ordered(convert, _chunks(graphs, chunk_size), num_workers))
+            graphlist = GraphList.concatenate(_add_missing_attributes(shards))
+            return graphlist.compact() if compact else graphlist
+
+        # Collect all nodes and edges in a single pass, attribute columns are then
+        # materialized with one numpy call each.
+        node_lists = [list(g.nodes(data=True)) for g in graphs]
+        edge_lists = [_edge_list(g) for g in graphs]
+        nodes = list(chain.from_iterable(node_lists))
+        edges = list(chain.from_iterable(edge_lists))
+
+        num_nodes = np.fromiter(map(len, node_lists), dtype=int, count=len(graphs))
+        num_edges = np.fromiter(map(len, edge_lists), dtype=int, count=len(graphs))
         node_starts = np.roll(np.cumsum(num_nodes), 1)
         node_starts[0] = 0
-        edge_starts = np.roll(np.cumsum(num_edges), 1)
-        edge_starts[0] = 0
 
         node_attributes = dict()
         edge_attributes = dict()
         graph_attributes = dict()
-        edge_indices = np.zeros(shape=(num_edges.sum(), 2), dtype=int)
 
         for node_attr in node_attribute_names:
-            if node_starts[-1] == 0:
+            if len(nodes) == 0:
                 logging.warn("No nodes in all graphs.")
                 break
-            peek = np.array(next(
-                iter(graphs[np.argwhere(num_nodes > 0)[0, 0]].nodes(data=node_attr)))[1])
-            shape = (num_nodes.sum(),) + peek.shape
-            dtype = peek.dtype
-            node_attributes[node_attr] = np.zeros(shape=shape, dtype=dtype)
+            peek = np.array(nodes[0][1][node_attr])
+            node_attributes[node_attr] = _stack_column(
+                [node[1][node_attr] for node in nodes], peek
+            )
 
         for edge_attr in edge_attribute_names:
-            if edge_starts[-1] == 0:
+            if len(edges) == 0:
                 logging.warn("No edges in all graphs.")
                 break
-            peek = np.array(next(
-                iter(graphs[np.argwhere(num_edges > 0)[0, 0]].edges(data=edge_attr)))[2])
-            shape = (num_edges.sum(),) + peek.shape
-            dtype = peek.dtype
-            edge_attributes[edge_attr] = np.zeros(shape=shape, dtype=dtype)
+            peek = np.array(edges[0][2][edge_attr])
+            edge_attributes[edge_attr] = _stack_column(
+                [edge[2][edge_attr] for edge in edges], peek
+            )
 
         for graph_attr in graph_attribute_names:
             peek = np.array(getattr(graphs[0], graph_attr))
-            shape = (num_nodes.shape[0],) + peek.shape
-            dtype = peek.dtype
-            graph_attributes[graph_attr] = np.zeros(shape=shape, dtype=dtype)
-
-        i_n = 0
-        i_e = 0
-        i_g = 0
-        for g in graphs:
-            node_numbers = {n: i for i, n in enumerate(g.nodes)}
-            for node in g.nodes(data=True):
-                for node_attr in node_attribute_names:
-                    node_attributes[node_attr][i_n] = np.array(node[1][node_attr])
-                i_n += 1
-            for edge in g.edges(data=True):
-                for edge_attr in edge_attribute_names:
-                    edge_attributes[edge_attr][i_e] = np.array(edge[2][edge_attr])
-                edge_indices[i_e] = np.array(
-                    [node_numbers[edge[0]], node_numbers[edge[1]]], dtype=int
-                )
-                i_e += 1
+            graph_attributes[graph_attr] = _stack_column(
+                [getattr(g, graph_attr) for g in graphs], peek
+            )
 
-            for graph_attr in graph_attribute_names:
-                graph_attributes[graph_attr][i_g] = np.array(getattr(g, graph_attr))
-            i_g += 1
+        edge_indices = _local_edge_indices(graphs, nodes, edges, num_nodes, num_edges, node_starts)
 
-        return GraphList(
+        graphlist = GraphList(
             num_nodes,
             num_edges,
             edge_indices,
@@ -148,127 +802,448 @@ class GraphList:
             edge_attributes,
             graph_attributes,
         )
+        return graphlist.compact() if compact else graphlist
 
-    def to_nx_graphs(self) -> List[MultiDiGraph]:
-        """Converts a GraphTuple to a list of networkx graphs.
+    @staticmethod
+    def concatenate(graphlists: List["GraphList"]):
+        """Concatenates GraphLists into a single GraphList.
+        All GraphLists must have the same attribute names, and each attribute must have
+        the same trailing shape and dtype in all GraphLists.
+        Each output array is allocated once, and the node and edge offsets of the result
+        are computed from the (cached) offsets of the inputs.
+        Args:
+            graphlists (List[GraphList]): GraphLists to concatenate.
         Returns:
-            List[MultiDiGraph]: A list of networkx graphs.
+            GraphList: The concatenated GraphList.
         """
-        nx_graphs = []
-        for g in self:
-            nx_graph = MultiDiGraph()
-            nodes = []
-            node_attributes = g.node_attributes.keys()
-            for i in range(g.num_nodes[0]):
-                attr = {
-                    node_attribute: g.node_attributes[node_attribute][i]
-                    for node_attribute in node_attributes
-                }
-                nodes.append((i, attr))
-            nx_graph.add_nodes_from(nodes)
-            edges = []
-            edge_attributes = g.edge_attributes.keys()
-            for i in range(g.num_edges[0]):
-                attr = {
-                    edge_attribute: g.edge_attributes[edge_attribute][i]
-                    for edge_attribute in edge_attributes
-                }
-                node1 = g.edge_indices[i][0]
-                node2 = g.edge_indices[i][1]
-                edges.append((node1, node2, attr))
-            nx_graph.add_edges_from(edges)
-            for graph_attribute, v in g.graph_attributes.items():
-                setattr(nx_graph, graph_attribute, v[0])
-            nx_graphs.append(nx_graph)
-        return nx_graphs
+        if len(graphlists) == 0:
+            raise ValueError("Need at least one GraphList to concatenate.")
+        first = graphlists[0]
+        for graphlist in graphlists[1:]:
+            for names in ["node_attribute_names", "edge_attribute_names", "graph_attribute_names"]:
+                if set(getattr(graphlist, names)) != set(getattr(first, names)):
+                    raise ValueError(
+                        f"Cannot concatenate GraphLists with different {names}: "
+                        f"{getattr(first, names)} and {getattr(graphlist, names)}."
+                    )
 
-    def _get_subslice(self, indices: List[int]):
-        num_graphs = len(indices)
-        num_nodes = self.num_nodes[indices]
-        num_edges = self.num_edges[indices]
-        node_starts = np.roll(np.cumsum(num_nodes), 1)
-        node_starts[0] = 0
-        edge_starts = np.roll(np.cumsum(num_edges), 1)
-        edge_starts[0] = 0
-
-        edge_indices = np.zeros(shape=(num_edges.sum(), 2), dtype=int)
-
-        graph_dict = {
-            "num_nodes": num_nodes,
-            "num_edges": num_edges,
-            "node_attributes": {},
-            "edge_attributes": {},
-            "graph_attributes": {},
-            "edge_indices": edge_indices,
-        }
+        num_graphs = [len(g) for g in graphlists]
+        num_nodes = [int(np.sum(g.num_nodes[:])) for g in graphlists]
+        num_edges = [int(np.sum(g.num_edges[:])) for g in graphlists]
 
-        for node_attr in self.node_attribute_names:
-            shape = (num_nodes.sum(),) + self.node_attributes[node_attr].shape[1:]
-            dtype = self.node_attributes[node_attr].dtype
-            graph_dict["node_attributes"][node_attr] = np.zeros(
-                shape=shape, dtype=dtype
-            )
+        def concatenate_arrays(arrays, counts, name, promote=False):
+            reference = arrays[0]
+            for array in arrays[1:]:
+                if array.shape[1:] != reference.shape[1:] or (array.dtype != reference.dtype and not promote):
+                    raise ValueError(
+                        f"Cannot concatenate {name} with shape {reference.shape[1:]} and dtype "
+                        f"{reference.dtype} and {name} with shape {array.shape[1:]} and dtype {array.dtype}."
+                    )
+            # Topology arrays of compact GraphLists are widened to the common dtype.
+            dtype = np.result_type(*[array.dtype for array in arrays]) if promote else reference.dtype
+            out = np.empty((sum(counts),) + reference.shape[1:], dtype=dtype)
+            start = 0
+            for graphlist, array, count in zip(graphlists, arrays, counts):
+                out[start : start + count] = graphlist._read_range(array, 0, count)
+                start += count
+            return out
 
-        for edge_attr in self.edge_attribute_names:
-            shape = (num_edges.sum(),) + self.edge_attributes[edge_attr].shape[1:]
-            dtype = self.edge_attributes[edge_attr].dtype
-            graph_dict["edge_attributes"][edge_attr] = np.zeros(
-                shape=shape, dtype=dtype
+        concatenated = GraphList(
+            concatenate_arrays([g.num_nodes for g in graphlists], num_graphs, "num_nodes", promote=True),
+            concatenate_arrays([g.num_edges for g in graphlists], num_graphs, "num_edges", promote=True),
+            concatenate_arrays([g.edge_indices for g in graphlists], num_edges, "edge_indices", promote=True),
+            {
+                k: concatenate_arrays([g.node_attributes[k] for g in graphlists], num_nodes, k)
+                for k in first.node_attribute_names
+            },
+            {
+                k: concatenate_arrays([g.edge_attributes[k] for g in graphlists], num_edges, k)
+                for k in first.edge_attribute_names
+            },
+            {
+                k: concatenate_arrays([g.graph_attributes[k] for g in graphlists], num_graphs, k)
+                for k in first.graph_attribute_names
+            },
+        )
+        non_empty = [i for i, n in enumerate(num_graphs) if n > 0]
+        if len(non_empty) > 0:
+            node_offsets = np.cumsum([0] + num_nodes[:-1])
+            edge_offsets = np.cumsum([0] + num_edges[:-1])
+            concatenated.node_starts = np.concatenate(
+                [np.asarray(graphlists[i].node_starts[:]) + node_offsets[i] for i in non_empty]
+            )
+            concatenated.edge_starts = np.concatenate(
+                [np.asarray(graphlists[i].edge_starts[:]) + edge_offsets[i] for i in non_empty]
             )
+        return concatenated
+
+    # Number of graphs read at once by `iter_graphs`, None iterates over views of all graphs.
+    iter_block_graphs: Optional[int] = None
+
+    def iter_graphs(self, block_graphs: Optional[int] = None) -> Iterator[GraphView]:
+        """Iterates over the graphs as lightweight GraphViews, without constructing a GraphList per graph.
+        Args:
+            block_graphs (int, optional): Number of graphs read at once. Defaults to `iter_block_graphs`.
+        Yields:
+            GraphView: The graphs in order.
+        """
+        block_graphs = self.iter_block_graphs if block_graphs is None else block_graphs
+        num_graphs = len(self)
+        if num_graphs == 0:
+            return
+        for start in range(0, num_graphs, num_graphs if block_graphs is None else block_graphs):
+            stop = num_graphs if block_graphs is None else min(start + block_graphs, num_graphs)
+            block = self._get_range(start, stop) if block_graphs is not None else self
+            node_attributes = list(block.node_attributes.items())
+            edge_attributes = list(block.edge_attributes.items())
+            graph_attributes = list(block.graph_attributes.items())
+            node_start, edge_start = 0, 0
+            for i, (num_nodes, num_edges) in enumerate(zip(block.num_nodes[:].tolist(), block.num_edges[:].tolist())):
+                node_stop, edge_stop = node_start + num_nodes, edge_start + num_edges
+                yield GraphView(
+                    num_nodes,
+                    num_edges,
+                    block.edge_indices[edge_start:edge_stop],
+                    {k: v[node_start:node_stop] for k, v in node_attributes},
+                    {k: v[edge_start:edge_stop] for k, v in edge_attributes},
+                    {k: v[i] for k, v in graph_attributes},
+                )
+                node_start, edge_start = node_stop, edge_stop
+
+    def __iter__(self) -> Iterator[GraphView]:
+        return self.iter_graphs()
 
-        for graph_attr in self.graph_attribute_names:
-            shape = (num_graphs,) + self.graph_attributes[graph_attr].shape[1:]
-            dtype = self.graph_attributes[graph_attr].dtype
-            graph_dict["graph_attributes"][graph_attr] = np.zeros(
-                shape=shape, dtype=dtype
+    def iter_nx_graphs(self, block_graphs: Optional[int] = None) -> Iterator["MultiDiGraph"]:
+        """Converts the graphs to networkx graphs one at a time, so that only one block of graphs
+        is held in memory. The attribute values of the networkx graphs are copies.
+        Args:
+            block_graphs (int, optional): Number of graphs read at once. Defaults to `iter_block_graphs`.
+        Yields:
+            MultiDiGraph: The networkx graphs in order.
+        """
+        for g in self.iter_graphs(block_graphs):
+            nx_graph = _nx_graph(
+                g.num_nodes,
+                g.edge_indices[:, 0].tolist(),
+                g.edge_indices[:, 1].tolist(),
+                _attribute_dicts(g.node_attributes, g.num_nodes),
+                _attribute_dicts(g.edge_attributes, g.num_edges),
             )
+            for graph_attribute, v in g.graph_attributes.items():
+                setattr(nx_graph, graph_attribute, np.array(v) if np.ndim(v) > 0 else v)
+            yield nx_graph
+
+    @instrumented
+    def to_nx_graphs(self) -> List["MultiDiGraph"]:
+        """Converts a GraphTuple to a list of networkx graphs.
+        Use `iter_nx_graphs` to convert large datasets without holding all networkx graphs in memory.
+        Returns:
+            List[MultiDiGraph]: A list of networkx graphs.
+        """
+        return list(self.iter_nx_graphs())
+
+    @staticmethod
+    def _plan_rows(rows: np.ndarray):
+        """Prepares gathering the same rows from several arrays, e.g. the node rows of all node
+        attributes. The result is passed to `_gather` as rows. In memory there is nothing to prepare.
+        """
+        return rows
+
+    @staticmethod
+    def _gather(array, rows: np.ndarray) -> np.ndarray:
+        """Gathers the given rows (as returned by `_plan_rows`) of an attribute array into a new array."""
+        return np.take(array, rows, axis=0)
+
+    @staticmethod
+    def _read_range(array, start: int, stop: int) -> np.ndarray:
+        """Reads the contiguous rows [start, stop) of an attribute array.
+        For in-memory arrays this is a view into the array.
+        """
+        return array[start:stop]
+
+    @staticmethod
+    def _read_all(array) -> np.ndarray:
+        """Reads all rows of an attribute array."""
+        return np.asarray(array[:])
+
+    @instrumented
+    def _get_range(self, start: int, stop: int):
+        """Returns the graphs [start, stop) as GraphList.
+        Since the graphs are stored contiguously, the arrays of the returned GraphList
+        are views into the arrays of this GraphList and no data is copied.
+        Use `copy` to get a GraphList which owns its data.
+        """
+        num_nodes, num_edges = self._counts("num_nodes"), self._counts("num_edges")
+        node_starts, edge_starts = self._counts("node_starts"), self._counts("edge_starts")
+        node_start = int(node_starts[start])
+        node_stop = int(node_starts[stop - 1] + num_nodes[stop - 1])
+        edge_start = int(edge_starts[start])
+        edge_stop = int(edge_starts[stop - 1] + num_edges[stop - 1])
+        return GraphList(
+            self._read_range(num_nodes, start, stop),
+            self._read_range(num_edges, start, stop),
+            self._read_range(self.edge_indices, edge_start, edge_stop),
+            {
+                node_attr: self._read_range(self.node_attributes[node_attr], node_start, node_stop)
+                for node_attr in self.node_attribute_names
+            },
+            {
+                edge_attr: self._read_range(self.edge_attributes[edge_attr], edge_start, edge_stop)
+                for edge_attr in self.edge_attribute_names
+            },
+            {
+                graph_attr: self._read_range(self.graph_attributes[graph_attr], start, stop)
+                for graph_attr in self.graph_attribute_names
+            },
+        )
 
-        for i in range(num_graphs):
-
-            for node_attr in self.node_attribute_names:
-                graph_dict["node_attributes"][node_attr][
-                    node_starts[i] : node_starts[i] + num_nodes[i]
-                ] = self.node_attributes[node_attr][
-                    self.node_starts[indices[i]] : self.node_starts[indices[i]]
-                    + self.num_nodes[indices[i]]
-                ]
-
-            for edge_attr in self.edge_attribute_names:
-                graph_dict["edge_attributes"][edge_attr][
-                    edge_starts[i] : edge_starts[i] + num_edges[i]
-                ] = self.edge_attributes[edge_attr][
-                    self.edge_starts[indices[i]] : self.edge_starts[indices[i]]
-                    + self.num_edges[indices[i]]
-                ]
-
-            for graph_attr in self.graph_attribute_names:
-                graph_dict["graph_attributes"][graph_attr][i] = self.graph_attributes[
-                    graph_attr
-                ][indices[i]]
-
-            graph_dict["edge_indices"][
-                edge_starts[i] : edge_starts[i] + num_edges[i]
-            ] = self.edge_indices[
-                self.edge_starts[indices[i]] : self.edge_starts[indices[i]]
-                + self.num_edges[indices[i]]
-            ]
+    @instrumented
+    def collate(
+        self,
+        indices=None,
+        pad_nodes: Optional[Union[int, str]] = None,
+        pad_edges: Optional[Union[int, str]] = None,
+        pad_graphs: Optional[Union[int, str]] = None,
+    ) -> GraphBatch:
+        """Collates graphs into a single GraphBatch with globally offset edge indices.
+        If any padding budget is given, the batch is padded to fixed sizes, so that
+        compiled models see the same shapes for every batch. Budgets which are not given
+        are set to the smallest possible size.
+        Args:
+            indices (optional): Graphs to collate (anything GraphList can be indexed with).
+                Defaults to all graphs.
+            pad_nodes (int | str, optional): Total number of nodes after padding, or "pow2" for
+                the next power of two. Must exceed the number of nodes in the batch. Defaults to None.
+            pad_edges (int | str, optional): Total number of edges after padding, or "pow2".
+                Defaults to None.
+            pad_graphs (int | str, optional): Total number of graphs after padding, or "pow2".
+                Must exceed the number of graphs in the batch. Defaults to None.
+        Returns:
+            GraphBatch: The collated batch.
+        """
+        graphs = self if indices is None else self[indices]
+        if graphs is None:
+            # Empty slices index to None, an empty selection gives an empty (or only padding) batch.
+            graphs = self._get_subslice([])
+        num_nodes = np.asarray(graphs.num_nodes[:], dtype=np.int64)
+        num_edges = np.asarray(graphs.num_edges[:], dtype=np.int64)
+        total_nodes, total_edges, total_graphs = int(num_nodes.sum()), int(num_edges.sum()), len(num_nodes)
+
+        if pad_nodes is None and pad_edges is None and pad_graphs is None:
+            node_budget, edge_budget, graph_budget = total_nodes, total_edges, total_graphs
+        else:
+            node_budget = _resolve_budget(pad_nodes, total_nodes + 1, "pad_nodes")
+            edge_budget = _resolve_budget(pad_edges, total_edges, "pad_edges")
+            graph_budget = _resolve_budget(pad_graphs, total_graphs + 1, "pad_graphs")
+
+        padded_num_nodes = np.zeros(graph_budget, dtype=np.int64)
+        padded_num_nodes[:total_graphs] = num_nodes
+        padded_num_edges = np.zeros(graph_budget, dtype=np.int64)
+        padded_num_edges[:total_graphs] = num_edges
+        if graph_budget > total_graphs:
+            padded_num_nodes[total_graphs] = node_budget - total_nodes
+            padded_num_edges[total_graphs] = edge_budget - total_edges
+
+        edge_offsets = np.repeat(graphs.node_starts, num_edges)
+        edge_indices = np.asarray(graphs.edge_indices[:])
+        senders = np.full(edge_budget, total_nodes, dtype=np.int64)
+        senders[:total_edges] = edge_indices[:, 0] + edge_offsets
+        receivers = np.full(edge_budget, total_nodes, dtype=np.int64)
+        receivers[:total_edges] = edge_indices[:, 1] + edge_offsets
+
+        def pad(array, budget):
+            padded = np.zeros((budget,) + array.shape[1:], dtype=array.dtype)
+            padded[: array.shape[0]] = array
+            return padded
+
+        def mask(total, budget):
+            mask = np.zeros(budget, dtype=bool)
+            mask[:total] = True
+            return mask
+
+        return GraphBatch(
+            num_nodes=padded_num_nodes,
+            num_edges=padded_num_edges,
+            senders=senders,
+            receivers=receivers,
+            node_graph_index=np.repeat(np.arange(graph_budget), padded_num_nodes),
+            edge_graph_index=np.repeat(np.arange(graph_budget), padded_num_edges),
+            node_mask=mask(total_nodes, node_budget),
+            edge_mask=mask(total_edges, edge_budget),
+            graph_mask=mask(total_graphs, graph_budget),
+            node_attributes={
+                k: pad(graphs.node_attributes[k][:], node_budget) for k in graphs.node_attribute_names
+            },
+            edge_attributes={
+                k: pad(graphs.edge_attributes[k][:], edge_budget) for k in graphs.edge_attribute_names
+            },
+            graph_attributes={
+                k: pad(graphs.graph_attributes[k][:], graph_budget) for k in graphs.graph_attribute_names
+            },
+        )
+
+    def loader(self, **kwargs):
+        """Returns a GraphLoader, which iterates over shuffled mini-batches of this GraphList
+        within a node/edge/graph budget and reads them in background threads.
+        Args:
+            **kwargs: Keyword arguments of `GraphLoader` (e.g. max_nodes, max_edges, bucket_size).
+        Returns:
+            GraphLoader: The loader.
+        """
+        return GraphLoader(self, **kwargs)
+
+    def compact(self):
+        """Returns a GraphList whose counts and edge indices use the smallest unsigned integer
+        dtype which can hold them. Since edge indices are local to each graph, they usually fit
+        into uint8 or uint16. Attribute arrays are shared with this GraphList.
+        Returns:
+            GraphList: The compact GraphList.
+        """
+        num_nodes = np.asarray(self.num_nodes[:])
+        num_edges = np.asarray(self.num_edges[:])
+        edge_indices = np.asarray(self.edge_indices[:])
+        return self._with_topology(
+            num_nodes.astype(_min_uint_dtype(num_nodes), copy=False),
+            num_edges.astype(_min_uint_dtype(num_edges), copy=False),
+            edge_indices.astype(_min_uint_dtype(edge_indices), copy=False),
+        )
+
+    def widen(self, dtype=np.int64):
+        """Returns a GraphList whose counts and edge indices have the given dtype.
+        Attribute arrays are shared with this GraphList.
+        Args:
+            dtype (optional): The integer dtype. Defaults to np.int64.
+        Returns:
+            GraphList: The widened GraphList.
+        """
+        return self._with_topology(
+            np.asarray(self.num_nodes[:]).astype(dtype, copy=False),
+            np.asarray(self.num_edges[:]).astype(dtype, copy=False),
+            np.asarray(self.edge_indices[:]).astype(dtype, copy=False),
+        )
+
+    def _with_topology(self, num_nodes, num_edges, edge_indices):
+        graphlist = GraphList(
+            num_nodes,
+            num_edges,
+            edge_indices,
+            {k: self.node_attributes[k] for k in self.node_attribute_names},
+            {k: self.edge_attributes[k] for k in self.edge_attribute_names},
+            {k: self.graph_attributes[k] for k in self.graph_attribute_names},
+        )
+        for offsets in ["node_starts", "edge_starts"]:
+            if offsets in self.__dict__:
+                graphlist.__dict__[offsets] = self.__dict__[offsets]
+        return graphlist
+
+    def partition(self, rank: int, world_size: int, seed: int = 0, drop_last: bool = False) -> np.ndarray:
+        """Assigns the graphs to data-parallel ranks, so that every rank gets a disjoint subset of
+        about the same number of graphs and the same total size (nodes + edges).
+        Graphs are sorted by size and dealt to the ranks in snake order (0, 1, ..., n-1, n-1, ..., 0).
+        The assignment is deterministic for a given seed, which only breaks ties between equally sized graphs.
+        Args:
+            rank (int): Rank to return the graphs of.
+            world_size (int): Number of ranks.
+            seed (int, optional): Seed for breaking ties. Defaults to 0.
+            drop_last (bool, optional): Whether to drop the smallest graphs, so that all ranks get the
+                same number of graphs. Defaults to False.
+        Returns:
+            np.ndarray: Sorted indices of the graphs of the rank.
+        """
+        if not 0 <= rank < world_size:
+            raise ValueError(f"Rank {rank} is out of range for world size {world_size}.")
+        sizes = np.asarray(self.num_nodes[:], dtype=np.int64) + np.asarray(self.num_edges[:], dtype=np.int64)
+        permutation = np.random.default_rng(seed).permutation(len(sizes))
+        order = permutation[np.argsort(-sizes[permutation], kind="stable")]
+        if drop_last:
+            order = order[: len(order) // world_size * world_size]
+        position = np.arange(len(order))
+        rounds, slots = position // world_size, position % world_size
+        ranks = np.where(rounds % 2 == 0, slots, world_size - 1 - slots)
+        return np.sort(order[ranks == rank])
+
+    def to_shared_memory(self):
+        """Copies the graphs into one shared memory segment.
+        Pickling the returned SharedGraphList, e.g. to send it to multiprocessing or DataLoader
+        workers, only pickles a small handle and the workers attach to the segment without copying.
+        The segment is removed when the returned SharedGraphList is garbage collected.
+        Returns:
+            SharedGraphList: The graphs in shared memory.
+        """
+        from .graphlist_shared import SharedGraphList
+
+        return SharedGraphList.from_graphlist(self)
+
+    @staticmethod
+    def from_shared_memory(handle):
+        """Attaches to graphs in shared memory.
+        Args:
+            handle (SharedMemoryHandle): The `handle` of the SharedGraphList returned by `to_shared_memory`.
+        Returns:
+            SharedGraphList: The graphs in shared memory.
+        """
+        from .graphlist_shared import SharedGraphList
+
+        return SharedGraphList(handle)
+
+    def copy(self):
+        """Returns a copy of the GraphList which owns all of its arrays.
+        Returns:
+            GraphList: The copied GraphList.
+        """
+        return GraphList(
+            np.array(self.num_nodes[:]),
+            np.array(self.num_edges[:]),
+            np.array(self.edge_indices[:]),
+            {k: np.array(self.node_attributes[k][:]) for k in self.node_attribute_names},
+            {k: np.array(self.edge_attributes[k][:]) for k in self.edge_attribute_names},
+            {k: np.array(self.graph_attributes[k][:]) for k in self.graph_attribute_names},
+        )
+
+    @instrumented
+    def _get_subslice(self, indices: List[int]):
+        indices = _normalize_indices(indices, len(self))
+        graph_rows = self._plan_rows(indices)
+        num_nodes = self._gather(self._counts("num_nodes"), graph_rows)
+        num_edges = self._gather(self._counts("num_edges"), graph_rows)
+
+        node_rows = self._plan_rows(_segment_rows(self._gather(self._counts("node_starts"), graph_rows), num_nodes))
+        edge_rows = self._plan_rows(_segment_rows(self._gather(self._counts("edge_starts"), graph_rows), num_edges))
+
+        node_attributes = {
+            node_attr: self._gather(self.node_attributes[node_attr], node_rows)
+            for node_attr in self.node_attribute_names
+        }
+        edge_attributes = {
+            edge_attr: self._gather(self.edge_attributes[edge_attr], edge_rows)
+            for edge_attr in self.edge_attribute_names
+        }
+        graph_attributes = {
+            graph_attr: self._gather(self.graph_attributes[graph_attr], graph_rows)
+            for graph_attr in self.graph_attribute_names
+        }
+        edge_indices = self._gather(self.edge_indices, edge_rows)
 
         graph_tuple_slice = GraphList(
-            graph_dict["num_nodes"],
-            graph_dict["num_edges"],
-            graph_dict["edge_indices"],
-            graph_dict["node_attributes"],
-            graph_dict["edge_attributes"],
-            graph_dict["graph_attributes"],
+            num_nodes,
+            num_edges,
+            edge_indices,
+            node_attributes,
+            edge_attributes,
+            graph_attributes,
         )
         return graph_tuple_slice
 
     def __len__(self):
-        return self.num_nodes[:].shape[0]
+        return len(self.num_nodes)
 
     def __getitem__(self, index):
         if isinstance(index, int):
-            return self.__getitem__([index])
+            if index < 0:
+                index = len(self) + index
+            if not 0 <= index < len(self):
+                raise IndexError(f"Index {index} is out of range for {len(self)} graphs.")
+            return self._get_range(index, index + 1)
         elif isinstance(index, slice):
             start = 0 if index.start is None else index.start
             stop = len(self) if index.stop is None else index.stop
@@ -280,6 +1255,8 @@ class GraphList:
                 stop = len(self)
             if start >= stop:
                 return None
+            if index.step is None or index.step == 1:
+                return self._get_range(start, stop)
             return self.__getitem__(np.arange(start, stop, index.step))
         elif isinstance(index, (list, np.ndarray)):
             return self._get_subslice(index)
@@ -1,12 +1,63 @@
+import asyncio
+import threading
 import h5py
 import numpy as np
-from typing import Iterable
-from itertools import islice
-from networkx import MultiDiGraph
-from graphlist import GraphList
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, NamedTuple, Optional
+from . import instrumentation
+from .block_cache import BlockCache
+from .graphlist import CSRIndex, GraphList, _chunks, _exclusive_cumsum, _imap_ordered, _normalize_indices
+from .hdf_writer import HDFGraphListWriter
+from .ingest import stream_graphlists
+from .query import SortedIndex
+
+if TYPE_CHECKING:
+    from networkx import MultiDiGraph
+
+def _coalesce_rows(rows: np.ndarray, max_gap: int):
+    """Merges sorted, unique rows into runs [start, stop), where consecutive rows within a run
+    are at most max_gap rows apart.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start and stop (exclusive) row of each run.
+    """
+    breaks = np.flatnonzero(np.diff(rows) > max_gap + 1)
+    run_starts = rows[np.concatenate([[0], breaks + 1])]
+    run_stops = rows[np.concatenate([breaks, [len(rows) - 1]])] + 1
+    return run_starts, run_stops
+
+
+class _RowPlan(NamedTuple):
+    """Runs of rows read by `HDFGraphList._gather` and the position of each requested row in the
+    concatenated runs.
+    """
+
+    rows: np.ndarray
+    run_starts: np.ndarray
+    run_stops: np.ndarray
+    positions: np.ndarray
+
 
 class HDFGraphList(GraphList):
-    """A subclass of GraphList, which is able to read and write GraphList from/to the disk into HDF files."""
+    """A subclass of GraphList, which is able to read and write GraphList from/to the disk into HDF files.
+
+    Opening a file reads no data. num_nodes, num_edges and the node and edge offsets persisted by
+    `HDFGraphListWriter` are read into memory on first access, until then indexing with an int or
+    a slice only reads the rows of the requested graphs. Indexing with a list of graphs reads them
+    into memory, see `resident_counts`.
+    """
+
+    # Segment operations read and reduce this many graphs at a time to bound memory usage.
+    reduce_chunk_graphs = 65536
+    file_backed = True
+    # Iteration reads this many graphs with one read per dataset.
+    iter_block_graphs = 4096
+    # Number of threads of the executor running the reads of `aget`.
+    async_workers = 1
+    # Whether indexing with a list of graphs loads num_nodes, num_edges and the offsets of all graphs
+    # into memory on first use, instead of gathering the rows of the requested graphs from the file.
+    resident_counts = True
 
     def __init__(
         self,
@@ -14,10 +65,30 @@ class HDFGraphList(GraphList):
         node_attribute_names=None,
         edge_attribute_names=None,
         graph_attribute_names=None,
+        max_read_gap=64,
+        cache_bytes=0,
+        cache_block_rows=4096,
     ):
+        """Initializes HDFGraphList.
+        Args:
+            file (h5py.File): HDF file containing the graphs.
+            node_attribute_names (list, optional): Node attributes to read. Defaults to all.
+            edge_attribute_names (list, optional): Edge attributes to read. Defaults to all.
+            graph_attribute_names (list, optional): Graph attributes to read. Defaults to all.
+            max_read_gap (int, optional): When indexing with a list of graphs, requested rows which
+                are at most this many rows apart are read with a single h5py read, including
+                the rows in between. Defaults to 64.
+            cache_bytes (int, optional): Size of the LRU block cache for reads in bytes.
+                Defaults to 0 (no cache).
+            cache_block_rows (int, optional): Number of rows per cached block. Defaults to 4096.
+        """
         self.file = file
-        self.num_nodes = np.array(self.file["num_nodes"])
-        self.num_edges = np.array(self.file["num_edges"])
+        self.max_read_gap = max_read_gap
+        self.cache = BlockCache(cache_bytes, cache_block_rows) if cache_bytes > 0 else None
+        self._executor = None
+        self._read_lock = threading.Lock()
+        # Graphs currently read by `aget`, mapped to the future of their read and their position in it.
+        self._inflight = {}
         if node_attribute_names is None:
             self.node_attribute_names = list(self.node_attributes.keys())
         else:
@@ -32,26 +103,49 @@ class HDFGraphList(GraphList):
             self.graph_attribute_names = graph_attribute_names
 
     @staticmethod
+    @instrumentation.instrumented
     def from_nx_graphs(
         file: h5py.File,
-        graphs: Iterable[MultiDiGraph],
+        graphs: Iterable["MultiDiGraph"],
         node_attribute_names=[],
         edge_attribute_names=[],
         graph_attribute_names=[],
         batch_size=100,
+        num_workers=0,
+        storage_options=None,
+        compact=False,
     ):
-        graphs_generator = (g for g in graphs)
-        while True:
-            graphs_batch = list(islice(graphs_generator, batch_size))
-            if len(graphs_batch) == 0:
-                break
-            graphlist_batch = GraphList.from_nx_graphs(
-                graphs_batch,
-                node_attribute_names=node_attribute_names,
-                edge_attribute_names=edge_attribute_names,
-                graph_attribute_names=graph_attribute_names,
-            )
-            graphlist_to_hdf(file, graphlist_batch)
+        """Converts networkx graphs in batches and appends them to a HDF file.
+        Args:
+            file (h5py.File): HDF file to write to.
+            graphs (Iterable[MultiDiGraph]): The networkx graphs to convert.
+            node_attribute_names (list, optional): Keys of the node attributes. Defaults to [].
+            edge_attribute_names (list, optional): Keys of the edge attributes. Defaults to [].
+            graph_attribute_names (list, optional): Keys of the graph attributes. Defaults to [].
+            batch_size (int, optional): Number of graphs converted and written at once. Defaults to 100.
+            num_workers (int, optional): Number of worker processes converting batches in parallel.
+                The batches are still written in order by this process. Defaults to 0.
+            storage_options (Dict[str, dict], optional): Compression and chunking options of the datasets,
+                see `HDFGraphListWriter`. Defaults to None.
+            compact (bool, optional): Whether to store counts and edge indices with the smallest
+                integer dtype which can hold them. Defaults to False.
+        Returns:
+            HDFGraphList: The HDFGraphList of the file.
+        """
+        convert = partial(
+            GraphList.from_nx_graphs,
+            node_attribute_names=node_attribute_names,
+            edge_attribute_names=edge_attribute_names,
+            graph_attribute_names=graph_attribute_names,
+        )
+        graphs_batches = _chunks(graphs, batch_size)
+        if num_workers > 0:
+            graphlist_batches = _imap_ordered(convert, graphs_batches, num_workers)
+        else:
+            graphlist_batches = map(convert, graphs_batches)
+        with HDFGraphListWriter(file, storage_options=storage_options, compact=compact) as writer:
+            for graphlist_batch in graphlist_batches:
+                writer.append(graphlist_batch)
         return HDFGraphList(
             file,
             node_attribute_names=node_attribute_names,
@@ -59,6 +153,57 @@ class HDFGraphList(GraphList):
             graph_attribute_names=graph_attribute_names,
         )
 
+    @cached_property
+    def num_nodes(self) -> np.ndarray:
+        """Number of nodes per graph, read from the file on first access."""
+        return self._read_all(self.file["num_nodes"])
+
+    @cached_property
+    def num_edges(self) -> np.ndarray:
+        """Number of edges per graph, read from the file on first access."""
+        return self._read_all(self.file["num_edges"])
+
+    @cached_property
+    def node_starts(self) -> np.ndarray:
+        """Offsets of the graphs in the node attributes, read from the file on first access.
+        Files written without persisted offsets fall back to a cumulative sum over num_nodes.
+        """
+        return self._read_all(self._counts("node_starts"))
+
+    @cached_property
+    def edge_starts(self) -> np.ndarray:
+        """Offsets of the graphs in the edge attributes and edge indices, see `node_starts`."""
+        return self._read_all(self._counts("edge_starts"))
+
+    def _counts(self, name: str):
+        """Returns num_nodes, num_edges, node_starts or edge_starts if they were read into memory,
+        otherwise their dataset, from which only the rows of the requested graphs are read.
+        """
+        if name in self.__dict__:
+            return self.__dict__[name]
+        counts = {"node_starts": "num_nodes", "edge_starts": "num_edges"}.get(name)
+        if counts is not None and (name not in self.file or self.file[name].shape[0] != self.file[counts].shape[0]):
+            self.__dict__[name] = _exclusive_cumsum(self._read_all(self.file[counts]))
+            return self.__dict__[name]
+        return self.file[name]
+
+    def load_counts(self):
+        """Reads num_nodes, num_edges and the node and edge offsets of all graphs into memory,
+        which makes indexing with lists of graphs cheaper. Appending graphs drops them again.
+        """
+        for name in ["num_nodes", "num_edges", "node_starts", "edge_starts"]:
+            getattr(self, name)
+
+    def _get_subslice(self, indices):
+        # Negative indices would otherwise become negative rows of the coalesced reads.
+        indices = _normalize_indices(indices, len(self))
+        if self.resident_counts:
+            self.load_counts()
+        return GraphList._get_subslice(self, indices)
+
+    def __len__(self):
+        return len(self._counts("num_nodes"))
+
     @property
     def edge_indices(self):
         return self.file["edge_indices"]
@@ -75,16 +220,316 @@ class HDFGraphList(GraphList):
     def graph_attributes(self):
         return self.file["graph_attributes"]
 
-    def append_graphlist(self, graphlist: GraphList):
-        self._append_graphlist(self.file, graphlist)
+    @cached_property
+    def csr(self) -> CSRIndex:
+        """CSR index of the outgoing edges, loaded from the file if it was persisted with `write_csr`."""
+        return self._load_csr("csr") or GraphList.csr.func(self)
+
+    @cached_property
+    def csc(self) -> CSRIndex:
+        """CSR index of the incoming edges, loaded from the file if it was persisted with `write_csr`."""
+        return self._load_csr("csc") or GraphList.csc.func(self)
+
+    def _load_csr(self, name: str) -> Optional[CSRIndex]:
+        if name not in self.file:
+            return None
+        group = self.file[name]
+        return CSRIndex(*(self._read_all(group[field]) for field in CSRIndex._fields))
+
+    @cached_property
+    def indexes(self) -> Dict[str, SortedIndex]:
+        """Secondary indexes of graph level columns. Indexes persisted in the file are not read
+        into memory, lookups only read O(log n) values and the selected graph indices.
+        """
+        if "indexes" not in self.file:
+            return {}
+        return {
+            name: SortedIndex(group["values"], group["order"]) for name, group in self.file["indexes"].items()
+        }
+
+    def build_index(self, name: str, persist: Optional[bool] = None) -> SortedIndex:
+        """Builds a sorted index of a graph level column, see `GraphList.build_index`.
+        Args:
+            name (str): num_nodes, num_edges or the name of a 1-dimensional graph attribute.
+            persist (bool, optional): Whether to store the index in the file. Appending graphs
+                removes persisted indexes. Defaults to None, which persists the index if the file
+                is writable.
+        Raises:
+            ValueError: If persist is True, but the file is opened read-only.
+        Returns:
+            SortedIndex: The index.
+        """
+        writable = self.file.file.mode != "r"
+        if persist and not writable:
+            raise ValueError("Cannot persist an index in a file opened read-only, use persist=False.")
+        if persist is None:
+            persist = writable
+        index = GraphList.build_index(self, name)
+        if persist:
+            group = self.file.require_group("indexes")
+            if name in group:
+                del group[name]
+            group.create_group(name)
+            group[name].create_dataset("values", data=index.values)
+            group[name].create_dataset("order", data=index.order)
+            self.indexes[name] = SortedIndex(group[name]["values"], group[name]["order"])
+        return index
+
+    def write_csr(self, csc: bool = False):
+        """Persists the CSR index (and optionally the CSC index) in the file,
+        so that it does not need to be rebuilt when the file is opened again.
+        Appending graphs removes the persisted indices.
+        Args:
+            csc (bool, optional): Whether to persist the index of incoming edges as well. Defaults to False.
+        """
+        for name in ["csr", "csc"] if csc else ["csr"]:
+            index = getattr(self, name)
+            if name in self.file:
+                del self.file[name]
+            group = self.file.create_group(name)
+            for field in CSRIndex._fields:
+                group.create_dataset(field, data=getattr(index, field))
+
+    def _read_range(self, array, start: int, stop: int) -> np.ndarray:
+        """Reads the rows [start, stop) of a dataset, through the block cache if enabled."""
+        if self.cache is None or not isinstance(array, h5py.Dataset):
+            data = array[start:stop]
+            if instrumentation.ENABLED and isinstance(array, h5py.Dataset):
+                instrumentation.record_read(array, data)
+            return data
+        return self.cache.read(array, start, stop)
+
+    def _read_all(self, array) -> np.ndarray:
+        """Reads all rows of a dataset. Whole datasets are kept in memory by the caller,
+        so they are read past the block cache instead of evicting it.
+        """
+        data = np.asarray(array[:])
+        if instrumentation.ENABLED and isinstance(array, h5py.Dataset):
+            instrumentation.record_read(array, data)
+        return data
+
+    def _plan_rows(self, rows: np.ndarray) -> _RowPlan:
+        """Sorts the requested rows and merges them into runs of (nearly) contiguous rows once,
+        so that all datasets of a row space (graphs, nodes or edges) are read with the same runs.
+        """
+        rows = np.asarray(rows)
+        if len(rows) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return _RowPlan(rows, empty, empty, empty)
+        unique_rows, inverse = np.unique(rows, return_inverse=True)
+        run_starts, run_stops = _coalesce_rows(unique_rows, self.max_read_gap)
+        run_offsets = np.cumsum(run_stops - run_starts) - (run_stops - run_starts)
+        run_index = np.searchsorted(run_starts, unique_rows, side="right") - 1
+        positions = unique_rows - run_starts[run_index] + run_offsets[run_index]
+        return _RowPlan(rows, run_starts, run_stops, positions[inverse.reshape(-1)])
+
+    def _gather(self, array, rows) -> np.ndarray:
+        """Gathers rows from a HDF dataset, or from an in-memory array such as computed offsets.
+        Each run of the plan (see `_plan_rows`) is read with a single h5py read and the requested
+        order is restored in memory.
+        """
+        plan = rows if isinstance(rows, _RowPlan) else self._plan_rows(rows)
+        if isinstance(array, np.ndarray):
+            return np.take(array, plan.rows, axis=0)
+        if len(plan.rows) == 0:
+            return np.empty((0,) + array.shape[1:], dtype=array.dtype)
+        runs = [self._read_range(array, start, stop) for start, stop in zip(plan.run_starts, plan.run_stops)]
+        data = runs[0] if len(runs) == 1 else np.concatenate(runs)
+        return data[plan.positions]
+
+    def close(self):
+        """Stops the threads reading for `aget`. The file belongs to the caller and stays open."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        executor = self.__dict__.get("_executor")
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _locked_read(self, indices: np.ndarray) -> GraphList:
+        with self._read_lock:
+            return self._get_subslice(indices)
+
+    async def aget(self, index):
+        """Reads graphs without blocking the event loop.
+        Reads run on a thread pool of `async_workers` threads and hold a lock on the file,
+        the threads are stopped by `close`.
+        Graphs which are already being read for another request are not read again, the
+        request waits for the pending read instead.
+        Args:
+            index (int | list | np.ndarray): Graph index or indices.
+        Returns:
+            GraphList: The graphs in the requested order.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = [index]
+        indices = np.asarray(index, dtype=np.int64).reshape(-1)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        if np.any((indices < 0) | (indices >= len(self))):
+            raise IndexError(f"Indices out of range for {len(self)} graphs.")
+        if len(indices) == 0:
+            return self._get_subslice(indices)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.async_workers)
+
+        unique_indices, inverse = np.unique(indices, return_inverse=True)
+        missing = [i for i in unique_indices.tolist() if i not in self._inflight]
+        if len(missing) > 0:
+            read = asyncio.get_running_loop().run_in_executor(self._executor, self._locked_read, np.array(missing))
+            for position, i in enumerate(missing):
+                self._inflight[i] = (read, position)
+            read.add_done_callback(partial(self._read_done, missing))
+        # Group the unique graphs by the read they come from: read, rank among the unique graphs, position in the read.
+        groups = {}
+        for rank, i in enumerate(unique_indices.tolist()):
+            read, position = self._inflight[i]
+            group = groups.setdefault(id(read), (read, [], []))
+            group[1].append(rank)
+            group[2].append(position)
+        # Reads are shared between requests, a cancelled request must not cancel them.
+        batches = await asyncio.gather(*(asyncio.shield(read) for read, _, _ in groups.values()))
+        inverse = inverse.reshape(-1)
+        if len(groups) == 1:
+            (_, _, positions), = groups.values()
+            return batches[0]._get_subslice(np.array(positions)[inverse])
+        parts = [batch._get_subslice(positions) for batch, (_, _, positions) in zip(batches, groups.values())]
+        ranks = np.concatenate([ranks for _, ranks, _ in groups.values()])
+        order = np.empty_like(ranks)
+        order[ranks] = np.arange(len(ranks))
+        return GraphList.concatenate(parts)._get_subslice(order[inverse])
+
+    def _read_done(self, indices: list, read: asyncio.Future):
+        for i in indices:
+            if self._inflight.get(i, (None,))[0] is read:
+                del self._inflight[i]
+
+    async def aiter_batches(self, batch_size: int, indices=None, prefetch: int = 2) -> AsyncIterator[GraphList]:
+        """Iterates over batches of graphs without blocking the event loop, reading up to
+        `prefetch` batches ahead of the consumer.
+        Args:
+            batch_size (int): Number of graphs per batch.
+            indices (list | np.ndarray, optional): Graphs to iterate over, in this order. Defaults to all graphs.
+            prefetch (int, optional): Number of batches read ahead. Defaults to 2.
+        Yields:
+            GraphList: The batches.
+        """
+        indices = np.arange(len(self)) if indices is None else np.asarray(indices, dtype=np.int64)
+        batches = (indices[start : start + batch_size] for start in range(0, len(indices), batch_size))
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(asyncio.ensure_future(self.aget(batch)))
+                if len(pending) > prefetch:
+                    yield await pending.popleft()
+            while len(pending) > 0:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def append_graphlist(self, graphlist: GraphList, storage_options=None):
+        """Appends a GraphList to the file.
+        Use a `HDFGraphListWriter` to append many small GraphLists efficiently.
+        Args:
+            graphlist (GraphList): GraphList dataset to append to the file.
+            storage_options (Dict[str, dict], optional): Compression and chunking options of datasets
+                which do not exist yet, see `HDFGraphListWriter`. Defaults to None.
+        """
+        if self.cache is not None:
+            self.cache.clear()
+        self._append_graphlist(self.file, graphlist, storage_options)
+        for cached in ["num_nodes", "num_edges", "node_starts", "edge_starts", "csr", "csc", "indexes"]:
+            self.__dict__.pop(cached, None)
+
+    @staticmethod
+    def from_tables(
+        file: h5py.File,
+        edges,
+        nodes=None,
+        graph_id: str = "graph_id",
+        source: str = "source",
+        target: str = "target",
+        node_attribute_names: Optional[list] = None,
+        edge_attribute_names: Optional[list] = None,
+        global_indices: bool = False,
+        chunk_rows: int = 1000000,
+        storage_options=None,
+        compact=False,
+        **read_options,
+    ):
+        """Streams an edge table and an optional node table into a HDF file, without creating networkx graphs.
+        Both tables must be sorted by graph id. They are read in chunks of rows, so that only about
+        one chunk of each table is held in memory, and every chunk of complete graphs is appended to the file.
+        Args:
+            file (h5py.File): HDF file to write to.
+            edges: Edge table with columns graph_id, source and target and edge attributes, a .csv,
+                .npy or .npz file or a structured array or dict of arrays, see `ingest.read_table`.
+            nodes (optional): Node table with column graph_id and node attributes, one row per node
+                in the order of the node indices. Defaults to None, in which case a graph has as many
+                nodes as its largest node index plus one and graphs without edges are not written.
+            graph_id (str, optional): Column of the graph ids. Defaults to "graph_id".
+            source (str, optional): Column of the source nodes. Defaults to "source".
+            target (str, optional): Column of the target nodes. Defaults to "target".
+            node_attribute_names (list, optional): Columns of the node table to store as node attributes.
+                Defaults to None, which stores all columns except graph_id.
+            edge_attribute_names (list, optional): Columns of the edge table to store as edge attributes.
+                Defaults to None, which stores all columns except graph_id, source and target.
+            global_indices (bool, optional): Whether source and target are row numbers of the node table
+                instead of node indices within each graph. Defaults to False.
+            chunk_rows (int, optional): Number of rows read at once from each table. Defaults to 1000000.
+            storage_options (Dict[str, dict], optional): Compression and chunking options of the datasets,
+                see `HDFGraphListWriter`. Defaults to None.
+            compact (bool, optional): Whether to store counts and edge indices with the smallest
+                integer dtype which can hold them. Defaults to False.
+            **read_options: Options of `ingest.read_table`, e.g. delimiter and dtypes of CSV files.
+        Raises:
+            ValueError: If a table is not sorted by graph id or the tables do not match.
+        Returns:
+            HDFGraphList: The HDFGraphList of the file.
+        """
+        graphlists = stream_graphlists(
+            edges,
+            nodes,
+            graph_id=graph_id,
+            source=source,
+            target=target,
+            node_attribute_names=node_attribute_names,
+            edge_attribute_names=edge_attribute_names,
+            global_indices=global_indices,
+            chunk_rows=chunk_rows,
+            **read_options,
+        )
+        with HDFGraphListWriter(file, storage_options=storage_options, compact=compact) as writer:
+            for graphlist in graphlists:
+                writer.append(graphlist)
+        return HDFGraphList(file)
 
     @staticmethod
-    def from_graphlist(file: h5py.File, graphlist: GraphList):
-        HDFGraphList._append_graphlist(file, graphlist)
+    def from_graphlist(file: h5py.File, graphlist: GraphList, storage_options=None, compact=False):
+        """Writes a GraphList to a HDF file.
+        Args:
+            file (h5py.File): HDF file to write to.
+            graphlist (GraphList): GraphList dataset to write.
+            storage_options (Dict[str, dict], optional): Compression and chunking options of the datasets,
+                see `HDFGraphListWriter`. Defaults to None.
+            compact (bool, optional): Whether to store counts and edge indices with the smallest
+                integer dtype which can hold them. Defaults to False.
+        Returns:
+            HDFGraphList: The HDFGraphList of the file.
+        """
+        HDFGraphList._append_graphlist(file, graphlist, storage_options, compact)
         return HDFGraphList(file)
 
     @staticmethod
-    def _append_graphlist(file: h5py.File, graphlist: GraphList):
+    def _append_graphlist(file: h5py.File, graphlist: GraphList, storage_options=None, compact=False):
         """Writes GraphList to a HDF file.
         If the HDF file exists already the GraphList are appended, otherwise the file is created.
         Beware that attributes of the existing GraphList in the file and GraphList to append
@@ -92,61 +537,9 @@ class HDFGraphList(GraphList):
         Args:
             file (h5py.File): HDF file to write to.
             graphlist (GraphList): GraphList dataset to append to the file.
+            storage_options (Dict[str, dict], optional): Compression and chunking options of datasets
+                which do not exist yet, see `HDFGraphListWriter`. Defaults to None.
+            compact (bool, optional): Whether to create topology datasets with compact dtypes. Defaults to False.
         """
-    
-        # Check if file existed before (i.e. contains some graphlists already)
-        file_exists = "num_nodes" in file.keys()
-    
-        if not file_exists:
-            file.create_group("node_attributes", (0,))
-            file.create_group("edge_attributes")
-            file.create_group("graph_attributes")
-            file.require_dataset("num_nodes", (0,), maxshape=(None,), dtype="i8")
-            file.require_dataset("num_edges", (0,), maxshape=(None,), dtype="i8")
-            file.require_dataset("edge_indices", (0, 2), maxshape=(None, 2), dtype="i8")
-    
-        file["num_nodes"].resize(
-            file["num_nodes"].shape[0] + len(graphlist.num_nodes), axis=0
-        )
-        file["num_nodes"][-graphlist.num_nodes.shape[0] :] = graphlist.num_nodes
-        file["num_edges"].resize(
-            file["num_edges"].shape[0] + len(graphlist.num_edges), axis=0
-        )
-        file["num_edges"][-graphlist.num_edges.shape[0] :] = graphlist.num_edges
-        file["edge_indices"].resize(
-            file["edge_indices"].shape[0] + graphlist.edge_indices.shape[0], axis=0
-        )
-        file["edge_indices"][-graphlist.edge_indices.shape[0] :] = graphlist.edge_indices
-    
-        for node_attr, data in graphlist.node_attributes.items():
-            if not file_exists:
-                file["node_attributes"].create_dataset(
-                    node_attr, data.shape, data=data, maxshape=((None,) + data.shape[1:])
-                )
-            else:
-                file["node_attributes"][node_attr].resize(
-                    file["node_attributes"][node_attr].shape[0] + data.shape[0], axis=0
-                )
-                file["node_attributes"][node_attr][-data.shape[0] :] = data
-    
-        for edge_attr, data in graphlist.edge_attributes.items():
-            if not file_exists:
-                file["edge_attributes"].create_dataset(
-                    edge_attr, data.shape, data=data, maxshape=((None,) + data.shape[1:])
-                )
-            else:
-                file["edge_attributes"][edge_attr].resize(
-                    file["edge_attributes"][edge_attr].shape[0] + data.shape[0], axis=0
-                )
-                file["edge_attributes"][edge_attr][-data.shape[0] :] = data
-    
-        for graph_attr, data in graphlist.graph_attributes.items():
-            if not file_exists:
-                file["graph_attributes"].create_dataset(
-                    graph_attr, data.shape, data=data, maxshape=((None,) + data.shape[1:])
-                )
-            else:
-                file["graph_attributes"][graph_attr].resize(
-                    file["graph_attributes"][graph_attr].shape[0] + data.shape[0], axis=0
-                )
-                file["graph_attributes"][graph_attr][-data.shape[0] :] = data
+        with HDFGraphListWriter(file, storage_options=storage_options, compact=compact) as writer:
+            writer.append(graphlist)
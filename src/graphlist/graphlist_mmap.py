@@ -0,0 +1,207 @@
+import json
+import os
+import numpy as np
+from .graphlist import GraphList, _fits, _min_uint_dtype
+
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+# Widening an array file copies this many rows at a time.
+WIDEN_ROWS = 2**20
+
+
+class MMapGraphList(GraphList):
+    """A subclass of GraphList, which stores every array as raw binary file in a directory
+    and memory-maps it.
+
+    Slices are views into the OS page cache, so no data is copied when reading and all
+    processes reading the same directory share one physical copy of the data.
+    The dtype, trailing shape, number of rows and file name of each array are stored in a
+    small JSON manifest. Pickling a MMapGraphList only pickles its path.
+    """
+
+    file_backed = True
+
+    def __init__(
+        self,
+        path: str,
+        mode: str = "r",
+        node_attribute_names=None,
+        edge_attribute_names=None,
+        graph_attribute_names=None,
+    ):
+        """Opens a MMapGraphList directory.
+        Args:
+            path (str): Directory containing the manifest and array files.
+            mode (str, optional): "r" to open read-only, "a" to allow appending. Defaults to "r".
+            node_attribute_names (list, optional): Node attributes to map. Defaults to all.
+            edge_attribute_names (list, optional): Edge attributes to map. Defaults to all.
+            graph_attribute_names (list, optional): Graph attributes to map. Defaults to all.
+        """
+        if mode not in ("r", "a"):
+            raise ValueError(f"Unsupported mode {mode}, use 'r' or 'a'.")
+        self.path = path
+        self.mode = mode
+        self._selected_names = (node_attribute_names, edge_attribute_names, graph_attribute_names)
+        self._open()
+
+    def _open(self):
+        with open(os.path.join(self.path, MANIFEST)) as f:
+            self.manifest = json.load(f)
+        if self.manifest["version"] > FORMAT_VERSION:
+            raise ValueError(f"Unsupported MMapGraphList version {self.manifest['version']}.")
+        for cached in ["node_starts", "edge_starts", "csr", "csc", "indexes"]:
+            self.__dict__.pop(cached, None)
+        self.num_nodes = self._map(self.manifest["num_nodes"])
+        self.num_edges = self._map(self.manifest["num_edges"])
+        self.edge_indices = self._map(self.manifest["edge_indices"])
+        for attributes, selected in zip(
+            ["node_attributes", "edge_attributes", "graph_attributes"], self._selected_names
+        ):
+            names = list(self.manifest[attributes].keys()) if selected is None else selected
+            setattr(self, attributes, {k: self._map(self.manifest[attributes][k]) for k in names})
+            setattr(self, attributes[:-1] + "_names", names)
+
+    def _map(self, entry: dict) -> np.ndarray:
+        shape = (entry["rows"],) + tuple(entry["shape"])
+        dtype = np.dtype(entry["dtype"])
+        if entry["rows"] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(os.path.join(self.path, entry["file"]), dtype=dtype, mode="r", shape=shape)
+
+    def __reduce__(self):
+        return (MMapGraphList, (self.path, "r") + self._selected_names)
+
+    @staticmethod
+    def from_graphlist(path: str, graphlist: GraphList):
+        """Writes a GraphList into a new MMapGraphList directory.
+        Args:
+            path (str): Directory to create.
+            graphlist (GraphList): The graphs to write.
+        Returns:
+            MMapGraphList: The MMapGraphList opened in append mode.
+        """
+        os.makedirs(path)
+
+        def entry(file, array):
+            return {"file": file, "dtype": array.dtype.str, "shape": list(array.shape[1:]), "rows": 0}
+
+        manifest = {
+            "version": FORMAT_VERSION,
+            "num_nodes": entry("num_nodes.bin", graphlist.num_nodes),
+            "num_edges": entry("num_edges.bin", graphlist.num_edges),
+            "edge_indices": entry("edge_indices.bin", graphlist.edge_indices),
+        }
+        for attributes in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            names = getattr(graphlist, attributes[:-1] + "_names")
+            manifest[attributes] = {
+                k: entry(f"{attributes[:-1]}_{i}.bin", getattr(graphlist, attributes)[k])
+                for i, k in enumerate(names)
+            }
+        for entry_ in _entries(manifest):
+            open(os.path.join(path, entry_["file"]), "wb").close()
+        _write_manifest(path, manifest)
+
+        mmap_graphlist = MMapGraphList(path, mode="a")
+        mmap_graphlist.append_graphlist(graphlist)
+        return mmap_graphlist
+
+    def append_graphlist(self, graphlist: GraphList):
+        """Appends a GraphList to the files and remaps the arrays.
+        The GraphList must have the same attributes with the same trailing shapes and dtypes.
+        Counts and edge indices may have any integer dtype, they are cast to the dtype of the files,
+        which are widened like in `HDFGraphListWriter` if the values do not fit.
+        Args:
+            graphlist (GraphList): The graphs to append.
+        """
+        if self.mode != "a":
+            raise ValueError("MMapGraphList is opened read-only, open it with mode='a' to append.")
+        with open(os.path.join(self.path, MANIFEST)) as f:
+            manifest = json.load(f)
+
+        arrays = [
+            (manifest["num_nodes"], graphlist.num_nodes),
+            (manifest["num_edges"], graphlist.num_edges),
+            (manifest["edge_indices"], graphlist.edge_indices),
+        ]
+        for attributes in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            names = getattr(graphlist, attributes[:-1] + "_names")
+            if set(names) != set(manifest[attributes].keys()):
+                raise ValueError(
+                    f"Cannot append GraphList with {attributes} {names} "
+                    f"to MMapGraphList with {list(manifest[attributes].keys())}."
+                )
+            arrays += [(manifest[attributes][k], getattr(graphlist, attributes)[k]) for k in names]
+
+        data, widened = [], {}
+        for index, (entry, array) in enumerate(arrays):
+            array = np.asarray(array[:])
+            dtype = np.dtype(entry["dtype"])
+            # The first three arrays are the topology: num_nodes, num_edges and edge_indices.
+            if index < 3 and array.dtype != dtype and array.dtype.kind in "iu" and dtype.kind in "iu":
+                if not _fits(array, dtype):
+                    dtype = widened[index] = np.promote_types(dtype, _min_uint_dtype(array))
+                array = array.astype(dtype)
+            if array.shape[1:] != tuple(entry["shape"]) or array.dtype != dtype:
+                raise ValueError(
+                    f"Cannot append array with shape {array.shape[1:]} and dtype {array.dtype} "
+                    f"to {entry['file']} with shape {tuple(entry['shape'])} and dtype {entry['dtype']}."
+                )
+            data.append(array)
+        replaced = []
+        for index, ((entry, _), array) in enumerate(zip(arrays, data)):
+            if index in widened:
+                replaced.append(entry["file"])
+                self._widen(entry, widened[index])
+            with open(os.path.join(self.path, entry["file"]), "r+b") as f:
+                # Drop data of an append which was interrupted before the manifest was written.
+                f.seek(entry["rows"] * array.dtype.itemsize * int(np.prod(entry["shape"])))
+                f.truncate()
+                np.ascontiguousarray(array).tofile(f)
+            entry["rows"] += array.shape[0]
+        _write_manifest(self.path, manifest)
+        for file in replaced:
+            os.remove(os.path.join(self.path, file))
+        self._open()
+
+    def _widen(self, entry: dict, dtype: np.dtype):
+        """Copies the rows of an array file into a new file with a wider dtype and points the entry to it.
+        The old file stays valid for readers until the manifest referring to the new file is written.
+        """
+        rows = self._map(entry)
+        file = f"{entry['file'].split('.')[0]}.{dtype.str[1:]}.bin"
+        with open(os.path.join(self.path, file), "wb") as f:
+            for start in range(0, len(rows), WIDEN_ROWS):
+                np.ascontiguousarray(rows[start : start + WIDEN_ROWS], dtype=dtype).tofile(f)
+        entry["file"], entry["dtype"] = file, dtype.str
+
+    @staticmethod
+    def from_hdf(path: str, hdf_graphlist: GraphList, batch_size: int = 100000):
+        """Converts a HDFGraphList into a MMapGraphList, reading batch_size graphs at a time.
+        Args:
+            path (str): Directory to create.
+            hdf_graphlist (HDFGraphList): The graphs to convert.
+            batch_size (int, optional): Number of graphs read and written at once. Defaults to 100000.
+        Returns:
+            MMapGraphList: The MMapGraphList opened in append mode.
+        """
+        if len(hdf_graphlist) == 0:
+            return MMapGraphList.from_graphlist(path, hdf_graphlist._get_subslice([]))
+        mmap_graphlist = MMapGraphList.from_graphlist(path, hdf_graphlist[0:batch_size])
+        for start in range(batch_size, len(hdf_graphlist), batch_size):
+            mmap_graphlist.append_graphlist(hdf_graphlist[start : start + batch_size])
+        return mmap_graphlist
+
+
+def _entries(manifest: dict) -> list:
+    entries = [manifest["num_nodes"], manifest["num_edges"], manifest["edge_indices"]]
+    for attributes in ["node_attributes", "edge_attributes", "graph_attributes"]:
+        entries += list(manifest[attributes].values())
+    return entries
+
+
+def _write_manifest(path: str, manifest: dict):
+    """Writes the manifest atomically, so readers never see a partially written manifest."""
+    tmp_path = os.path.join(path, MANIFEST + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, MANIFEST))
@@ -0,0 +1,226 @@
+import os
+import h5py
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Sequence
+from .graphlist import GraphList, _exclusive_cumsum, _imap_ordered, _normalize_indices
+from .graphlist_hdf import HDFGraphList
+
+
+class ShardedGraphList(GraphList):
+    """A GraphList spanning several GraphLists (shards), e.g. one HDFGraphList per file,
+    behind one global index.
+
+    Graph i of the ShardedGraphList is graph i - shard_offsets[s] of shard s, where s is found by
+    a binary search in the cumulative number of graphs per shard. Indexing with a list of graphs
+    reads from all involved shards in parallel threads. Note that h5py serializes reads within a
+    process, so HDF shards profit less from parallel reads than memory-mapped shards.
+    Edge indices and node, edge and graph attributes are only accessible through indexing or `copy`.
+    """
+
+    reduce_chunk_graphs = 65536
+    iter_block_graphs = 4096
+    file_backed = True
+
+    def __init__(self, shards: Sequence[GraphList], num_threads: int = 4):
+        """Initializes ShardedGraphList.
+        Args:
+            shards (Sequence[GraphList]): The shards in order. All shards must have the same attributes.
+            num_threads (int, optional): Number of threads reading from the shards. Defaults to 4.
+        """
+        if len(shards) == 0:
+            raise ValueError("Need at least one shard.")
+        first = shards[0]
+        for shard in shards[1:]:
+            for names in ["node_attribute_names", "edge_attribute_names", "graph_attribute_names"]:
+                if set(getattr(shard, names)) != set(getattr(first, names)):
+                    raise ValueError(
+                        f"All shards must have the same {names}: {getattr(first, names)} and {getattr(shard, names)}."
+                    )
+        self.shards = list(shards)
+        self.num_threads = num_threads
+        self.executor = None
+        self.files = []
+        self.shard_offsets = _exclusive_cumsum([len(shard) for shard in self.shards] + [0])
+        self.num_nodes = np.concatenate([np.asarray(shard.num_nodes[:], dtype=np.int64) for shard in self.shards])
+        self.num_edges = np.concatenate([np.asarray(shard.num_edges[:], dtype=np.int64) for shard in self.shards])
+        self.node_attribute_names = list(first.node_attribute_names)
+        self.edge_attribute_names = list(first.edge_attribute_names)
+        self.graph_attribute_names = list(first.graph_attribute_names)
+
+    @staticmethod
+    def open(paths: Sequence[str], num_threads: int = 4, **kwargs) -> "ShardedGraphList":
+        """Opens HDF files as shards of a ShardedGraphList. Close them with `close`.
+        Args:
+            paths (Sequence[str]): The HDF files in order.
+            num_threads (int, optional): Number of threads reading from the shards. Defaults to 4.
+            **kwargs: Keyword arguments of HDFGraphList, e.g. cache_bytes. cache_bytes is the
+                budget of all shards together, each shard gets an equal share of it.
+        Returns:
+            ShardedGraphList: The graphs of all files.
+        """
+        if kwargs.get("cache_bytes", 0) > 0 and len(paths) > 0:
+            kwargs["cache_bytes"] = max(kwargs["cache_bytes"] // len(paths), 1)
+        files = [h5py.File(path, "r") for path in paths]
+        sharded = ShardedGraphList([HDFGraphList(f, **kwargs) for f in files], num_threads=num_threads)
+        sharded.files = files
+        return sharded
+
+    def close(self):
+        """Closes the files opened by `open` and stops the reading threads, including those of HDF shards."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        for shard in self.shards:
+            if isinstance(shard, HDFGraphList):
+                shard.close()
+        for f in self.files:
+            f.close()
+        self.files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def locate(self, indices) -> tuple:
+        """Maps global graph indices to shards.
+        Args:
+            indices (np.ndarray): Global graph indices.
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The shard of each graph and its index within the shard.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        shard_ids = np.searchsorted(self.shard_offsets, indices, side="right") - 1
+        return shard_ids, indices - self.shard_offsets[shard_ids]
+
+    def _map(self, function, items: list) -> list:
+        if len(items) == 1 or self.num_threads <= 1:
+            return [function(*item) for item in items]
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.num_threads)
+        return list(self.executor.map(lambda item: function(*item), items))
+
+    def _get_range(self, start: int, stop: int):
+        first_shard, last_shard = self.locate([start, stop - 1])[0]
+        items = [
+            (
+                self.shards[s],
+                max(start - int(self.shard_offsets[s]), 0),
+                min(stop, int(self.shard_offsets[s + 1])) - int(self.shard_offsets[s]),
+            )
+            for s in range(first_shard, last_shard + 1)
+        ]
+        # Empty shards in between contribute no graphs.
+        items = [item for item in items if item[2] > item[1]]
+        parts = self._map(lambda shard, local_start, local_stop: shard._get_range(local_start, local_stop), items)
+        return parts[0] if len(parts) == 1 else GraphList.concatenate(parts)
+
+    def _get_subslice(self, indices):
+        indices = _normalize_indices(indices, len(self))
+        if len(indices) == 0:
+            return self.shards[0]._get_subslice(indices)
+        shard_ids, local_indices = self.locate(indices)
+        # Group the requested graphs by shard, keeping their order within each shard.
+        order = np.argsort(shard_ids, kind="stable")
+        boundaries = np.flatnonzero(np.diff(shard_ids[order])) + 1
+        groups = np.split(order, boundaries)
+        items = [(self.shards[shard_ids[group[0]]], local_indices[group]) for group in groups]
+        parts = self._map(lambda shard, local: shard._get_subslice(local), items)
+        if len(parts) == 1:
+            return parts[0]
+        graphs = GraphList.concatenate(parts)
+        if np.all(order[1:] > order[:-1]):
+            return graphs
+        # Restore the requested order, position order[k] of the request is graph k of the concatenation.
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        return graphs._get_subslice(inverse)
+
+    def _unsupported(self, name: str):
+        raise TypeError(f"ShardedGraphList has no {name} of all graphs, index it or use copy() instead.")
+
+    @property
+    def edge_indices(self):
+        self._unsupported("edge_indices")
+
+    @property
+    def node_attributes(self):
+        self._unsupported("node_attributes")
+
+    @property
+    def edge_attributes(self):
+        self._unsupported("edge_attributes")
+
+    @property
+    def graph_attributes(self):
+        self._unsupported("graph_attributes")
+
+    @property
+    def csr(self):
+        self._unsupported("CSR index")
+
+    @property
+    def csc(self):
+        self._unsupported("CSC index")
+
+    def _column(self, name: str) -> np.ndarray:
+        if name in ("num_nodes", "num_edges"):
+            return getattr(self, name)
+        if name not in self.graph_attribute_names:
+            raise KeyError(f"Unknown column {name}.")
+        return np.concatenate([shard._column(name) for shard in self.shards])
+
+    def copy(self) -> GraphList:
+        """Reads all graphs of all shards into one in-memory GraphList.
+        Returns:
+            GraphList: The graphs.
+        """
+        graphs = self._get_range(0, len(self)) if len(self) > 0 else self._get_subslice([])
+        return graphs.copy()
+
+    @staticmethod
+    def from_graphlist(
+        paths: Sequence[str], graphlist: GraphList, num_workers: int = 0, storage_options=None, compact=False
+    ) -> "ShardedGraphList":
+        """Writes a GraphList into HDF files, one contiguous shard per file, and opens them.
+        The shards hold about the same number of nodes and edges. With num_workers > 0 the shards
+        are written by parallel processes.
+        Args:
+            paths (Sequence[str]): HDF files to create, one per shard.
+            graphlist (GraphList): The graphs to write.
+            num_workers (int, optional): Number of processes writing shards, 0 writes in this process.
+                Defaults to 0.
+            storage_options (Dict[str, dict], optional): See `HDFGraphListWriter`. Defaults to None.
+            compact (bool, optional): See `HDFGraphListWriter`. Defaults to False.
+        Returns:
+            ShardedGraphList: The opened shards.
+        """
+        sizes = np.asarray(graphlist.num_nodes[:], dtype=np.int64) + np.asarray(graphlist.num_edges[:], dtype=np.int64)
+        cumulative = np.cumsum(sizes)
+        total = cumulative[-1] if len(sizes) > 0 else 0
+        targets = total * np.arange(1, len(paths)) / len(paths)
+        bounds = np.concatenate([[0], np.searchsorted(cumulative, targets, side="right"), [len(graphlist)]])
+        write = partial(_write_shard, storage_options=storage_options, compact=compact)
+        items = [
+            (path, graphlist[int(start) : int(stop)] if stop > start else graphlist._get_subslice([]))
+            for path, start, stop in zip(paths, bounds[:-1], bounds[1:])
+        ]
+        if num_workers > 0:
+            list(_imap_ordered(write, items, num_workers))
+        else:
+            list(map(write, items))
+        return ShardedGraphList.open(paths)
+
+    def __repr__(self):
+        return f"ShardedGraphList containing {len(self)} graphs in {len(self.shards)} shards."
+
+
+def _write_shard(item, storage_options=None, compact=False):
+    path, graphlist = item
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with h5py.File(path, "w") as f:
+        HDFGraphList.from_graphlist(f, graphlist, storage_options=storage_options, compact=compact)
+    return path
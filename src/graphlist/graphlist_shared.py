@@ -0,0 +1,148 @@
+import ctypes
+import os
+import sys
+import threading
+import weakref
+import numpy as np
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple, Tuple
+from .graphlist import GraphList
+
+# Offsets of the arrays within the segment are aligned to cache lines.
+ALIGNMENT = 64
+
+
+class SharedMemoryHandle(NamedTuple):
+    """Picklable descriptor of a GraphList in shared memory: the segment name and, for every array,
+    its group ("" for num_nodes, num_edges and edge_indices), name, dtype, shape and byte offset.
+    """
+
+    name: str
+    size: int
+    arrays: Tuple[Tuple[str, str, str, Tuple[int, ...], int], ...]
+
+
+class _Segment(shared_memory.SharedMemory):
+    """SharedMemory, which stays mapped as long as arrays reference it.
+    close() fails with a BufferError while arrays exist, the mapping is then released with the
+    last array instead of being unmapped underneath it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The file descriptor is not needed once the segment is mapped.
+        if os.name == "posix" and self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def close(self):
+        try:
+            super().close()
+        except BufferError:
+            pass
+
+    def __del__(self):
+        self.close()
+
+
+# Segments created by this process, so that attaching to them in this process reuses the mapping.
+_owned_segments = weakref.WeakValueDictionary()
+_attach_lock = threading.Lock()
+
+
+def _attach(name: str) -> _Segment:
+    if name in _owned_segments:
+        return _owned_segments[name]
+    if sys.version_info >= (3, 13):
+        return _Segment(name=name, track=False)
+    # Before Python 3.13 attaching registers the segment with the resource tracker, which would
+    # unlink it when this process exits, although the process which created it still uses it.
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return _Segment(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedGraphList(GraphList):
+    """A subclass of GraphList, whose arrays are stored in one shared memory segment.
+
+    Pickling a SharedGraphList only pickles its SharedMemoryHandle, unpickling attaches to the
+    segment, so worker processes share one physical copy of the data instead of receiving a
+    private copy of every array.
+    The segment is unlinked when the SharedGraphList created by `to_shared_memory` is garbage
+    collected or `unlink` is called. Processes which are attached keep their mapping until their
+    last array is released, but no new process can attach afterwards.
+    """
+
+    def __init__(self, handle: SharedMemoryHandle):
+        """Attaches to a GraphList in shared memory.
+        Args:
+            handle (SharedMemoryHandle): Handle returned by `to_shared_memory().handle`.
+        """
+        self.handle = handle
+        self.segment = _attach(handle.name)
+        buffer = (ctypes.c_char * handle.size).from_buffer(self.segment.buf)
+        arrays = {"": {}, "node_attributes": {}, "edge_attributes": {}, "graph_attributes": {}}
+        for group, name, dtype, shape, offset in handle.arrays:
+            dtype = np.dtype(dtype)
+            count = int(np.prod(shape))
+            if count == 0:
+                arrays[group][name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[group][name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+        self.num_nodes = arrays[""]["num_nodes"]
+        self.num_edges = arrays[""]["num_edges"]
+        self.edge_indices = arrays[""]["edge_indices"]
+        for group in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            setattr(self, group, arrays[group])
+            setattr(self, group[:-1] + "_names", list(arrays[group].keys()))
+
+    def __reduce__(self):
+        return (SharedGraphList, (self.handle,))
+
+    @staticmethod
+    def from_graphlist(graphlist: GraphList) -> "SharedGraphList":
+        """Copies a GraphList into a new shared memory segment.
+        Args:
+            graphlist (GraphList): The graphs to copy.
+        Returns:
+            SharedGraphList: The graphs in shared memory, which own the segment.
+        """
+        arrays = [
+            ("", "num_nodes", graphlist.num_nodes),
+            ("", "num_edges", graphlist.num_edges),
+            ("", "edge_indices", graphlist.edge_indices),
+        ]
+        for group in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            names = getattr(graphlist, group[:-1] + "_names")
+            arrays += [(group, name, getattr(graphlist, group)[name]) for name in names]
+        arrays = [(group, name, np.asarray(array[:])) for group, name, array in arrays]
+
+        layout, size = [], 0
+        for group, name, array in arrays:
+            layout.append((group, name, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        segment = _Segment(create=True, size=max(size, 1))
+        for (_, _, array), (_, _, _, _, offset) in zip(arrays, layout):
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf, offset=offset)[...] = array
+        _owned_segments[segment.name] = segment
+        shared_graphlist = SharedGraphList(SharedMemoryHandle(segment.name, max(size, 1), tuple(layout)))
+        shared_graphlist._finalizer = weakref.finalize(shared_graphlist, _unlink, segment)
+        return shared_graphlist
+
+    def unlink(self):
+        """Removes the segment, once all attached processes released it, its memory is freed.
+        Only the SharedGraphList created by `to_shared_memory` can unlink the segment.
+        """
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is None:
+            raise ValueError("Only the SharedGraphList which created the segment can unlink it.")
+        finalizer()
+
+
+def _unlink(segment: _Segment):
+    _owned_segments.pop(segment.name, None)
+    segment.unlink()
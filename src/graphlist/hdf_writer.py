@@ -0,0 +1,249 @@
+import h5py
+import numpy as np
+from typing import Dict, Optional
+from .graphlist import GraphList, _add_missing_attributes, _exclusive_cumsum, _fits, _min_uint_dtype
+
+TOPOLOGY = {"num_nodes", "num_edges", "edge_indices"}
+# Persisted int64 offsets of the graphs, by the counts they are computed from.
+OFFSETS = {"node_starts": "num_nodes", "edge_starts": "num_edges"}
+DERIVED_GROUPS = ["csr", "csc", "indexes"]
+
+STORAGE_OPTIONS = {"compression", "compression_opts", "shuffle", "scaleoffset", "fletcher32", "chunk_rows"}
+
+
+class HDFGraphListWriter:
+    """Appends GraphLists to a HDF file with few, large writes.
+
+    Incoming GraphLists are buffered in memory until `buffer_bytes` is exceeded and then
+    written with one write per dataset. Datasets grow geometrically, so that they are only
+    resized a logarithmic number of times, and their chunk shapes are chosen from the average
+    graph size of the first flush. On close the buffer is flushed and every dataset is trimmed
+    to the number of rows actually written.
+    The offsets of the graphs (node_starts and edge_starts) are written along with the counts,
+    so that readers do not need to compute them. Files without offsets get them on the first write.
+
+    Usage:
+        with HDFGraphListWriter(file) as writer:
+            for graphlist in batches:
+                writer.append(graphlist)
+    """
+
+    def __init__(
+        self,
+        file: h5py.File,
+        buffer_bytes: int = 64 * 2**20,
+        chunk_bytes: int = 2**20,
+        growth_factor: float = 2.0,
+        storage_options: Optional[Dict[str, dict]] = None,
+        compact: bool = False,
+    ):
+        """Initializes HDFGraphListWriter.
+        Args:
+            file (h5py.File): HDF file to write to. Graphs already in the file are kept.
+            buffer_bytes (int, optional): Number of buffered bytes which trigger a flush. Defaults to 64 MiB.
+            chunk_bytes (int, optional): Targeted size of a HDF chunk in bytes. Defaults to 1 MiB.
+            growth_factor (float, optional): Factor by which datasets grow when they are full. Defaults to 2.
+            storage_options (Dict[str, dict], optional): Storage options of datasets created by the writer,
+                keyed by dataset path (e.g. "edge_indices" or "node_attributes/position").
+                The key "default" applies to all datasets without own entry. Supported options are
+                compression ("gzip" or "lzf"), compression_opts (gzip level), shuffle (bool),
+                scaleoffset (int), fletcher32 (bool) and chunk_rows (int, overrides the automatic
+                chunk shape). Defaults to None (uncompressed).
+            compact (bool, optional): Whether to create num_nodes, num_edges and edge_indices with the
+                smallest unsigned integer dtype which can hold them, instead of int64. Topology datasets
+                are widened whenever appended data needs more range. Defaults to False.
+        """
+        storage_options = dict() if storage_options is None else storage_options
+        for name, options in storage_options.items():
+            unknown = set(options.keys()) - STORAGE_OPTIONS
+            if len(unknown) > 0:
+                raise ValueError(f"Unknown storage options {sorted(unknown)} for {name}.")
+        self.file = file
+        self.buffer_bytes = buffer_bytes
+        self.chunk_bytes = chunk_bytes
+        self.growth_factor = growth_factor
+        self.storage_options = storage_options
+        self.compact = compact
+        self.buffer = []
+        self.buffered_bytes = 0
+        for group in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            self.file.require_group(group)
+        # Number of rows written to each dataset, which may be smaller than its capacity.
+        self.rows = {}
+        for name in ["num_nodes", "num_edges", "edge_indices", *OFFSETS]:
+            if name in self.file:
+                self.rows[name] = self.file[name].shape[0]
+        for group in ["node_attributes", "edge_attributes", "graph_attributes"]:
+            for name, dataset in self.file[group].items():
+                self.rows[f"{group}/{name}"] = dataset.shape[0]
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, graphlist: GraphList):
+        """Buffers a GraphList and flushes the buffer once it exceeds `buffer_bytes`.
+        Args:
+            graphlist (GraphList): GraphList to append.
+        """
+        if self.closed:
+            raise ValueError("Cannot append to a closed HDFGraphListWriter.")
+        self.buffer.append(graphlist)
+        self.buffered_bytes += _nbytes(graphlist)
+        if self.buffered_bytes >= self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered GraphLists to the file."""
+        if len(self.buffer) == 0:
+            return
+        graphlist = GraphList.concatenate(_add_missing_attributes(self.buffer))
+        self.buffer = []
+        self.buffered_bytes = 0
+        self._write_missing_offsets()
+
+        num_graphs = len(graphlist)
+        nodes_per_graph = graphlist.num_nodes.sum() / max(num_graphs, 1)
+        edges_per_graph = graphlist.num_edges.sum() / max(num_graphs, 1)
+        writes = [
+            ("num_nodes", graphlist.num_nodes, 1, "num_graphs"),
+            ("num_edges", graphlist.num_edges, 1, "num_graphs"),
+            ("edge_indices", graphlist.edge_indices, edges_per_graph, "num_edges"),
+        ]
+        for name, counts in OFFSETS.items():
+            starts = self._total(name) + _exclusive_cumsum(getattr(graphlist, counts))
+            writes.append((name, starts, 1, "num_graphs"))
+        for group, attributes, rows_per_graph, count in [
+            ("node_attributes", graphlist.node_attributes, nodes_per_graph, "num_nodes"),
+            ("edge_attributes", graphlist.edge_attributes, edges_per_graph, "num_edges"),
+            ("graph_attributes", graphlist.graph_attributes, 1, "num_graphs"),
+        ]:
+            writes += [(f"{group}/{name}", data, rows_per_graph, count) for name, data in attributes.items()]
+
+        # Datasets can only be created as long as no rows were written for them.
+        for name, data, rows_per_graph, count in writes:
+            if name not in self.file:
+                if self._written(count) > 0:
+                    raise ValueError(f"Cannot append {name}, which is missing in the file.")
+        for name, data, rows_per_graph, count in writes:
+            if name not in self.file:
+                self._create_dataset(name, data, rows_per_graph)
+            self._write(name, data)
+        # Persisted indices over the graphs are outdated now.
+        for name in DERIVED_GROUPS:
+            if name in self.file:
+                del self.file[name]
+
+    def _write(self, name: str, data: np.ndarray):
+        dataset = self.file[name]
+        if dataset.shape[1:] != data.shape[1:]:
+            raise ValueError(
+                f"Cannot append {name} with shape {data.shape[1:]} to dataset with shape {dataset.shape[1:]}."
+            )
+        if name in TOPOLOGY and not _fits(data, dataset.dtype):
+            dataset = self._widen(name, self._topology_dtype(data, dataset.dtype))
+        start = self.rows[name]
+        stop = start + data.shape[0]
+        if stop > dataset.shape[0]:
+            dataset.resize(max(stop, int(dataset.shape[0] * self.growth_factor)), axis=0)
+        if stop > start:
+            dataset[start:stop] = data
+        self.rows[name] = stop
+
+    def _written(self, count: str) -> int:
+        """Returns the number of graphs, nodes or edges written so far."""
+        if count == "num_graphs":
+            return self.rows.get("num_nodes", 0)
+        return self._total("node_starts" if count == "num_nodes" else "edge_starts")
+
+    def _total(self, name: str) -> int:
+        """Returns the number of nodes or edges written so far from the last persisted offset."""
+        rows = self.rows.get(name, 0)
+        if rows == 0:
+            return 0
+        return int(self.file[name][rows - 1]) + int(self.file[OFFSETS[name]][rows - 1])
+
+    def _write_missing_offsets(self):
+        """Writes the offsets of graphs, which were written without offsets, e.g. by older versions."""
+        for name, counts in OFFSETS.items():
+            rows = self.rows.get(counts, 0)
+            if self.rows.get(name, 0) == rows:
+                continue
+            if name in self.file:
+                del self.file[name]
+            self.rows.pop(name, None)
+            if rows > 0:
+                starts = _exclusive_cumsum(np.asarray(self.file[counts][:rows]))
+                self._create_dataset(name, starts, 1)
+                self._write(name, starts)
+
+    def _create_dataset(self, name: str, data: np.ndarray, rows_per_graph: float):
+        options = dict(self.storage_options.get(name, self.storage_options.get("default", {})))
+        chunk_rows = options.pop("chunk_rows", None)
+        if chunk_rows is None:
+            row_bytes = max(data.dtype.itemsize * int(np.prod(data.shape[1:])), 1)
+            # Chunks hold a whole number of average sized graphs, but at least one row.
+            rows_per_graph = max(int(round(rows_per_graph)), 1)
+            chunk_rows = max(self.chunk_bytes // row_bytes // rows_per_graph, 1) * rows_per_graph
+        self.file.create_dataset(
+            name,
+            shape=(max(data.shape[0], chunk_rows),) + data.shape[1:],
+            maxshape=(None,) + data.shape[1:],
+            chunks=(chunk_rows,) + data.shape[1:],
+            dtype=self._topology_dtype(data) if name in TOPOLOGY else data.dtype,
+            **options,
+        )
+        self.rows[name] = 0
+
+    def _topology_dtype(self, data: np.ndarray, current: Optional[np.dtype] = None) -> np.dtype:
+        """Returns the dtype for a new topology dataset, or the dtype to which the current
+        (compact) dtype must be widened to hold data.
+        """
+        if current is not None:
+            return np.promote_types(current, _min_uint_dtype(np.asarray(data)))
+        return _min_uint_dtype(np.asarray(data)) if self.compact else np.dtype("i8")
+
+    def _widen(self, name: str, dtype: np.dtype) -> h5py.Dataset:
+        """Replaces a dataset by a copy with a wider dtype and the same storage options."""
+        dataset = self.file[name]
+        widened = self.file.create_dataset(
+            name + "__widened",
+            shape=dataset.shape,
+            maxshape=dataset.maxshape,
+            chunks=dataset.chunks,
+            dtype=dtype,
+            compression=dataset.compression,
+            compression_opts=dataset.compression_opts,
+            shuffle=dataset.shuffle,
+            fletcher32=dataset.fletcher32,
+            scaleoffset=dataset.scaleoffset,
+        )
+        rows = self.rows[name]
+        step = max(dataset.chunks[0], self.chunk_bytes // max(dataset.dtype.itemsize, 1))
+        for start in range(0, rows, step):
+            stop = min(start + step, rows)
+            widened[start:stop] = dataset[start:stop]
+        del self.file[name]
+        self.file.move(name + "__widened", name)
+        return self.file[name]
+
+    def close(self):
+        """Flushes the buffer and trims all datasets to the number of written rows."""
+        if self.closed:
+            return
+        self.flush()
+        self._write_missing_offsets()
+        for name, rows in self.rows.items():
+            if self.file[name].shape[0] != rows:
+                self.file[name].resize(rows, axis=0)
+        self.closed = True
+
+
+def _nbytes(graphlist: GraphList) -> int:
+    arrays = [graphlist.num_nodes, graphlist.num_edges, graphlist.edge_indices]
+    for attributes in [graphlist.node_attributes, graphlist.edge_attributes, graphlist.graph_attributes]:
+        arrays += list(attributes.values())
+    return sum(array.nbytes for array in arrays)
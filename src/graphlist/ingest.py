@@ -0,0 +1,188 @@
+import itertools
+import os
+import numpy as np
+from typing import Dict, Iterator, List, Optional
+from .graphlist import GraphList
+
+
+def read_table(
+    source, chunk_rows: int = 1000000, delimiter: str = ",", dtypes: Optional[dict] = None
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Reads a table in chunks of rows.
+    Args:
+        source: Path of a CSV file with a header line, of a .npy file with a structured array or of
+            a .npz file with one array per column, or a structured array or dict of arrays in memory.
+            CSV files and .npy files are read chunk by chunk, .npz files column by column.
+        chunk_rows (int, optional): Number of rows per chunk. Defaults to 1000000.
+        delimiter (str, optional): Delimiter of CSV files. Defaults to ",".
+        dtypes (dict, optional): dtypes of CSV columns by name. Defaults to float64 for all columns.
+    Yields:
+        Dict[str, np.ndarray]: The columns of the next chunk of rows.
+    """
+    if isinstance(source, (str, os.PathLike)) and str(source).endswith(".csv"):
+        yield from _read_csv(source, chunk_rows, delimiter, dtypes or {})
+        return
+    if isinstance(source, (str, os.PathLike)) and str(source).endswith(".npy"):
+        source = np.load(source, mmap_mode="r")
+    elif isinstance(source, (str, os.PathLike)) and str(source).endswith(".npz"):
+        source = np.load(source)
+    elif isinstance(source, (str, os.PathLike)):
+        raise ValueError(f"Unsupported table {source}, use a .csv, .npy or .npz file.")
+
+    if isinstance(source, np.ndarray):
+        if source.dtype.names is None:
+            raise ValueError("Tables stored as arrays must have a structured dtype with one field per column.")
+        columns, num_rows = {name: source[name] for name in source.dtype.names}, len(source)
+    else:
+        columns = {name: source[name] for name in source.keys()}
+        num_rows = len(next(iter(columns.values()))) if len(columns) > 0 else 0
+        if any(len(column) != num_rows for column in columns.values()):
+            raise ValueError("All columns of a table must have the same number of rows.")
+    # Empty tables yield one empty chunk, so that their columns are known.
+    for start in range(0, max(num_rows, 1), chunk_rows):
+        yield {name: np.asarray(column[start : start + chunk_rows]) for name, column in columns.items()}
+
+
+def _read_csv(path, chunk_rows: int, delimiter: str, dtypes: dict) -> Iterator[Dict[str, np.ndarray]]:
+    with open(path) as f:
+        names = [name.strip() for name in f.readline().strip().split(delimiter)]
+        first = True
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if len(lines) == 0 and not first:
+                return
+            first = False
+            # Every column is parsed with its own dtype, so that large integers do not pass through float64.
+            dtype = np.dtype([(name, dtypes.get(name, np.float64)) for name in names])
+            if len(lines) == 0:
+                values = np.zeros(0, dtype=dtype)
+            else:
+                try:
+                    values = np.loadtxt(lines, delimiter=delimiter, ndmin=1, dtype=dtype)
+                except ValueError as e:
+                    raise ValueError(f"Cannot parse the rows of {path} with the {len(names)} columns of its header: {e}")
+            yield {name: values[name].copy() for name in names}
+
+
+class _Stream:
+    """Buffers the rows of a table sorted by graph id, which are read chunk by chunk."""
+
+    def __init__(self, chunks: Iterator[Dict[str, np.ndarray]], graph_id: str, name: str):
+        self.chunks = chunks
+        self.graph_id = graph_id
+        self.name = name
+        self.buffer = []
+        self.done = False
+        self.last_id = None
+        # Number of rows taken from the stream so far.
+        self.taken = 0
+
+    def read(self):
+        """Reads the next chunk into the buffer."""
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.done = True
+            return
+        ids = np.asarray(chunk[self.graph_id], dtype=np.int64)
+        if np.any(np.diff(ids) < 0) or (self.last_id is not None and len(ids) > 0 and ids[0] < self.last_id):
+            raise ValueError(f"The {self.name} must be sorted by {self.graph_id}.")
+        if len(ids) > 0:
+            self.last_id = ids[-1]
+        chunk[self.graph_id] = ids
+        self.buffer.append(chunk)
+
+    def complete_before(self) -> float:
+        """Returns the graph id, before which all graphs are completely buffered."""
+        return np.inf if self.done else (self.last_id if self.last_id is not None else -np.inf)
+
+    def take(self, bound: float) -> Dict[str, np.ndarray]:
+        """Removes and returns all buffered rows with a graph id below bound."""
+        if len(self.buffer) == 0:
+            return {}
+        rows = {k: np.concatenate([chunk[k] for chunk in self.buffer]) for k in self.buffer[0].keys()}
+        split = int(np.searchsorted(rows[self.graph_id], bound, side="left"))
+        # The remaining rows stay buffered, an empty remainder keeps the columns known.
+        self.buffer = [{k: v[split:] for k, v in rows.items()}]
+        self.taken += split
+        return {k: v[:split] for k, v in rows.items()}
+
+
+def stream_graphlists(
+    edges,
+    nodes=None,
+    graph_id: str = "graph_id",
+    source: str = "source",
+    target: str = "target",
+    node_attribute_names: Optional[List[str]] = None,
+    edge_attribute_names: Optional[List[str]] = None,
+    global_indices: bool = False,
+    chunk_rows: int = 1000000,
+    **read_options,
+) -> Iterator[GraphList]:
+    """Groups the rows of an edge table and an optional node table, both sorted by graph id, into graphs.
+    Only about one chunk of rows of each table is held in memory.
+    Graphs are given by the graph ids of the node table, or of the edge table if there is no node table,
+    in which case the number of nodes of a graph is its largest node index plus one.
+    See `HDFGraphList.from_tables` for the arguments.
+    Yields:
+        GraphList: Consecutive graphs.
+    """
+    edge_stream = _Stream(read_table(edges, chunk_rows, **read_options), graph_id, "edges")
+    node_stream = None if nodes is None else _Stream(read_table(nodes, chunk_rows, **read_options), graph_id, "nodes")
+    streams = [edge_stream] if node_stream is None else [edge_stream, node_stream]
+    while not all(stream.done for stream in streams):
+        # Read from the stream which lags behind, so that both cover about the same graphs.
+        min(streams, key=lambda stream: (stream.done, stream.complete_before())).read()
+        bound = min(stream.complete_before() for stream in streams)
+        graphlist = _graphs_before(
+            bound, edge_stream, node_stream, graph_id, source, target,
+            node_attribute_names, edge_attribute_names, global_indices,
+        )
+        if graphlist is not None:
+            yield graphlist
+
+
+def _graphs_before(
+    bound, edge_stream, node_stream, graph_id, source, target,
+    node_attribute_names, edge_attribute_names, global_indices,
+) -> Optional[GraphList]:
+    """Builds a GraphList of the graphs with a graph id below bound, returns None if there are none."""
+    node_offset = 0 if node_stream is None else node_stream.taken
+    edge_rows = edge_stream.take(bound)
+    node_rows = None if node_stream is None else node_stream.take(bound)
+    if graph_id not in edge_rows or node_rows is not None and graph_id not in node_rows:
+        return None
+    edge_ids = edge_rows[graph_id]
+    node_ids = edge_ids if node_rows is None else node_rows[graph_id]
+    graph_ids, num_nodes = np.unique(node_ids, return_counts=True)
+    if len(graph_ids) == 0:
+        if len(edge_ids) > 0:
+            raise ValueError("The edge table contains graph ids, which are missing in the node table.")
+        return None
+    positions = np.searchsorted(graph_ids, edge_ids)
+    if np.any(positions >= len(graph_ids)) or np.any(graph_ids[np.minimum(positions, len(graph_ids) - 1)] != edge_ids):
+        raise ValueError("The edge table contains graph ids, which are missing in the node table.")
+    num_edges = np.bincount(positions, minlength=len(graph_ids))
+    edge_indices = np.stack([edge_rows[source], edge_rows[target]], axis=1).astype(np.int64)
+
+    def select(rows, names, exclude):
+        if rows is None:
+            return {}
+        names = [k for k in rows.keys() if k not in exclude] if names is None else names
+        missing = set(names) - set(rows.keys())
+        if len(missing) > 0:
+            raise ValueError(f"Columns {sorted(missing)} are missing.")
+        return {k: rows[k] for k in names}
+
+    if node_rows is None:
+        num_nodes = None
+    elif global_indices:
+        edge_indices -= node_offset
+    return GraphList.from_arrays(
+        edge_indices,
+        num_nodes=num_nodes,
+        num_edges=num_edges,
+        node_attributes=select(node_rows, node_attribute_names, {graph_id}),
+        edge_attributes=select(edge_rows, edge_attribute_names, {graph_id, source, target}),
+        global_indices=global_indices and node_rows is not None,
+    )
@@ -0,0 +1,130 @@
+"""Opt-in instrumentation of the hot paths of GraphList and HDFGraphList.
+
+When disabled (the default), instrumented functions only check a module level flag.
+When enabled, calls, wall time, gathered graphs and rows and bytes copied are counted per
+operation, and the number of reads, rows and bytes read are counted per HDF dataset.
+
+Usage:
+    from graphlist import instrumentation
+    instrumentation.enable()
+    batch = hdf_graphs[indices]
+    print(instrumentation.stats())
+    instrumentation.add_hook(lambda kind, name, values: metrics.send(kind, name, values))
+
+Setting the environment variable GRAPHLIST_INSTRUMENT=1 enables instrumentation on import.
+"""
+import copy
+import functools
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, List
+
+ENABLED = os.environ.get("GRAPHLIST_INSTRUMENT", "0") not in ("", "0")
+
+_lock = threading.Lock()
+_operations = defaultdict(lambda: {"calls": 0, "seconds": 0.0, "graphs": 0, "rows": 0, "bytes": 0})
+_reads = defaultdict(lambda: {"reads": 0, "rows": 0, "bytes": 0})
+_hooks: List[Callable[[str, str, dict], None]] = []
+
+
+def enable():
+    """Enables counting."""
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    """Disables counting, the counters are kept until `reset`."""
+    global ENABLED
+    ENABLED = False
+
+
+def stats() -> dict:
+    """Returns a snapshot of the counters.
+    Returns:
+        dict: {"operations": {name: {"calls", "seconds", "graphs", "rows", "bytes"}},
+            "reads": {dataset: {"reads", "rows", "bytes"}}}, where rows are the node, edge and
+            graph rows of the returned graphs and bytes are the bytes of newly allocated arrays.
+    """
+    with _lock:
+        return {"operations": copy.deepcopy(dict(_operations)), "reads": copy.deepcopy(dict(_reads))}
+
+
+def reset():
+    """Sets all counters to zero."""
+    with _lock:
+        _operations.clear()
+        _reads.clear()
+
+
+def add_hook(hook: Callable[[str, str, dict], None]):
+    """Registers a callback, which is called for every counted event while instrumentation is enabled.
+    Args:
+        hook (Callable): Called with the kind of event ("operation" or "read"), the name of the
+            operation or dataset and the values of the event, e.g. {"seconds": 0.1, "bytes": 1024}.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[str, str, dict], None]):
+    """Removes a callback registered with `add_hook`."""
+    _hooks.remove(hook)
+
+
+def _emit(kind: str, name: str, counters: dict, values: dict):
+    with _lock:
+        for key, value in values.items():
+            counters[key] += value
+    for hook in _hooks:
+        hook(kind, name, values)
+
+
+def record_operation(name: str, seconds: float, graphs: int = 0, rows: int = 0, nbytes: int = 0):
+    """Counts one call of an operation."""
+    values = {"calls": 1, "seconds": seconds, "graphs": graphs, "rows": rows, "bytes": nbytes}
+    _emit("operation", name, _operations[name], values)
+
+
+def record_read(dataset, data):
+    """Counts one read of a HDF dataset, which returned data."""
+    values = {"reads": 1, "rows": len(data), "bytes": data.nbytes}
+    _emit("read", dataset.name, _reads[dataset.name], values)
+
+
+def _result_size(result):
+    """Returns the number of graphs, rows and newly allocated bytes of a GraphList, GraphBatch or list of graphs."""
+    if isinstance(result, list):
+        return len(result), 0, 0
+    if not hasattr(result, "num_nodes"):
+        return 0, 0, 0
+    if isinstance(result, tuple):
+        fields = list(result)
+    else:
+        fields = [result.num_nodes, result.num_edges, result.edge_indices]
+        fields += [result.node_attributes, result.edge_attributes, result.graph_attributes]
+    arrays = []
+    for field in fields:
+        arrays += [field[k] for k in field.keys()] if hasattr(field, "keys") else [field]
+    num_nodes, num_edges = result.num_nodes[:], result.num_edges[:]
+    # Views share the memory of the GraphList they were taken from, only arrays owning their data were copied.
+    nbytes = sum(a.nbytes for a in arrays if getattr(a, "base", 0) is None)
+    return len(num_nodes), int(num_nodes.sum() + num_edges.sum()) + len(num_nodes), nbytes
+
+
+def instrumented(function):
+    """Decorator counting the calls, wall time and size of the result of a function."""
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not ENABLED:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        record_operation(name, seconds, *_result_size(result))
+        return result
+
+    return wrapper
@@ -0,0 +1,117 @@
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+
+class GraphLoader:
+    """Iterates over mini-batches of a GraphList (or HDFGraphList), whose total number of
+    nodes, edges and graphs stay within a budget.
+
+    Graphs are shuffled and, if bucketing is enabled, sorted by size within windows of
+    `bucket_size` graphs, so that graphs of similar size end up in the same batch and little
+    of the budget is wasted on padding. The order of the batches is shuffled afterwards.
+    Batches are read (and optionally collated) by a thread pool a few steps ahead of the consumer.
+    """
+
+    def __init__(
+        self,
+        graphs,
+        max_nodes: Optional[int] = None,
+        max_edges: Optional[int] = None,
+        max_graphs: Optional[int] = None,
+        shuffle: bool = True,
+        bucket_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        num_threads: int = 2,
+        prefetch: int = 4,
+        collate: Optional[dict] = None,
+    ):
+        """Initializes GraphLoader.
+        Args:
+            graphs (GraphList): The graphs to iterate over.
+            max_nodes (int, optional): Maximum number of nodes per batch. Defaults to None (unbounded).
+            max_edges (int, optional): Maximum number of edges per batch. Defaults to None (unbounded).
+            max_graphs (int, optional): Maximum number of graphs per batch. Defaults to None (unbounded).
+            shuffle (bool, optional): Whether to shuffle the graphs in every epoch. Defaults to True.
+            bucket_size (int, optional): Number of graphs which are sorted by size before packing
+                them into batches. Defaults to None (no bucketing).
+            seed (int, optional): Seed of the random number generator. Defaults to None.
+            num_threads (int, optional): Number of threads reading batches. Defaults to 2.
+            prefetch (int, optional): Number of batches read ahead of the consumer. Defaults to 4.
+            collate (dict, optional): If given, batches are collated with `GraphList.collate`
+                using these keyword arguments (e.g. padding budgets). Defaults to None.
+        """
+        if max_nodes is None and max_edges is None and max_graphs is None:
+            raise ValueError("At least one of max_nodes, max_edges and max_graphs must be given.")
+        self.graphs = graphs
+        self.max_nodes = max_nodes
+        self.max_edges = max_edges
+        self.max_graphs = max_graphs
+        self.shuffle = shuffle
+        self.bucket_size = bucket_size
+        self.num_threads = num_threads
+        self.prefetch = prefetch
+        self.collate = collate
+        self.rng = np.random.default_rng(seed)
+
+    def plan(self) -> List[np.ndarray]:
+        """Assigns the graphs of one epoch to batches.
+        Returns:
+            List[np.ndarray]: Graph indices of each batch.
+        """
+        num_nodes = np.asarray(self.graphs.num_nodes[:], dtype=np.int64)
+        num_edges = np.asarray(self.graphs.num_edges[:], dtype=np.int64)
+        num_graphs = len(num_nodes)
+
+        order = self.rng.permutation(num_graphs) if self.shuffle else np.arange(num_graphs)
+        if self.bucket_size is not None:
+            buckets = np.arange(num_graphs) // self.bucket_size
+            sizes = num_nodes[order] + num_edges[order]
+            order = order[np.lexsort((sizes, buckets))]
+
+        # Exclusive prefix sums of the sizes in batch order. A batch starting at graph i
+        # ends at the largest j for which all prefix sum differences stay within budget.
+        node_sums = np.concatenate([[0], np.cumsum(num_nodes[order])])
+        edge_sums = np.concatenate([[0], np.cumsum(num_edges[order])])
+        batches = []
+        start = 0
+        while start < num_graphs:
+            stop = num_graphs
+            if self.max_nodes is not None:
+                stop = min(stop, np.searchsorted(node_sums, node_sums[start] + self.max_nodes, side="right") - 1)
+            if self.max_edges is not None:
+                stop = min(stop, np.searchsorted(edge_sums, edge_sums[start] + self.max_edges, side="right") - 1)
+            if self.max_graphs is not None:
+                stop = min(stop, start + self.max_graphs)
+            if stop <= start:
+                raise ValueError(
+                    f"Graph {order[start]} with {num_nodes[order[start]]} nodes and "
+                    f"{num_edges[order[start]]} edges does not fit into the batch budget."
+                )
+            batches.append(order[start:stop])
+            start = stop
+
+        if self.shuffle and self.bucket_size is not None:
+            batches = [batches[i] for i in self.rng.permutation(len(batches))]
+        return batches
+
+    def _load(self, indices: np.ndarray):
+        if self.collate is not None:
+            return self.graphs.collate(indices, **self.collate)
+        return self.graphs[indices]
+
+    def __iter__(self) -> Iterator:
+        batches = self.plan()
+        with ThreadPoolExecutor(self.num_threads) as executor:
+            pending = deque()
+            try:
+                for indices in batches:
+                    pending.append(executor.submit(self._load, indices))
+                    if len(pending) > self.prefetch:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,112 @@
+import numpy as np
+from typing import NamedTuple
+
+
+class SortedIndex(NamedTuple):
+    """Secondary index of a graph level column: the sorted values and the graph index of each value.
+    The arrays may be h5py datasets, in which case lookups only read O(log n) values.
+    """
+
+    values: np.ndarray
+    order: np.ndarray
+
+
+class Columns:
+    """Graph level columns (num_nodes, num_edges and 1-dimensional graph attributes) passed to
+    predicates of `GraphList.select`. Columns are loaded on first access, so only the columns
+    used by a predicate are read.
+    """
+
+    def __init__(self, graphs):
+        self._graphs = graphs
+        self._columns = {}
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            self._columns[name] = self._graphs._column(name)
+        return self._columns[name]
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class GraphSubset:
+    """A lazily materialized subset of a GraphList, as returned by `GraphList.select(..., lazy=True)`.
+    Indexing the subset reads only the requested graphs from the parent.
+    """
+
+    def __init__(self, graphs, indices: np.ndarray):
+        self.graphs = graphs
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        indices = self.indices[index]
+        if isinstance(index, int):
+            return self.graphs[int(indices)]
+        return self.graphs[indices]
+
+    def materialize(self):
+        """Reads all graphs of the subset.
+        Returns:
+            GraphList: The graphs of the subset.
+        """
+        return self.graphs[self.indices]
+
+    def __repr__(self):
+        return f"GraphSubset containing {len(self)} of {len(self.graphs)} graphs."
+
+
+def _read_range(array, start: int, stop: int) -> np.ndarray:
+    return array[start:stop]
+
+
+def _searchsorted(values, value, side: str = "left", read_range=_read_range) -> int:
+    """np.searchsorted for numpy arrays and h5py datasets, the latter by bisection,
+    reading each probed value with read_range(values, start, stop).
+    """
+    if isinstance(values, np.ndarray):
+        return int(np.searchsorted(values, value, side=side))
+    lo, hi = 0, values.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = read_range(values, mid, mid + 1)[0]
+        if probe < value or (side == "right" and probe == value):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _index_lookup(index: SortedIndex, condition, read_range=_read_range) -> np.ndarray:
+    """Returns the graphs whose value satisfies an equality or (low, high) range condition.
+    Index datasets are read with read_range(array, start, stop), e.g. `HDFGraphList._read_range`.
+    """
+    if isinstance(condition, tuple):
+        low, high = condition
+        start = 0 if low is None else _searchsorted(index.values, low, "left", read_range)
+        stop = index.values.shape[0] if high is None else _searchsorted(index.values, high, "left", read_range)
+    else:
+        start = _searchsorted(index.values, condition, "left", read_range)
+        stop = _searchsorted(index.values, condition, "right", read_range)
+    return np.sort(np.asarray(read_range(index.order, start, max(start, stop))))
+
+
+def _column_mask(column: np.ndarray, condition) -> np.ndarray:
+    """Evaluates an equality or (low, high) range condition on a column."""
+    if isinstance(condition, tuple):
+        low, high = condition
+        mask = np.ones(len(column), dtype=bool)
+        if low is not None:
+            mask &= column >= low
+        if high is not None:
+            mask &= column < high
+        return mask
+    return column == condition
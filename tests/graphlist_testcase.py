@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+import numpy as np
+from graphlist import GraphList
+import test_graphlist
+
+
+class GraphListTestCase(unittest.TestCase):
+    """Base class of the tests of the GraphList backends. Provides random graphs in self.graphs,
+    a temporary directory in self.tmp_dir and assertGraphListEqual.
+    """
+
+    num_graphs = 20
+    node_attribute_names = ['node_attribute1', 'attribute']
+    # Whether assertGraphListEqual also compares the order and dtypes of the attributes.
+    strict = False
+
+    def setUp(self):
+        nx_graphs = test_graphlist.TestGraphList.generate_random_graphs(self.num_graphs)
+        self.graphs = GraphList.from_nx_graphs(nx_graphs,
+                                               node_attribute_names=self.node_attribute_names,
+                                               edge_attribute_names=['edge_attribute1'],
+                                               graph_attribute_names=['graph_attribute'])
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assertGraphListEqual(self, first, second):
+        self.assertTrue(np.all(first.num_nodes[:] == second.num_nodes[:]))
+        self.assertTrue(np.all(first.num_edges[:] == second.num_edges[:]))
+        self.assertTrue(np.all(first.edge_indices[:] == second.edge_indices[:]))
+        for attributes in ['node_attributes', 'edge_attributes', 'graph_attributes']:
+            first_attributes, second_attributes = getattr(first, attributes), getattr(second, attributes)
+            if self.strict:
+                self.assertEqual(list(first_attributes.keys()), list(second_attributes.keys()))
+            else:
+                self.assertEqual(sorted(first_attributes.keys()), sorted(second_attributes.keys()))
+            for k in first_attributes.keys():
+                if self.strict:
+                    self.assertEqual(first_attributes[k].dtype, second_attributes[k].dtype)
+                self.assertTrue(np.all(first_attributes[k][:] == second_attributes[k][:]))
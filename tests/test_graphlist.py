@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import unittest
 import numpy as np
 import networkx as nx
@@ -34,6 +36,385 @@ class TestGraphList(unittest.TestCase):
             self.assertTrue(np.all(graph.attribute == graphs[graph_idx].graph_attributes['attribute']))
             self.assertTrue(np.all(graph.graph_attribute == graphs[graph_idx].graph_attributes['graph_attribute']))
 
+    def test_indexing(self):
+        nx_graphs = self.generate_random_graphs(20)
+        graphs = GraphList.from_nx_graphs(nx_graphs,
+                                 node_attribute_names=['node_attribute2'],
+                                 edge_attribute_names=['edge_attribute1'],
+                                 graph_attribute_names=['graph_attribute'])
+        for index in [3, -1, [4, 2, 2, 7], np.array([0, 19, 5]), [-1, 1], np.array([2, -3]), slice(2, 9), slice(-5, None), slice(1, 15, 3)]:
+            subset = graphs[index]
+            expected = np.arange(len(graphs))[index].reshape(-1)
+            self.assertEqual(len(subset), len(expected))
+            self.assertTrue(np.all(subset.num_nodes == graphs.num_nodes[expected]))
+            self.assertTrue(np.all(subset.num_edges == graphs.num_edges[expected]))
+            for i, graph_idx in enumerate(expected):
+                node_start, edge_start = graphs.node_starts[graph_idx], graphs.edge_starts[graph_idx]
+                node_end = node_start + graphs.num_nodes[graph_idx]
+                edge_end = edge_start + graphs.num_edges[graph_idx]
+                self.assertTrue(np.all(
+                    subset.node_attributes['node_attribute2'][subset.node_starts[i]:subset.node_starts[i] + subset.num_nodes[i]] ==
+                    graphs.node_attributes['node_attribute2'][node_start:node_end]))
+                self.assertTrue(np.all(
+                    subset.edge_attributes['edge_attribute1'][subset.edge_starts[i]:subset.edge_starts[i] + subset.num_edges[i]] ==
+                    graphs.edge_attributes['edge_attribute1'][edge_start:edge_end]))
+                self.assertTrue(np.all(
+                    subset.edge_indices[subset.edge_starts[i]:subset.edge_starts[i] + subset.num_edges[i]] ==
+                    graphs.edge_indices[edge_start:edge_end]))
+                self.assertTrue(np.all(
+                    subset.graph_attributes['graph_attribute'][i] ==
+                    graphs.graph_attributes['graph_attribute'][graph_idx]))
+        with self.assertRaises(IndexError):
+            graphs[[0, 20]]
+
+    def test_views(self):
+        graphs = GraphList.from_nx_graphs(self.generate_random_graphs(10),
+                                 node_attribute_names=['node_attribute1'],
+                                 edge_attribute_names=['edge_attribute1'],
+                                 graph_attribute_names=['graph_attribute'])
+        for view in [graphs[2:7], graphs[4]]:
+            self.assertTrue(np.shares_memory(view.num_nodes, graphs.num_nodes))
+            self.assertTrue(np.shares_memory(view.graph_attributes['graph_attribute'], graphs.graph_attributes['graph_attribute']))
+            if view.num_nodes.sum() > 0:
+                self.assertTrue(np.shares_memory(view.node_attributes['node_attribute1'], graphs.node_attributes['node_attribute1']))
+            copy = view.copy()
+            self.assertFalse(np.shares_memory(copy.num_nodes, graphs.num_nodes))
+            self.assertFalse(np.shares_memory(copy.node_attributes['node_attribute1'], graphs.node_attributes['node_attribute1']))
+            self.assertTrue(np.all(copy.node_attributes['node_attribute1'] == view.node_attributes['node_attribute1']))
+        with self.assertRaises(IndexError):
+            graphs[10]
+
+    def test_from_nx_graphs_node_labels(self):
+        for labels in [[7, -3, 100], ['c', 'a', 'b'], [('a', 1), ('b', 2, 3), ('c',)]]:
+            nx_graphs = []
+            for shift in range(3):
+                graph = nx.MultiDiGraph()
+                graph.add_nodes_from(labels)
+                graph.add_edge(labels[2], labels[0])
+                graph.add_edge(labels[1], labels[shift])
+                nx_graphs.append(graph)
+            graphs = GraphList.from_nx_graphs(nx_graphs)
+            self.assertTrue(np.all(graphs.edge_indices == [[1, 0], [2, 0], [1, 1], [2, 0], [1, 2], [2, 0]]))
+
+    def test_from_nx_graphs_parallel(self):
+        nx_graphs = self.generate_random_graphs(25)
+        kwargs = dict(node_attribute_names=['node_attribute2'],
+                      edge_attribute_names=['edge_attribute1'],
+                      graph_attribute_names=['attribute'])
+        graphs = GraphList.from_nx_graphs(nx_graphs, **kwargs)
+        parallel_graphs = GraphList.from_nx_graphs(iter(nx_graphs), num_workers=2, chunk_size=4, **kwargs)
+        self.assertTrue(np.all(parallel_graphs.num_nodes == graphs.num_nodes))
+        self.assertTrue(np.all(parallel_graphs.edge_indices == graphs.edge_indices))
+        self.assertTrue(np.all(parallel_graphs.node_attributes['node_attribute2'] == graphs.node_attributes['node_attribute2']))
+        self.assertTrue(np.all(parallel_graphs.edge_attributes['edge_attribute1'] == graphs.edge_attributes['edge_attribute1']))
+        self.assertTrue(np.all(parallel_graphs.graph_attributes['attribute'] == graphs.graph_attributes['attribute']))
+
+    def test_concatenate(self):
+        graphs = GraphList.from_nx_graphs(self.generate_random_graphs(12),
+                                 node_attribute_names=['node_attribute1'],
+                                 edge_attribute_names=['edge_attribute1'],
+                                 graph_attribute_names=['graph_attribute'])
+        parts = [graphs[:5], graphs[[9, 10, 11]], graphs[5:9]]
+        concatenated = GraphList.concatenate(parts)
+        order = np.r_[0:5, 9, 10, 11, 5:9]
+        expected = graphs[order]
+        self.assertTrue(np.all(concatenated.num_nodes == expected.num_nodes))
+        self.assertTrue(np.all(concatenated.node_starts == expected.node_starts))
+        self.assertTrue(np.all(concatenated.edge_starts == expected.edge_starts))
+        self.assertTrue(np.all(concatenated.edge_indices == expected.edge_indices))
+        self.assertTrue(np.all(concatenated.node_attributes['node_attribute1'] == expected.node_attributes['node_attribute1']))
+        self.assertTrue(np.all(concatenated.edge_attributes['edge_attribute1'] == expected.edge_attributes['edge_attribute1']))
+        self.assertTrue(np.all(concatenated.graph_attributes['graph_attribute'] == expected.graph_attributes['graph_attribute']))
+
+        other = graphs[:2].copy()
+        other.node_attributes['node_attribute1'] = other.node_attributes['node_attribute1'].astype(np.float32)
+        with self.assertRaises(ValueError):
+            GraphList.concatenate([graphs, other])
+        other = graphs[:2].copy()
+        other.graph_attribute_names = []
+        with self.assertRaises(ValueError):
+            GraphList.concatenate([graphs, other])
+
+    def test_collate(self):
+        graphs = GraphList.from_nx_graphs(self.generate_random_graphs(10),
+                                 node_attribute_names=['node_attribute1'],
+                                 edge_attribute_names=['edge_attribute1'],
+                                 graph_attribute_names=['graph_attribute'])
+        indices = [7, 2, 2, 5]
+        subset = graphs[indices]
+        total_nodes, total_edges = subset.num_nodes.sum(), subset.num_edges.sum()
+        batch = graphs.collate(indices)
+        self.assertTrue(np.all(batch.num_nodes == subset.num_nodes))
+        self.assertEqual(len(batch.senders), total_edges)
+        for i in range(len(indices)):
+            edges = slice(subset.edge_starts[i], subset.edge_starts[i] + subset.num_edges[i])
+            self.assertTrue(np.all(batch.senders[edges] == subset.edge_indices[edges, 0] + subset.node_starts[i]))
+            self.assertTrue(np.all(batch.receivers[edges] == subset.edge_indices[edges, 1] + subset.node_starts[i]))
+            self.assertTrue(np.all(batch.node_graph_index[subset.node_starts[i]:subset.node_starts[i] + subset.num_nodes[i]] == i))
+            self.assertTrue(np.all(batch.edge_graph_index[edges] == i))
+
+        padded = graphs.collate(indices, pad_nodes='pow2', pad_edges=total_edges + 3, pad_graphs=8)
+        node_budget = len(padded.node_mask)
+        self.assertEqual(node_budget & (node_budget - 1), 0)
+        self.assertGreater(node_budget, total_nodes)
+        self.assertEqual(len(padded.senders), total_edges + 3)
+        self.assertEqual(len(padded.num_nodes), 8)
+        self.assertEqual(padded.num_nodes.sum(), node_budget)
+        self.assertEqual(padded.num_edges.sum(), total_edges + 3)
+        self.assertEqual(padded.node_mask.sum(), total_nodes)
+        self.assertEqual(padded.graph_mask.sum(), len(indices))
+        self.assertTrue(np.all(padded.senders[total_edges:] == total_nodes))
+        self.assertTrue(np.all(padded.node_graph_index[total_nodes:] == len(indices)))
+        self.assertEqual(padded.node_attributes['node_attribute1'].shape[0], node_budget)
+        self.assertTrue(np.all(padded.graph_attributes['graph_attribute'][:len(indices)] == subset.graph_attributes['graph_attribute']))
+        with self.assertRaises(ValueError):
+            graphs.collate(indices, pad_graphs=len(indices))
+
+        for empty in [[], slice(1, 1)]:
+            batch = graphs.collate(empty)
+            self.assertEqual(len(batch.num_nodes), 0)
+            self.assertEqual(len(batch.senders), 0)
+            self.assertEqual(batch.node_attributes['node_attribute1'].shape, (0, 5))
+            padded = graphs.collate(empty, pad_nodes=4, pad_edges=2, pad_graphs=2)
+            self.assertTrue(np.all(padded.num_nodes == [4, 0]))
+            self.assertTrue(np.all(padded.senders == 0))
+            self.assertFalse(np.any(padded.graph_mask))
+
+    def test_loader(self):
+        graphs = GraphList.from_nx_graphs(self.generate_random_graphs(30),
+                                 node_attribute_names=['node_attribute1'])
+        max_nodes = max(100, graphs.num_nodes.max())
+        loader = graphs.loader(max_nodes=max_nodes, max_graphs=8, bucket_size=10, seed=0, num_threads=2, prefetch=2)
+        seen = []
+        for batch in loader:
+            self.assertLessEqual(batch.num_nodes.sum(), max_nodes)
+            self.assertLessEqual(len(batch), 8)
+            seen.append(batch.node_attributes['node_attribute1'])
+        self.assertEqual(sum(len(x) for x in seen), graphs.num_nodes.sum())
+        self.assertEqual(sorted(np.concatenate(loader.plan()).tolist()), list(range(30)))
+        collated = next(iter(graphs.loader(max_nodes=max_nodes, collate=dict(pad_nodes=max_nodes + 1))))
+        self.assertEqual(len(collated.node_mask), max_nodes + 1)
+        with self.assertRaises(ValueError):
+            graphs.loader(max_edges=-1).plan()
+
+    def test_compact(self):
+        nx_graphs = self.generate_random_graphs(10)
+        graphs = GraphList.from_nx_graphs(nx_graphs, node_attribute_names=['attribute'])
+        compact = GraphList.from_nx_graphs(nx_graphs, node_attribute_names=['attribute'], compact=True)
+        self.assertEqual(compact.edge_indices.dtype, np.uint8)
+        self.assertTrue(np.all(compact.edge_indices == graphs.edge_indices))
+        self.assertTrue(np.all(compact.node_starts == graphs.node_starts))
+        self.assertEqual(compact.node_starts.dtype, np.int64)
+        self.assertTrue(np.all(compact[[3, 1]].edge_indices == graphs[[3, 1]].edge_indices))
+        self.assertEqual(compact.widen().edge_indices.dtype, np.int64)
+
+        large = GraphList(np.array([300]), np.array([1]), np.array([[299, 0]]), {}, {}, {}).compact()
+        self.assertEqual(large.edge_indices.dtype, np.uint16)
+        concatenated = GraphList.concatenate([GraphList.from_nx_graphs(nx_graphs[:2], compact=True), large])
+        self.assertEqual(concatenated.edge_indices.dtype, np.uint16)
+        self.assertEqual(concatenated.edge_indices[-1, 0], 299)
+
+    def test_csr(self):
+        nx_graphs = [nx.MultiDiGraph(g) for g in self.generate_random_graphs(10)]
+        graphs = GraphList.from_nx_graphs(nx_graphs, edge_attribute_names=['edge_attribute1'])
+        for graph_idx, graph in enumerate(nx_graphs):
+            for node in graph.nodes:
+                self.assertEqual(sorted(graphs.neighbors(graph_idx, node).tolist()), sorted(v for _, v in graph.out_edges(node)))
+                self.assertEqual(sorted(graphs.neighbors(graph_idx, node, incoming=True).tolist()), sorted(u for u, _ in graph.in_edges(node)))
+                global_node = graphs.node_starts[graph_idx] + node
+                self.assertEqual(graphs.out_degree[global_node], graph.out_degree(node))
+                self.assertEqual(graphs.in_degree[global_node], graph.in_degree(node))
+        edge_indices = graphs._global_edge_indices()
+        self.assertTrue(np.all(edge_indices[graphs.csr.edge_perm, 1] == graphs.csr.indices))
+        self.assertTrue(np.all(np.diff(edge_indices[graphs.csr.edge_perm, 0]) >= 0))
+
+        nodes = np.arange(graphs.num_nodes.sum())
+        samples = graphs.sample_neighbors(nodes, 4, seed=0)
+        self.assertEqual(samples.shape, (len(nodes), 4))
+        for node, sampled in zip(nodes, samples):
+            neighbors = graphs.csr.indices[graphs.csr.indptr[node]:graphs.csr.indptr[node + 1]]
+            if len(neighbors) == 0:
+                self.assertTrue(np.all(sampled == -1))
+            else:
+                self.assertTrue(np.all(np.isin(sampled, neighbors)))
+
+    def test_segment_reductions(self):
+        nx_graphs = [nx.MultiDiGraph(g) for g in self.generate_random_graphs(12)]
+        nx_graphs.append(nx.MultiDiGraph())
+        nx_graphs[-1].graph_attribute, nx_graphs[-1].attribute = np.zeros(1), 0
+        graphs = GraphList.from_nx_graphs(nx_graphs,
+                                          node_attribute_names=['node_attribute1', 'attribute'],
+                                          edge_attribute_names=['edge_attribute1'])
+        for op, function in [('sum', np.sum), ('mean', np.mean), ('max', np.max), ('min', np.min)]:
+            result = graphs.segment_reduce('node_attribute1', op, fill_value=-1)
+            edge_result = graphs.segment_reduce('edge_attribute1', op, level='edge', fill_value=-1)
+            for graph_idx, graph in enumerate(nx_graphs):
+                values = [data['node_attribute1'] for _, data in graph.nodes(data=True)]
+                expected = function(values, axis=0) if len(values) > 0 else (0 if op == 'sum' else -1)
+                self.assertTrue(np.allclose(result[graph_idx], expected))
+                values = [data['edge_attribute1'] for _, _, data in graph.edges(data=True)]
+                expected = function(values, axis=0) if len(values) > 0 else (0 if op == 'sum' else -1)
+                self.assertTrue(np.allclose(edge_result[graph_idx], expected))
+        self.assertTrue(np.all(np.isnan(graphs.segment_mean('attribute')[-1])))
+
+        narrow = GraphList.from_arrays([np.zeros((0, 2), dtype=int)], num_nodes=[2],
+                                       node_attributes={'x': np.array([200, 100], dtype=np.uint8),
+                                                        'b': np.array([True, True])})
+        self.assertEqual(narrow.segment_sum('x')[0], 300)
+        self.assertEqual(narrow.segment_mean('x')[0], 150)
+        self.assertEqual(narrow.segment_sum('b')[0], 2)
+        self.assertEqual(narrow.segment_max('x')[0], 200)
+        aggregated = graphs.aggregate_edges('edge_attribute1', 'max', out_name='max_incoming')
+        self.assertIn('max_incoming', graphs.node_attribute_names)
+        outgoing = graphs.aggregate_edges('edge_attribute1', 'sum', incoming=False)
+        for graph_idx, graph in enumerate(nx_graphs):
+            for node in graph.nodes:
+                global_node = graphs.node_starts[graph_idx] + node
+                incoming = [data['edge_attribute1'] for _, _, data in graph.in_edges(node, data=True)]
+                expected = np.max(incoming, axis=0) if len(incoming) > 0 else 0
+                self.assertTrue(np.allclose(aggregated[global_node], expected))
+                out = [data['edge_attribute1'] for _, _, data in graph.out_edges(node, data=True)]
+                self.assertTrue(np.allclose(outgoing[global_node], np.sum(out, axis=0) if len(out) > 0 else 0))
+
+        sums = graphs.segment_sum('node_attribute1')
+        graphs.reduce_chunk_graphs = 5
+        self.assertTrue(np.allclose(graphs.segment_sum('node_attribute1'), sums))
+        self.assertTrue(np.allclose(graphs.aggregate_edges('edge_attribute1', 'max'), aggregated))
+
+    def test_iter_graphs(self):
+        nx_graphs = self.generate_random_graphs(20)
+        nx_graphs.append(nx.MultiDiGraph())
+        nx_graphs[-1].graph_attribute, nx_graphs[-1].attribute = np.zeros(1), 0
+        graphs = GraphList.from_nx_graphs(nx_graphs, node_attribute_names=['node_attribute1'],
+                                          edge_attribute_names=['edge_attribute1'],
+                                          graph_attribute_names=['graph_attribute'])
+        empty = graphs[[]]
+        for block_graphs in [None, 1, 7]:
+            self.assertEqual(list(empty.iter_graphs(block_graphs)), [])
+            self.assertEqual(list(empty.iter_nx_graphs(block_graphs)), [])
+        self.assertEqual(list(empty), [])
+        self.assertEqual(empty.to_nx_graphs(), [])
+        for block_graphs in [None, 1, 7]:
+            views = list(graphs.iter_graphs(block_graphs))
+            self.assertEqual(len(views), len(graphs))
+            for i, view in enumerate(views):
+                graph = graphs[i]
+                self.assertEqual(view.num_nodes, graph.num_nodes[0])
+                self.assertEqual(view.num_edges, graph.num_edges[0])
+                self.assertTrue(np.all(view.edge_indices == graph.edge_indices))
+                self.assertTrue(np.all(view.node_attributes['node_attribute1'] == graph.node_attributes['node_attribute1']))
+                self.assertTrue(np.all(view.edge_attributes['edge_attribute1'] == graph.edge_attributes['edge_attribute1']))
+                self.assertTrue(np.all(view.graph_attributes['graph_attribute'] == graph.graph_attributes['graph_attribute'][0]))
+        view = next(iter(graphs))
+        self.assertTrue(np.shares_memory(view.node_attributes['node_attribute1'], graphs.node_attributes['node_attribute1']))
+        with self.assertRaises(AttributeError):
+            view.other = 1
+
+    def test_to_nx_graphs(self):
+        nx_graphs = []
+        for graph in self.generate_random_graphs(15):
+            multigraph = nx.MultiDiGraph(graph)
+            multigraph.graph_attribute = graph.graph_attribute
+            # Parallel edges get consecutive keys.
+            for src, dest in list(graph.edges)[:3]:
+                multigraph.add_edge(src, dest, edge_attribute1=np.zeros(7))
+            nx_graphs.append(multigraph)
+        graphs = GraphList.from_nx_graphs(nx_graphs,
+                                          node_attribute_names=['node_attribute1', 'attribute'],
+                                          edge_attribute_names=['edge_attribute1'],
+                                          graph_attribute_names=['graph_attribute'])
+        for converted in [graphs.to_nx_graphs(), list(graphs.iter_nx_graphs(block_graphs=4))]:
+            self.assertEqual(len(converted), len(nx_graphs))
+            for graph, expected in zip(converted, nx_graphs):
+                structures = []
+                for g in [graph, expected]:
+                    structure = nx.MultiDiGraph()
+                    structure.add_nodes_from(g.nodes)
+                    structure.add_edges_from(g.edges(keys=True))
+                    structures.append(structure)
+                self.assertTrue(nx.utils.graphs_equal(*structures))
+                self.assertEqual(list(graph.nodes), list(expected.nodes))
+                self.assertEqual(list(graph.edges(keys=True)), list(expected.edges(keys=True)))
+                self.assertEqual(list(graph.in_edges(keys=True)), list(expected.in_edges(keys=True)))
+                for (_, data), (_, expected_data) in zip(graph.nodes(data=True), expected.nodes(data=True)):
+                    self.assertTrue(np.all(data['node_attribute1'] == expected_data['node_attribute1']))
+                    self.assertEqual(data['attribute'], expected_data['attribute'])
+                for (_, _, data), (_, _, expected_data) in zip(graph.edges(data=True), expected.edges(data=True)):
+                    self.assertTrue(np.all(data['edge_attribute1'] == expected_data['edge_attribute1']))
+                self.assertTrue(np.all(graph.graph_attribute == expected.graph_attribute))
+        graph = next(graphs.iter_nx_graphs())
+        if graph.number_of_nodes() > 0:
+            self.assertFalse(np.shares_memory(graph.nodes[0]['node_attribute1'], graphs.node_attributes['node_attribute1']))
+
+    def test_select(self):
+        nx_graphs = self.generate_random_graphs(40)
+        graphs = GraphList.from_nx_graphs(nx_graphs, graph_attribute_names=['attribute'])
+        num_nodes, attribute = graphs.num_nodes, graphs.graph_attributes['attribute']
+        expected = np.flatnonzero((num_nodes >= 10) & (num_nodes < 50) & (attribute < 60))
+        self.assertTrue(np.all(graphs.select(num_nodes=(10, 50), attribute=(None, 60)) == expected))
+        self.assertTrue(np.all(graphs.select(lambda c: (c.num_nodes >= 10) & (c.num_nodes < 50)
+                                             & (c['attribute'] < 60)) == expected))
+        self.assertTrue(np.all(graphs.select(attribute=attribute[3]) == np.flatnonzero(attribute == attribute[3])))
+
+        graphs.build_index('num_nodes')
+        graphs.build_index('attribute')
+        self.assertTrue(np.all(graphs.select(num_nodes=(10, 50), attribute=(None, 60)) == expected))
+        self.assertTrue(np.all(graphs.select(attribute=attribute[3]) == np.flatnonzero(attribute == attribute[3])))
+        self.assertEqual(len(graphs.select(num_nodes=(50, 10))), 0)
+
+        subset = graphs.select(num_nodes=(10, 50), lazy=True)
+        self.assertEqual(len(subset), np.sum((num_nodes >= 10) & (num_nodes < 50)))
+        self.assertTrue(np.all(subset.materialize().num_nodes == num_nodes[subset.indices]))
+        if len(subset) > 0:
+            self.assertEqual(subset[0].num_nodes[0], num_nodes[subset.indices[0]])
+        with self.assertRaises(KeyError):
+            graphs.select(unknown=1)
+
+    def test_from_arrays(self):
+        nx_graphs = self.generate_random_graphs(10)
+        graphs = GraphList.from_nx_graphs(nx_graphs, node_attribute_names=['node_attribute1'],
+                                          edge_attribute_names=['edge_attribute1'], graph_attribute_names=['attribute'])
+        ragged = GraphList.from_arrays([graphs[i].edge_indices for i in range(len(graphs))],
+                                       node_attributes={'node_attribute1': [graphs[i].node_attributes['node_attribute1']
+                                                                            for i in range(len(graphs))]},
+                                       edge_attributes={'edge_attribute1': [graphs[i].edge_attributes['edge_attribute1']
+                                                                            for i in range(len(graphs))]},
+                                       graph_attributes={'attribute': graphs.graph_attributes['attribute']})
+        global_edge_indices = graphs.edge_indices + np.repeat(graphs.node_starts, graphs.num_edges)[:, None]
+        flat = GraphList.from_arrays(global_edge_indices, graphs.num_nodes, graphs.num_edges,
+                                     node_attributes=graphs.node_attributes, edge_attributes=graphs.edge_attributes,
+                                     graph_attributes=graphs.graph_attributes, global_indices=True)
+        for converted in [ragged, flat]:
+            self.assertTrue(np.all(converted.num_nodes == graphs.num_nodes))
+            self.assertTrue(np.all(converted.num_edges == graphs.num_edges))
+            self.assertTrue(np.all(converted.edge_indices == graphs.edge_indices))
+            for attributes in ['node_attributes', 'edge_attributes', 'graph_attributes']:
+                for k, v in getattr(graphs, attributes).items():
+                    self.assertTrue(np.all(getattr(converted, attributes)[k] == v))
+
+        inferred = GraphList.from_arrays([np.array([[0, 2], [2, 1]]), np.zeros((0, 2), dtype=int)])
+        self.assertTrue(np.all(inferred.num_nodes == [3, 0]))
+        empty_entries = GraphList.from_arrays([np.array([[0, 1]]), [], np.array([[1, 0]])],
+                                              node_attributes={'x': [np.ones((2, 3)), [], np.ones((2, 3))]})
+        self.assertEqual(empty_entries.edge_indices.dtype, np.array([[0, 1]]).dtype)
+        self.assertTrue(np.all(empty_entries.num_edges == [1, 0, 1]))
+        self.assertTrue(np.all(empty_entries.num_nodes == [2, 0, 2]))
+        self.assertEqual(empty_entries.node_attributes['x'].shape, (4, 3))
+        with self.assertRaises(ValueError):
+            GraphList.from_arrays(np.array([[0, 3]]), num_nodes=[3], num_edges=[1])
+        with self.assertRaises(ValueError):
+            GraphList.from_arrays(np.array([[0, 1]]), num_nodes=[2], num_edges=[1],
+                                  node_attributes={'x': np.zeros(3)})
+        with self.assertRaises(ValueError):
+            GraphList.from_arrays([np.array([[0, 1]])], num_edges=[2])
+
+    def test_lazy_imports(self):
+        code = ('import sys, graphlist; graphlist.GraphList; '
+                'print(sorted(m for m in ["networkx", "h5py"] if m in sys.modules)); '
+                'graphlist.HDFGraphList; print("h5py" in sys.modules)')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['[]', 'True'])
+
     @staticmethod
     def generate_random_graphs(number_of_graphs = 50):
         # Generate 50 random graphs with networkx
@@ -0,0 +1,330 @@
+import asyncio
+import os
+import unittest
+import h5py
+import networkx as nx
+import numpy as np
+from graphlist import GraphList, HDFGraphList, HDFGraphListWriter, read_table
+from graphlist.graphlist_hdf import _coalesce_rows
+from graphlist_testcase import GraphListTestCase
+import test_graphlist
+
+
+class TestHDFGraphList(GraphListTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp_dir.name, 'graphs.h5')
+
+    def test_indexing(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            for index in [5, [7, 1, 1, 12], np.array([19, 0]), slice(3, 11)]:
+                self.assertGraphListEqual(hdf_graphs[index], self.graphs[index])
+
+    def test_coalesced_reads(self):
+        starts, stops = _coalesce_rows(np.array([1, 2, 3, 7, 9, 20]), max_gap=2)
+        self.assertEqual(starts.tolist(), [1, 7, 20])
+        self.assertEqual(stops.tolist(), [4, 10, 21])
+        indices = np.random.permutation(20)[:12].tolist() + [3, 3]
+        with h5py.File(self.path, 'a') as f:
+            HDFGraphList.from_graphlist(f, self.graphs)
+            for max_read_gap in [0, 5, 1000]:
+                hdf_graphs = HDFGraphList(f, max_read_gap=max_read_gap)
+                self.assertGraphListEqual(hdf_graphs[indices], self.graphs[indices])
+                for resident_counts in [True, False]:
+                    hdf_graphs = HDFGraphList(f, max_read_gap=max_read_gap)
+                    hdf_graphs.resident_counts = resident_counts
+                    for negative in [[-1, 1], [-1], [2, -3]]:
+                        self.assertGraphListEqual(hdf_graphs[negative], self.graphs[negative])
+                with self.assertRaises(IndexError):
+                    hdf_graphs[[0, -21]]
+            # The runs of each row space (graphs, nodes, edges) are planned once for all its datasets.
+            plans = []
+            plan_rows = hdf_graphs._plan_rows
+            hdf_graphs._plan_rows = lambda rows: plans.append(rows) or plan_rows(rows)
+            hdf_graphs[indices]
+            self.assertEqual(len(plans), 3)
+
+    def test_block_cache(self):
+        with h5py.File(self.path, 'a') as f:
+            HDFGraphList.from_graphlist(f, self.graphs)
+            for cache_bytes in [2000, 10 ** 7]:
+                hdf_graphs = HDFGraphList(f, cache_bytes=cache_bytes, cache_block_rows=16)
+                for index in [[4, 1, 9], slice(2, 12), [4, 1, 9], 3, slice(0, 20)]:
+                    self.assertGraphListEqual(hdf_graphs[index], self.graphs[index])
+                stats = hdf_graphs.cache.stats()
+                self.assertGreater(stats['misses'], 0)
+                self.assertLessEqual(stats['bytes'], cache_bytes)
+            self.assertGreater(stats['hits'], 0)
+            hdf_graphs[5].node_attributes['node_attribute1'][:] = -1
+            self.assertGraphListEqual(hdf_graphs[5], self.graphs[5])
+
+    def test_writer(self):
+        with h5py.File(self.path, 'a') as f:
+            with HDFGraphListWriter(f, buffer_bytes=5000, chunk_bytes=1000) as writer:
+                for i in range(0, 10, 3):
+                    writer.append(self.graphs[i:i + 3])
+            with HDFGraphListWriter(f, buffer_bytes=5000) as writer:
+                writer.append(self.graphs[12:])
+                writer.append(self.graphs[[9, 10, 11]])
+            order = np.r_[0:20, 9, 10, 11]
+            self.assertGraphListEqual(HDFGraphList(f), self.graphs[order])
+            self.assertEqual(f['edge_attributes/edge_attribute1'].shape[0], self.graphs[order].num_edges.sum())
+
+    def test_writer_empty_batches(self):
+        graph = nx.MultiDiGraph()
+        graph.add_node(0, node_attribute1=np.zeros(5), attribute=0)
+        graph.graph_attribute = np.zeros(1)
+        empty = GraphList.from_nx_graphs([graph],
+                                         node_attribute_names=['node_attribute1', 'attribute'],
+                                         edge_attribute_names=['edge_attribute1'],
+                                         graph_attribute_names=['graph_attribute'])
+        with h5py.File(self.path, 'a') as f:
+            with HDFGraphListWriter(f, buffer_bytes=0) as writer:
+                writer.append(empty)
+                writer.append(self.graphs)
+            self.assertGraphListEqual(HDFGraphList(f)[1:], self.graphs)
+
+    def test_storage_options(self):
+        storage_options = {
+            'default': {'compression': 'gzip', 'compression_opts': 4, 'shuffle': True},
+            'edge_indices': {'compression': 'lzf', 'chunk_rows': 128, 'fletcher32': True},
+        }
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs, storage_options=storage_options)
+            self.assertGraphListEqual(hdf_graphs, self.graphs)
+            self.assertEqual(f['node_attributes/attribute'].compression, 'gzip')
+            self.assertTrue(f['node_attributes/attribute'].shuffle)
+            self.assertEqual(f['edge_indices'].compression, 'lzf')
+            self.assertEqual(f['edge_indices'].chunks, (128, 2))
+            self.assertTrue(f['edge_indices'].fletcher32)
+        with self.assertRaises(ValueError):
+            HDFGraphListWriter(None, storage_options={'default': {'level': 3}})
+
+    def test_compact(self):
+        large = GraphList(np.array([300]), np.array([1]), np.array([[299, 0]]), {}, {}, {})
+        small = GraphList(np.array([3, 2]), np.array([2, 1]), np.array([[0, 2], [1, 0], [1, 1]]), {}, {}, {})
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, small, storage_options={'default': {'compression': 'gzip'}}, compact=True)
+            self.assertEqual(f['edge_indices'].dtype, np.uint8)
+            self.assertEqual(f['num_nodes'].dtype, np.uint8)
+            hdf_graphs.append_graphlist(large)
+            self.assertEqual(f['edge_indices'].dtype, np.uint16)
+            self.assertEqual(f['num_nodes'].dtype, np.uint16)
+            self.assertEqual(f['edge_indices'].compression, 'gzip')
+            self.assertGraphListEqual(hdf_graphs, GraphList.concatenate([small, large]))
+            self.assertEqual(hdf_graphs[[2, 0]].widen().edge_indices.dtype, np.int64)
+
+    def test_persisted_csr(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            hdf_graphs.write_csr(csc=True)
+            reopened = HDFGraphList(f)
+            for name in ['csr', 'csc']:
+                for field, expected in zip(getattr(reopened, name), getattr(self.graphs, name)):
+                    self.assertTrue(np.all(field == expected))
+            reopened.append_graphlist(self.graphs[:3])
+            self.assertNotIn('csr', f)
+            self.assertEqual(len(reopened.csr.indptr), reopened.num_nodes.sum() + 1)
+
+    def test_persisted_offsets(self):
+        with h5py.File(self.path, 'a') as f:
+            HDFGraphList.from_graphlist(f, self.graphs[:12])
+            HDFGraphList(f).append_graphlist(self.graphs[12:])
+            self.assertTrue(np.all(f['node_starts'][:] == self.graphs.node_starts))
+            self.assertTrue(np.all(f['edge_starts'][:] == self.graphs.edge_starts))
+            # Opening the file and indexing with an int or a slice reads no counts into memory.
+            counts = {'num_nodes', 'num_edges', 'node_starts', 'edge_starts'}
+            hdf_graphs = HDFGraphList(f)
+            self.assertEqual(len(hdf_graphs), len(self.graphs))
+            self.assertGraphListEqual(hdf_graphs[7], self.graphs[7])
+            self.assertGraphListEqual(hdf_graphs[3:9], self.graphs[3:9])
+            self.assertFalse(counts & set(hdf_graphs.__dict__))
+            hdf_graphs.resident_counts = False
+            self.assertGraphListEqual(hdf_graphs[[9, 2, 2]], self.graphs[[9, 2, 2]])
+            self.assertFalse(counts & set(hdf_graphs.__dict__))
+            hdf_graphs.resident_counts = True
+            self.assertGraphListEqual(hdf_graphs[[9, 2, 2]], self.graphs[[9, 2, 2]])
+            self.assertEqual(counts & set(hdf_graphs.__dict__), counts)
+            self.assertIsInstance(HDFGraphList(f).num_nodes, np.ndarray)
+            self.assertTrue(np.all(HDFGraphList(f).num_edges > -1))
+
+            # Files without offsets compute them and get them on the next write.
+            del f['node_starts'], f['edge_starts']
+            self.assertGraphListEqual(HDFGraphList(f)[[4, 1]], self.graphs[[4, 1]])
+            HDFGraphList(f).append_graphlist(self.graphs[:2])
+            expected = GraphList.concatenate([self.graphs, self.graphs[:2]])
+            self.assertTrue(np.all(f['node_starts'][:] == expected.node_starts))
+            self.assertTrue(np.all(f['edge_starts'][:] == expected.edge_starts))
+
+    def test_segment_reductions(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            self.assertTrue(np.allclose(hdf_graphs.segment_sum('node_attribute1'), self.graphs.segment_sum('node_attribute1')))
+            with self.assertRaises(ValueError):
+                hdf_graphs.segment_mean('node_attribute1', out_name='mean')
+            with self.assertRaises(ValueError):
+                hdf_graphs.aggregate_edges('edge_attribute1', out_name='aggregated')
+            self.assertNotIn('mean', f['graph_attributes'])
+            hdf_graphs.append_graphlist(self.graphs[:2])
+            self.assertGraphListEqual(hdf_graphs[[4, 21]], self.graphs[[4, 1]])
+
+        with h5py.File(os.path.join(self.tmp_dir.name, 'empty.h5'), 'a') as f:
+            empty = self.graphs._get_subslice([])
+            hdf_graphs = HDFGraphList.from_graphlist(f, empty)
+            for op in ['sum', 'mean', 'max']:
+                result = hdf_graphs.segment_reduce('node_attribute1', op)
+                self.assertEqual(result.shape, empty.segment_reduce('node_attribute1', op).shape)
+            self.assertEqual(hdf_graphs.aggregate_edges('edge_attribute1').shape,
+                             empty.aggregate_edges('edge_attribute1').shape)
+
+    def test_iter_graphs(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            hdf_graphs.iter_block_graphs = 6
+            views, expected_views = list(hdf_graphs), list(self.graphs)
+            self.assertEqual(len(views), len(self.graphs))
+            for view, expected in zip(views, expected_views):
+                self.assertEqual(view.num_nodes, expected.num_nodes)
+                self.assertTrue(np.all(view.edge_indices == expected.edge_indices))
+                self.assertTrue(np.all(view.node_attributes['attribute'] == expected.node_attributes['attribute']))
+                self.assertTrue(np.all(view.graph_attributes['graph_attribute'] == expected.graph_attributes['graph_attribute']))
+            for graph, expected in zip(hdf_graphs.iter_nx_graphs(), self.graphs.iter_nx_graphs()):
+                self.assertEqual(list(graph.edges(keys=True)), list(expected.edges(keys=True)))
+                self.assertTrue(np.all(graph.graph_attribute == expected.graph_attribute))
+
+    def test_aget(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            requests = [[3, 1, 3], [1, 2, 5], 7, [-1, 0], [], list(range(20))]
+            reads = []
+            read = hdf_graphs._locked_read
+            hdf_graphs._locked_read = lambda indices: reads.append(indices.tolist()) or read(indices)
+
+            async def run():
+                return await asyncio.gather(*(hdf_graphs.aget(request) for request in requests))
+
+            for request, result in zip(requests, asyncio.run(run())):
+                self.assertGraphListEqual(result, self.graphs[np.array(request, dtype=int).reshape(-1)])
+            # Graphs requested concurrently are read only once.
+            self.assertEqual(sorted(sum(reads, [])), list(range(20)))
+            self.assertEqual(hdf_graphs._inflight, {})
+            with self.assertRaises(IndexError):
+                asyncio.run(hdf_graphs.aget([20]))
+
+            async def collect():
+                return [batch async for batch in hdf_graphs.aiter_batches(6, indices=np.arange(19, -1, -1))]
+
+            batches = asyncio.run(collect())
+            self.assertEqual([len(batch) for batch in batches], [6, 6, 6, 2])
+            self.assertGraphListEqual(GraphList.concatenate(batches), self.graphs[np.arange(19, -1, -1)])
+            executor = hdf_graphs._executor
+            hdf_graphs.close()
+            self.assertIsNone(hdf_graphs._executor)
+            self.assertTrue(executor._shutdown)
+
+            with HDFGraphList(f) as reopened:
+                self.assertGraphListEqual(asyncio.run(reopened.aget([4, 2])), self.graphs[[4, 2]])
+            self.assertIsNone(reopened._executor)
+            self.assertTrue(f.id.valid)
+
+    def test_persisted_indexes(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            num_edges = self.graphs.num_edges
+            expected = np.flatnonzero((num_edges >= 20) & (num_edges < 400))
+            hdf_graphs.build_index('num_edges')
+            reopened = HDFGraphList(f)
+            self.assertIsInstance(reopened.indexes['num_edges'].values, h5py.Dataset)
+            self.assertTrue(np.all(reopened.select(num_edges=(20, 400)) == expected))
+            self.assertTrue(np.all(reopened.select(num_edges=num_edges[0]) == np.flatnonzero(num_edges == num_edges[0])))
+            reopened.append_graphlist(self.graphs[:3])
+            self.assertNotIn('indexes', f)
+            self.assertEqual(len(reopened.indexes), 0)
+            self.assertEqual(len(reopened.select(num_edges=(20, 400))), len(expected) + np.sum(expected < 3))
+        with h5py.File(self.path, 'r') as f:
+            read_only = HDFGraphList(f)
+            with self.assertRaises(ValueError):
+                read_only.build_index('num_nodes', persist=True)
+            self.assertNotIn('num_nodes', read_only.indexes)
+            read_only.build_index('num_nodes')
+            self.assertNotIn('indexes', f)
+            self.assertTrue(np.all(read_only.select(num_nodes=(None, 50)) == np.flatnonzero(read_only.num_nodes < 50)))
+
+    def test_from_nx_graphs(self):
+        nx_graphs = test_graphlist.TestGraphList.generate_random_graphs(15)
+        kwargs = dict(node_attribute_names=['node_attribute1'],
+                      edge_attribute_names=['edge_attribute1'],
+                      graph_attribute_names=['graph_attribute'])
+        graphs = GraphList.from_nx_graphs(nx_graphs, **kwargs)
+        for num_workers in [0, 2]:
+            with h5py.File(self.path, 'w') as f:
+                hdf_graphs = HDFGraphList.from_nx_graphs(f, nx_graphs, batch_size=4, num_workers=num_workers, **kwargs)
+                self.assertGraphListEqual(hdf_graphs, graphs)
+
+    def test_from_tables(self):
+        # Graph 2 has nodes, but no edges.
+        num_nodes, num_edges = np.array([3, 2, 4, 1, 5]), np.array([4, 1, 0, 2, 6])
+        rng = np.random.default_rng(0)
+        edge_indices = np.concatenate([rng.integers(0, n, (m, 2)) for n, m in zip(num_nodes, num_edges)])
+        graph_ids = np.arange(len(num_nodes))
+        nodes = {'graph_id': np.repeat(graph_ids, num_nodes), 'x': rng.random(num_nodes.sum())}
+        edges = {'graph_id': np.repeat(graph_ids, num_edges), 'source': edge_indices[:, 0],
+                 'target': edge_indices[:, 1], 'weight': rng.random(num_edges.sum())}
+        expected = GraphList(num_nodes, num_edges, edge_indices, {'x': nodes['x']}, {'weight': edges['weight']}, {})
+
+        edges_csv, nodes_csv = os.path.join(self.tmp_dir.name, 'edges.csv'), os.path.join(self.tmp_dir.name, 'nodes.csv')
+        np.savetxt(edges_csv, np.stack(list(edges.values()), axis=1), delimiter=',', header='graph_id,source,target,weight',
+                   comments='', fmt=['%d', '%d', '%d', '%.17g'])
+        np.savetxt(nodes_csv, np.stack(list(nodes.values()), axis=1), delimiter=',', header='graph_id,x',
+                   comments='', fmt=['%d', '%.17g'])
+        edges_npy = os.path.join(self.tmp_dir.name, 'edges.npy')
+        np.save(edges_npy, np.rec.fromarrays(list(edges.values()), names=list(edges.keys())))
+        nodes_npz = os.path.join(self.tmp_dir.name, 'nodes.npz')
+        np.savez(nodes_npz, **nodes)
+        for edge_table, node_table in [(edges_csv, nodes_csv), (edges_npy, nodes_npz), (edges, nodes)]:
+            for chunk_rows in [1, 3, 100]:
+                with h5py.File(self.path, 'w') as f:
+                    hdf_graphs = HDFGraphList.from_tables(f, edge_table, node_table, chunk_rows=chunk_rows)
+                    self.assertGraphListEqual(hdf_graphs, expected)
+
+        large_ids = os.path.join(self.tmp_dir.name, 'large_ids.csv')
+        with open(large_ids, 'w') as f:
+            f.write('graph_id,x\n9007199254740993,0.5\n9007199254740995,1.5\n')
+        chunk = next(read_table(large_ids, dtypes={'graph_id': np.int64}))
+        self.assertEqual(chunk['graph_id'].tolist(), [2**53 + 1, 2**53 + 3])
+        self.assertEqual(chunk['x'].tolist(), [0.5, 1.5])
+        with open(large_ids, 'a') as f:
+            f.write('1,2,3\n')
+        with self.assertRaises(ValueError):
+            next(read_table(large_ids))
+
+        global_edges = dict(edges, source=edges['source'] + np.repeat(expected.node_starts, num_edges),
+                            target=edges['target'] + np.repeat(expected.node_starts, num_edges))
+        with h5py.File(self.path, 'w') as f:
+            hdf_graphs = HDFGraphList.from_tables(f, global_edges, nodes, global_indices=True, chunk_rows=2)
+            self.assertGraphListEqual(hdf_graphs, expected)
+
+        # Without a node table the number of nodes is the largest node index plus one.
+        with h5py.File(self.path, 'w') as f:
+            hdf_graphs = HDFGraphList.from_tables(f, edges, edge_attribute_names=[], chunk_rows=2)
+            self.assertTrue(np.all(hdf_graphs.num_edges[:] == num_edges[num_edges > 0]))
+            self.assertTrue(np.all(hdf_graphs.edge_indices[:] == edge_indices))
+
+        with h5py.File(self.path, 'w') as f:
+            with self.assertRaises(ValueError):
+                HDFGraphList.from_tables(f, dict(edges, graph_id=edges['graph_id'][::-1]), nodes, chunk_rows=4)
+            with self.assertRaises(ValueError):
+                HDFGraphList.from_tables(f, edges, dict(nodes, graph_id=nodes['graph_id'] + 1))
+
+    def test_loader(self):
+        with h5py.File(self.path, 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            batches = list(hdf_graphs.loader(max_graphs=3, seed=1))
+            indices = np.concatenate(hdf_graphs.loader(max_graphs=3, seed=1).plan())
+            self.assertGraphListEqual(GraphList.concatenate(batches), self.graphs[indices])
+
+
+if __name__ == '__main__':
+    unittest.main()
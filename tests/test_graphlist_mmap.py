@@ -0,0 +1,75 @@
+import os
+import pickle
+import unittest
+import h5py
+import numpy as np
+from graphlist import GraphList, HDFGraphList, MMapGraphList
+from graphlist_testcase import GraphListTestCase
+
+
+class TestMMapGraphList(GraphListTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp_dir.name, 'graphs')
+
+    def test_write_append_read(self):
+        mmap_graphs = MMapGraphList.from_graphlist(self.path, self.graphs[:12])
+        mmap_graphs.append_graphlist(self.graphs[12:])
+        for graphs in [mmap_graphs, MMapGraphList(self.path), pickle.loads(pickle.dumps(mmap_graphs))]:
+            self.assertGraphListEqual(graphs, self.graphs)
+            self.assertGraphListEqual(graphs[[3, 17, 3]], self.graphs[[3, 17, 3]])
+            self.assertTrue(isinstance(graphs[5:9].node_attributes['attribute'], np.memmap))
+        with self.assertRaises(ValueError):
+            MMapGraphList(self.path).append_graphlist(self.graphs)
+
+    def test_compact(self):
+        large = GraphList(np.array([300]), np.array([1]), np.array([[299, 0]]), {}, {}, {})
+        small = GraphList(np.array([3, 2]), np.array([2, 1]), np.array([[0, 2], [1, 0], [1, 1]]), {}, {}, {})
+        mmap_graphs = MMapGraphList.from_graphlist(self.path, small.compact())
+        mmap_graphs.append_graphlist(small.widen(np.uint16))
+        self.assertEqual(mmap_graphs.edge_indices.dtype, np.uint8)
+        self.assertEqual(mmap_graphs.num_nodes.dtype, np.uint8)
+        mmap_graphs.append_graphlist(large)
+        self.assertEqual(mmap_graphs.edge_indices.dtype, np.uint16)
+        self.assertEqual(mmap_graphs.num_nodes.dtype, np.uint16)
+        self.assertEqual(mmap_graphs.num_edges.dtype, np.uint8)
+        expected = GraphList.concatenate([small, small, large])
+        for graphs in [mmap_graphs, MMapGraphList(self.path)]:
+            self.assertGraphListEqual(graphs, expected)
+        self.assertEqual(len(os.listdir(self.path)), 4)
+
+    def test_append_select(self):
+        mmap_graphs = MMapGraphList.from_graphlist(self.path, self.graphs[:12])
+        mmap_graphs.build_index('num_nodes')
+        mmap_graphs.append_graphlist(self.graphs[12:])
+        np.testing.assert_array_equal(mmap_graphs.select(num_nodes=(None, 10)),
+                                      self.graphs.select(num_nodes=(None, 10)))
+
+    def test_append_csr(self):
+        mmap_graphs = MMapGraphList.from_graphlist(self.path, self.graphs[:12])
+        mmap_graphs.csr, mmap_graphs.csc
+        mmap_graphs.append_graphlist(self.graphs[12:])
+        for name in ['csr', 'csc']:
+            for first, second in zip(getattr(mmap_graphs, name), getattr(self.graphs, name)):
+                np.testing.assert_array_equal(first, second)
+        np.testing.assert_array_equal(mmap_graphs.neighbors(15, 0), self.graphs.neighbors(15, 0))
+
+    def test_from_hdf(self):
+        with h5py.File(os.path.join(self.tmp_dir.name, 'graphs.h5'), 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            mmap_graphs = MMapGraphList.from_hdf(self.path, hdf_graphs, batch_size=7)
+        self.assertGraphListEqual(mmap_graphs, self.graphs)
+
+    def test_from_empty_hdf(self):
+        with h5py.File(os.path.join(self.tmp_dir.name, 'graphs.h5'), 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs._get_subslice([]))
+            mmap_graphs = MMapGraphList.from_hdf(self.path, hdf_graphs, batch_size=7)
+        self.assertEqual(len(mmap_graphs), 0)
+        self.assertGraphListEqual(mmap_graphs, self.graphs._get_subslice([]))
+        mmap_graphs.append_graphlist(self.graphs)
+        self.assertGraphListEqual(mmap_graphs, self.graphs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import unittest
+import h5py
+import numpy as np
+from graphlist import GraphList, HDFGraphList, ShardedGraphList
+from graphlist_testcase import GraphListTestCase
+
+
+class TestShardedGraphList(GraphListTestCase):
+
+    num_graphs = 30
+
+    def setUp(self):
+        super().setUp()
+        self.paths = [os.path.join(self.tmp_dir.name, f'shard_{i}.h5') for i in range(4)]
+
+    def test_indexing(self):
+        for num_workers in [0, 2]:
+            with ShardedGraphList.from_graphlist(self.paths, self.graphs, num_workers=num_workers) as sharded:
+                self.assertEqual(len(sharded), len(self.graphs))
+                self.assertEqual(len(sharded.shards), 4)
+                sizes = [shard.num_nodes.sum() + shard.num_edges.sum() for shard in sharded.shards]
+                self.assertEqual(sum(sizes), self.graphs.num_nodes.sum() + self.graphs.num_edges.sum())
+                for index in [0, 7, 29, -1]:
+                    self.assertGraphListEqual(sharded[index], self.graphs[index])
+                for index in [slice(0, 30), slice(5, 23), slice(3, 28, 4)]:
+                    self.assertGraphListEqual(sharded[index], self.graphs[index])
+                for index in [[29, 0, 15, 3, 3], [1, 2, 3], np.arange(30)[::-1]]:
+                    self.assertGraphListEqual(sharded[index], self.graphs[index])
+                self.assertGraphListEqual(GraphList.concatenate(list(sharded.loader(max_graphs=7, shuffle=False))),
+                                          self.graphs)
+
+    def test_empty_shards(self):
+        paths = [os.path.join(self.tmp_dir.name, f'small_{i}.h5') for i in range(6)]
+        graphs = self.graphs[:4]
+        with ShardedGraphList.from_graphlist(paths, graphs) as sharded:
+            self.assertIn(0, [len(shard) for shard in sharded.shards])
+            for index in [slice(0, 4), slice(1, 4), slice(0, 1), [3, -4, 1], -1]:
+                self.assertGraphListEqual(sharded[index], graphs[index])
+            self.assertEqual(len(list(sharded)), 4)
+            self.assertGraphListEqual(sharded.copy(), graphs)
+            self.assertTrue(np.all(sharded.select(num_nodes=(10, None)) == graphs.select(num_nodes=(10, None))))
+            with self.assertRaises(TypeError):
+                sharded.csr
+            with self.assertRaises(TypeError):
+                GraphList.concatenate([sharded, graphs])
+            with self.assertRaises(ValueError):
+                sharded.segment_sum('attribute', out_name='total')
+
+    def test_open(self):
+        for i, path in enumerate(self.paths[:2]):
+            with h5py.File(path, 'w') as f:
+                HDFGraphList.from_graphlist(f, self.graphs[i * 15 : (i + 1) * 15])
+        with ShardedGraphList.open(self.paths[:2], cache_bytes=2**20) as sharded:
+            self.assertTrue(np.all(sharded.shard_offsets == [0, 15, 30]))
+            self.assertEqual([shard.cache.max_bytes for shard in sharded.shards], [2**19, 2**19])
+            shard_ids, local = sharded.locate([0, 14, 15, 29])
+            self.assertTrue(np.all(shard_ids == [0, 0, 1, 1]))
+            self.assertTrue(np.all(local == [0, 14, 0, 14]))
+            self.assertGraphListEqual(sharded[[16, 2]], self.graphs[[16, 2]])
+
+    def test_partition(self):
+        world_size = 4
+        partitions = [self.graphs.partition(rank, world_size, seed=1) for rank in range(world_size)]
+        self.assertTrue(np.all(np.sort(np.concatenate(partitions)) == np.arange(len(self.graphs))))
+        self.assertTrue(np.all(partitions[2] == self.graphs.partition(2, world_size, seed=1)))
+        sizes = self.graphs.num_nodes + self.graphs.num_edges
+        totals = [sizes[partition].sum() for partition in partitions]
+        self.assertLessEqual(max(totals) - min(totals), 2 * sizes.max())
+        self.assertLessEqual(max(map(len, partitions)) - min(map(len, partitions)), 1)
+        dropped = [self.graphs.partition(rank, world_size, drop_last=True) for rank in range(world_size)]
+        self.assertEqual(set(map(len, dropped)), {len(self.graphs) // world_size})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import multiprocessing
+import pickle
+import unittest
+import numpy as np
+from graphlist import GraphList, SharedGraphList
+from graphlist_testcase import GraphListTestCase
+
+
+def _checksum(graphs):
+    return (len(graphs), float(graphs.node_attributes['node_attribute1'].sum()),
+            int(graphs.edge_indices.sum()), graphs.edge_indices.flags.owndata)
+
+
+class TestSharedGraphList(GraphListTestCase):
+
+    strict = True
+
+    def test_shared_memory(self):
+        shared = self.graphs.to_shared_memory()
+        self.assertIsInstance(shared, SharedGraphList)
+        self.assertGraphListEqual(shared, self.graphs)
+        self.assertLess(len(pickle.dumps(shared)), 2048)
+
+        attached = pickle.loads(pickle.dumps(shared))
+        self.assertGraphListEqual(attached, self.graphs)
+        attached.node_attributes['attribute'][0] = -1
+        self.assertEqual(shared.node_attributes['attribute'][0], -1)
+        self.assertGraphListEqual(GraphList.from_shared_memory(shared.handle), shared)
+        with self.assertRaises(ValueError):
+            attached.unlink()
+
+        view = shared[2:5]
+        shared.unlink()
+        with self.assertRaises(FileNotFoundError):
+            SharedGraphList(shared.handle)
+        # Arrays stay valid until they are released.
+        self.assertGraphListEqual(view, attached[2:5])
+
+    def test_workers(self):
+        shared = self.graphs.to_shared_memory()
+        expected = _checksum(self.graphs)[:3]
+        for method in ['fork', 'spawn']:
+            with multiprocessing.get_context(method).Pool(2) as pool:
+                results = pool.map(_checksum, [shared] * 4)
+            for result in results:
+                self.assertEqual(result[:3], expected)
+                self.assertFalse(result[3])
+        # Workers exiting must not remove the segment.
+        self.assertGraphListEqual(SharedGraphList(shared.handle), self.graphs)
+
+    def test_empty_attributes(self):
+        graphs = GraphList(np.array([0, 0]), np.array([0, 0]), np.zeros((0, 2), dtype=np.int64),
+                           {'x': np.zeros((0, 3))}, {}, {'y': np.arange(2)})
+        shared = graphs.to_shared_memory()
+        self.assertGraphListEqual(pickle.loads(pickle.dumps(shared)), graphs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import unittest
+import h5py
+from graphlist import HDFGraphList, instrumentation
+from graphlist_testcase import GraphListTestCase
+
+
+class TestInstrumentation(GraphListTestCase):
+
+    node_attribute_names = ['node_attribute1']
+
+    def setUp(self):
+        super().setUp()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+        super().tearDown()
+
+    def test_disabled(self):
+        self.graphs[[1, 2, 3]]
+        self.assertEqual(instrumentation.stats(), {'operations': {}, 'reads': {}})
+
+    def test_operations(self):
+        events = []
+        hook = lambda kind, name, values: events.append((kind, name, values))
+        instrumentation.add_hook(hook)
+        instrumentation.enable()
+        batch = self.graphs[[1, 2, 3]]
+        self.graphs[4]
+        instrumentation.remove_hook(hook)
+        self.graphs[5]
+
+        operations = instrumentation.stats()['operations']
+        subslice = operations['GraphList._get_subslice']
+        self.assertEqual(subslice['calls'], 1)
+        self.assertEqual(subslice['graphs'], 3)
+        self.assertEqual(subslice['rows'], 3 + batch.num_nodes.sum() + batch.num_edges.sum())
+        self.assertEqual(subslice['bytes'], sum(a.nbytes for a in [
+            batch.num_nodes, batch.num_edges, batch.edge_indices, batch.node_attributes['node_attribute1'],
+            batch.edge_attributes['edge_attribute1'], batch.graph_attributes['graph_attribute']]))
+        # Ranges of in-memory GraphLists are views, nothing is copied.
+        self.assertEqual(operations['GraphList._get_range']['calls'], 2)
+        self.assertEqual(operations['GraphList._get_range']['bytes'], 0)
+        self.assertEqual([name for _, name, _ in events], ['GraphList._get_subslice', 'GraphList._get_range'])
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.stats()['operations'], {})
+
+    def test_hdf_reads(self):
+        with h5py.File(os.path.join(self.tmp_dir.name, 'graphs.h5'), 'a') as f:
+            hdf_graphs = HDFGraphList.from_graphlist(f, self.graphs)
+            instrumentation.enable()
+            hdf_graphs[2:5]
+            reads = instrumentation.stats()['reads']
+            self.assertEqual(reads['/edge_indices']['reads'], 1)
+            self.assertEqual(reads['/edge_indices']['rows'], self.graphs.num_edges[2:5].sum())
+            self.assertEqual(reads['/node_attributes/node_attribute1']['bytes'],
+                             self.graphs[2:5].node_attributes['node_attribute1'].nbytes)
+
+            cached = HDFGraphList(f, cache_bytes=2**24)
+            cached[2:5]
+            reads = instrumentation.stats()['reads']['/edge_indices']['reads']
+            cached[2:5]
+            self.assertEqual(instrumentation.stats()['reads']['/edge_indices']['reads'], reads)
+
+    def test_hdf_full_reads(self):
+        with h5py.File(os.path.join(self.tmp_dir.name, 'graphs.h5'), 'a') as f:
+            graphs = self.graphs.copy()
+            graphs.graph_attributes['label'] = graphs.graph_attributes.pop('graph_attribute')[:, 0]
+            graphs.graph_attribute_names = ['label']
+            hdf_graphs = HDFGraphList.from_graphlist(f, graphs)
+            hdf_graphs.write_csr()
+            hdf_graphs.build_index('num_edges')
+            hdf_graphs = HDFGraphList(f)
+            instrumentation.enable()
+            hdf_graphs.load_counts()
+            hdf_graphs.select(label=(None, 0.5))
+            hdf_graphs.select(num_edges=(2, 5))
+            hdf_graphs.csr
+            reads = instrumentation.stats()['reads']
+            for name in ['/num_nodes', '/num_edges', '/node_starts', '/edge_starts']:
+                self.assertEqual(reads[name]['rows'], len(self.graphs))
+            self.assertEqual(reads['/graph_attributes/label']['rows'], len(self.graphs))
+            self.assertEqual(reads['/csr/indptr']['rows'], self.graphs.num_nodes.sum() + 1)
+            self.assertGreater(reads['/indexes/num_edges/values']['reads'], 0)
+            self.assertEqual(reads['/indexes/num_edges/order']['reads'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()